@@ -0,0 +1,78 @@
+"""add lower(category_name) unique indexes
+
+Revision ID: 5e2a9c41d7b3
+Revises: db878de50890
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a9c41d7b3"
+down_revision: Union[str, None] = "db878de50890"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# categories table: its transactions table
+TABLES = {
+    "users_spending_categories": "spendings",
+    "users_income_categories": "income",
+}
+
+
+def merge_case_duplicates(categories_table: str, transactions_table: str) -> None:
+    """
+    Categories were compared with ILIKE, but stored as typed, so a user
+    may have names that differ only in case. Keeps the oldest one and
+    moves the transactions of the others to it.
+    """
+    duplicates = f"""
+        SELECT id, min(id) OVER (
+            PARTITION BY user_id, lower(category_name)
+        ) AS keep_id
+        FROM {categories_table}
+    """
+    op.execute(
+        f"""
+        UPDATE {transactions_table} AS t
+        SET category_id = d.keep_id
+        FROM ({duplicates}) AS d
+        WHERE t.category_id = d.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM {categories_table} AS c
+        USING ({duplicates}) AS d
+        WHERE c.id = d.id AND d.id <> d.keep_id
+        """
+    )
+
+
+def upgrade() -> None:
+    for categories_table, transactions_table in TABLES.items():
+        merge_case_duplicates(categories_table, transactions_table)
+    op.create_index(
+        "uq_user_category_lower",
+        "users_spending_categories",
+        ["user_id", sa.text("lower(category_name)")],
+        unique=True,
+    )
+    op.create_index(
+        "uq_user_income_category_lower",
+        "users_income_categories",
+        ["user_id", sa.text("lower(category_name)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "uq_user_income_category_lower", table_name="users_income_categories"
+    )
+    op.drop_index("uq_user_category_lower", table_name="users_spending_categories")
@@ -0,0 +1,133 @@
+"""partition spendings and income
+
+Revision ID: 0e9808b63670
+Revises: 5e2a9c41d7b3
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.db.partitions import (
+    get_initial_partitions_ddl,
+    get_partition_by,
+    get_partition_key,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0e9808b63670"
+down_revision: Union[str, None] = "5e2a9c41d7b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# transactions table: its categories table
+TABLES = {
+    "spendings": "users_spending_categories",
+    "income": "users_income_categories",
+}
+COLUMNS = "id, category_id, amount, description, date, user_id"
+
+
+def create_transactions_table(
+    table: str,
+    categories_table: str,
+    primary_key: list[str],
+    **kw,
+) -> None:
+    op.create_table(
+        table,
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text(f"nextval('{table}_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("description", sa.String(length=100), nullable=True),
+        sa.Column(
+            "date",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE ('utc', now())"),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            [f"{categories_table}.id"],
+            name=op.f(f"fk_{table}_category_id_{categories_table}"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f(f"fk_{table}_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name=op.f(f"pk_{table}")),
+        **kw,
+    )
+
+
+def replace_table(table: str, categories_table: str, partitioned: bool) -> None:
+    """
+    Postgres can't partition or unpartition a table in place: the old table
+    is renamed, the new one is created and filled from it, and the id
+    sequence is handed over before the old table is dropped.
+    """
+    old_table = f"{table}_old"
+    op.rename_table(table, old_table)
+    op.execute(
+        f"ALTER TABLE {old_table} RENAME CONSTRAINT pk_{table} TO pk_{old_table}"
+    )
+
+    if partitioned:
+        scheme = settings.db.partitioning
+        create_transactions_table(
+            table,
+            categories_table,
+            ["id", get_partition_key(scheme)],
+            postgresql_partition_by=get_partition_by(scheme),
+        )
+        first_date = (
+            op.get_bind()
+            .execute(sa.text(f"SELECT min(date) FROM {old_table}"))
+            .scalar()
+        )
+        for statement in get_initial_partitions_ddl(
+            table,
+            scheme,
+            date.today(),
+            first_date,
+        ):
+            op.execute(statement)
+    else:
+        create_transactions_table(table, categories_table, ["id"])
+
+    op.execute(
+        f"INSERT INTO {table} ({COLUMNS}) SELECT {COLUMNS} FROM {old_table}"
+    )
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.drop_table(old_table)
+
+
+def upgrade() -> None:
+    for table, categories_table in TABLES.items():
+        replace_table(table, categories_table, partitioned=True)
+        op.create_index(
+            f"ix_{table}_user_id_date",
+            table,
+            ["user_id", "date"],
+        )
+
+
+def downgrade() -> None:
+    # Partitions detached by the maintenance command are left as they are.
+    for table, categories_table in TABLES.items():
+        op.drop_index(f"ix_{table}_user_id_date", table_name=table)
+        replace_table(table, categories_table, partitioned=False)
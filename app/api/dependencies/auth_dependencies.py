@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
 from app.api.exceptions.auth_exceptions import (
+    AuthServiceOverloadedError,
     InvalidCredentialsError,
     InvalidTokenHTTPError,
     TokenNotFoundError,
@@ -11,10 +12,11 @@ from app.api.exceptions.auth_exceptions import (
     UserNotFoundError,
 )
 from app.db import get_db_session
+from app.exceptions.auth_exceptions import PasswordHashingOverloaded
 from app.models import UserModel
 from app.services.auth_service import (
     decode_access_token,
-    verify_password,
+    verify_password_async,
 )
 from app.services.user_service import get_user_by_username
 
@@ -27,7 +29,11 @@ async def validate_credentials(
     user = await get_user_by_username(username, db_session)
     if not user:
         raise InvalidCredentialsError()
-    if not verify_password(password, user.password):
+    try:
+        password_is_valid = await verify_password_async(password, user.password)
+    except PasswordHashingOverloaded:
+        raise AuthServiceOverloadedError()
+    if not password_is_valid:
         raise InvalidCredentialsError()
     return user
 
@@ -0,0 +1,50 @@
+from fastapi import Query, Request
+
+from app.schemas.charts_schemas import (
+    CHART_MEDIA_TYPES,
+    ChartFormat,
+    SChartRenderParams,
+)
+
+
+def get_chart_render_params(
+    request: Request,
+    format: ChartFormat | None = Query(
+        None,
+        description="Image format, negotiated via the Accept header if omitted",
+    ),
+    dpi: int | None = Query(None, ge=30, le=600, description="Image resolution"),
+) -> SChartRenderParams:
+    return SChartRenderParams(
+        format=format or negotiate_chart_format(request.headers.get("accept")),
+        dpi=dpi,
+    )
+
+
+def negotiate_chart_format(accept: str | None) -> ChartFormat:
+    """
+    Picks the chart format the client prefers most by the Accept header.
+    Falls back to PNG for wildcards and anything we don't render.
+    """
+    formats_by_media_type = {
+        media_type: chart_format
+        for chart_format, media_type in CHART_MEDIA_TYPES.items()
+    }
+    best_format: ChartFormat = "png"
+    best_quality = 0.0
+    for media_range in (accept or "").split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        chart_format = formats_by_media_type.get(media_type.lower())
+        if chart_format is None:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > best_quality:
+            best_format, best_quality = chart_format, quality
+    return best_format
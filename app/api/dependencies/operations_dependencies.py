@@ -1,8 +1,17 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from fastapi import Query
 
-from app.api.exceptions.operations_exceptions import CategoryInfoError
+from app.api.exceptions.operations_exceptions import (
+    BucketDaysError,
+    CategoryInfoError,
+    InvalidDataRangeError,
+    RollingWindowsError,
+    TooManyBucketsError,
+    TooManyRollingDaysError,
+    TooManyTrendYearsError,
+)
+from app.core.config import settings
 from app.schemas.common_schemas import (
     SAmountRange,
     SDatetimeRange,
@@ -10,7 +19,12 @@ from app.schemas.common_schemas import (
 )
 from app.schemas.transaction_category_schemas import SCategoryQueryParams
 from app.schemas.transactions_schemas import (
+    BucketGranularity,
+    SBucketsParams,
+    SRollingParams,
+    SStatsParams,
     STransactionsSortParams,
+    STrendParams,
 )
 
 
@@ -82,3 +96,87 @@ def get_amount_range(
     max_amount: int | None = Query(None, description="Value included"),
 ) -> SAmountRange:
     return SAmountRange(min_amount=min_amount, max_amount=max_amount)
+
+
+def get_buckets_params(
+    granularity: BucketGranularity = Query("month", description="Bucket size"),
+    date_from: date = Query(..., description="Date included"),
+    date_to: date = Query(..., description="Date included"),
+    bucket_days: int | None = Query(
+        None, ge=1, description="Days in a bucket of the custom granularity"
+    ),
+    split_by_category: bool = Query(False),
+) -> SBucketsParams:
+    if date_from > date_to:
+        raise InvalidDataRangeError()
+    if (granularity == "custom") != (bucket_days is not None):
+        raise BucketDaysError()
+
+    params = SBucketsParams(
+        granularity=granularity,
+        date_from=date_from,
+        date_to=date_to,
+        bucket_days=bucket_days,
+        split_by_category=split_by_category,
+    )
+    if params.estimate_buckets_count() > settings.app.summary_max_buckets:
+        raise TooManyBucketsError(settings.app.summary_max_buckets)
+    return params
+
+
+def get_trend_params(
+    year_from: int = Query(..., ge=1900, description="Year included"),
+    year_to: int = Query(..., le=9998, description="Year included"),
+) -> STrendParams:
+    if year_from > year_to:
+        raise InvalidDataRangeError()
+    if year_to - year_from + 1 > settings.app.trend_max_years:
+        raise TooManyTrendYearsError(settings.app.trend_max_years)
+    return STrendParams(year_from=year_from, year_to=year_to)
+
+
+def get_rolling_params(
+    date_from: date = Query(..., description="Date included"),
+    date_to: date = Query(..., description="Date included"),
+    windows: list[int] = Query(
+        [7, 30, 90],
+        description="Days in each moving average",
+    ),
+    split_by_category: bool = Query(False),
+) -> SRollingParams:
+    if date_from > date_to:
+        raise InvalidDataRangeError()
+    if (date_to - date_from).days + 1 > settings.app.rolling_max_days:
+        raise TooManyRollingDaysError(settings.app.rolling_max_days)
+    max_window_days = settings.app.rolling_max_window_days
+    if not 1 <= len(windows) <= 5 or not all(
+        1 <= days <= max_window_days for days in windows
+    ):
+        raise RollingWindowsError(max_window_days)
+    return SRollingParams(
+        date_from=date_from,
+        date_to=date_to,
+        windows=sorted(set(windows)),
+        split_by_category=split_by_category,
+    )
+
+
+def get_stats_params(
+    date_from: date = Query(..., description="Date included"),
+    date_to: date = Query(..., description="Date included"),
+    bins: int = Query(10, ge=1, le=50, description="Histogram bins"),
+    sample_percent: float | None = Query(
+        None,
+        gt=0,
+        le=100,
+        description="Approximate the stats from a sample of the table",
+    ),
+) -> SStatsParams:
+    if date_from > date_to:
+        raise InvalidDataRangeError()
+    return SStatsParams(
+        date_from=date_from,
+        date_to=date_to,
+        bins=bins,
+        sample_percent=sample_percent,
+    )
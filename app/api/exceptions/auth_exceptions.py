@@ -64,3 +64,12 @@ class InvalidUsernameError(HTTPException):
             detail="The username must be 3-24 characters long and consist of "
                    "a-Z letters, numbers, and an underscore.",
         )
+
+
+class AuthServiceOverloadedError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication attempts, please try again later.",
+            headers={"Retry-After": "5"},
+        )
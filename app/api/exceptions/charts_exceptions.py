@@ -0,0 +1,17 @@
+from fastapi import HTTPException, status
+
+
+class ChartJobNotFoundError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chart job not found or its result has expired.",
+        )
+
+
+class ChartJobFailedError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="The chart could not be rendered.",
+        )
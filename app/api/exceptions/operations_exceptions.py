@@ -58,6 +58,47 @@ class InvalidDataRangeError(HTTPException):
         )
 
 
+class BucketDaysError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bucket_days must be set for the custom granularity only.",
+        )
+
+
+class TooManyBucketsError(HTTPException):
+    def __init__(self, max_buckets: int):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The summary can't have more than {max_buckets} buckets, "
+                   "narrow the date range or pick a coarser granularity.",
+        )
+
+
+class TooManyTrendYearsError(HTTPException):
+    def __init__(self, max_years: int):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The trend can't span more than {max_years} years.",
+        )
+
+
+class TooManyRollingDaysError(HTTPException):
+    def __init__(self, max_days: int):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The rolling summary can't span more than {max_days} days.",
+        )
+
+
+class RollingWindowsError(HTTPException):
+    def __init__(self, max_window_days: int):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pick 1 to 5 windows, each of 1 to {max_window_days} days.",
+        )
+
+
 class CategoryInfoError(HTTPException):
     def __init__(self):
         super().__init__(
@@ -2,6 +2,9 @@ from fastapi import APIRouter
 
 from .routes import (
     authentication_router,
+    balance_router,
+    charts_router,
+    diagnostics_router,
     income_router,
     saving_goals_router,
     spendings_router,
@@ -24,3 +27,15 @@ router_v1.include_router(
     saving_goals_router,
     tags=["Saving Goals"],
 )
+router_v1.include_router(
+    balance_router,
+    tags=["Balance"],
+)
+router_v1.include_router(
+    charts_router,
+    tags=["Charts"],
+)
+router_v1.include_router(
+    diagnostics_router,
+    tags=["Diagnostics"],
+)
@@ -1,4 +1,7 @@
 from .auth_routes import router as authentication_router
+from .balance_routes import router as balance_router
+from .charts_routes import router as charts_router
+from .diagnostics_routes import router as diagnostics_router
 from .income_routes import router as income_router
 from .saving_goals_routes import router as saving_goals_router
 from .spendings_routes import router as spendings_router
@@ -8,4 +11,7 @@ __all__ = [
     "spendings_router",
     "income_router",
     "saving_goals_router",
+    "charts_router",
+    "balance_router",
+    "diagnostics_router",
 ]
@@ -11,11 +11,13 @@ from app.api.dependencies.auth_dependencies import (
     validate_credentials,
 )
 from app.api.exceptions.auth_exceptions import (
+    AuthServiceOverloadedError,
     EmailAlreadyExistsError,
     InvalidUsernameError,
     UsernameAlreadyExistsError,
 )
 from app.db import get_db_session
+from app.exceptions.auth_exceptions import PasswordHashingOverloaded
 from app.exceptions.user_exceptions import (
     EmailAlreadyExists,
     UsernameAlreadyExists,
@@ -24,7 +26,7 @@ from app.models import UserModel
 from app.schemas.user_schemas import SUserShortInfo, SUserSignUp
 from app.services.auth_service import (
     create_access_token,
-    hash_password,
+    hash_password_async,
     validate_username,
 )
 from app.services.user_service import create_user
@@ -41,9 +43,12 @@ async def sign_up_user(
     user: SUserSignUp,
     db_session: AsyncSession = Depends(get_db_session),
 ) -> SUserShortInfo:
-    user.password = hash_password(user.password.decode())
     if not validate_username(user.username):
         raise InvalidUsernameError()
+    try:
+        user.password = await hash_password_async(user.password.decode())
+    except PasswordHashingOverloaded:
+        raise AuthServiceOverloadedError()
     try:
         user_from_db = await create_user(user, db_session)
     except UsernameAlreadyExists:
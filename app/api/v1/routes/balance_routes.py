@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth_dependencies import get_active_verified_user
+from app.api.dependencies.charts_dependencies import get_chart_render_params
+from app.api.dependencies.common_dependenceis import get_csv_params
+from app.api.dependencies.operations_dependencies import get_date_range
+from app.db import get_read_db_session
+from app.models import UserModel
+from app.schemas.balance_schemas import BalancePeriod, SBalance
+from app.schemas.charts_schemas import SChartRenderParams
+from app.schemas.common_schemas import SDatetimeRange
+from app.services.balance_service import balance_service
+from app.services.common_service import (
+    get_filename_with_utc_datetime,
+    make_csv_from_pydantic_models,
+)
+
+router = APIRouter(prefix="/balance")
+
+
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    summary="Get income, spendings and net by period",
+    response_model=None,
+)
+async def balance_get(
+    period: BalancePeriod = Query("month", description="Grouping period"),
+    datetime_range: SDatetimeRange = Depends(get_date_range),
+    in_csv: bool = Depends(get_csv_params),
+    user: UserModel = Depends(get_active_verified_user),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> list[SBalance] | Response:
+    balance = await balance_service.get_balance(
+        session=db_session,
+        user_id=user.id,
+        period=period,
+        datetime_range=datetime_range,
+    )
+    if in_csv:
+        output_csv = make_csv_from_pydantic_models(balance)
+        filename = get_filename_with_utc_datetime(f"{period}_balance", "csv")
+        return Response(
+            content=output_csv,
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+            },
+        )
+    return balance
+
+
+@router.get(
+    "/chart/",
+    status_code=status.HTTP_200_OK,
+    summary="Get chart with income, spendings and net by period",
+)
+async def balance_chart_get(
+    period: BalancePeriod = Query("month", description="Grouping period"),
+    datetime_range: SDatetimeRange = Depends(get_date_range),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    user: UserModel = Depends(get_active_verified_user),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    chart = await balance_service.get_balance_chart(
+        session=db_session,
+        user_id=user.id,
+        period=period,
+        datetime_range=datetime_range,
+        render_params=render_params,
+    )
+    return Response(
+        content=chart,
+        media_type=render_params.media_type,
+        headers={"Vary": "Accept"},
+    )
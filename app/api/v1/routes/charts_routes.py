@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse
+
+from app.api.dependencies.auth_dependencies import get_active_verified_user
+from app.api.exceptions.charts_exceptions import (
+    ChartJobFailedError,
+    ChartJobNotFoundError,
+)
+from app.exceptions.chart_exceptions import ChartJobNotFound
+from app.models import UserModel
+from app.schemas.charts_schemas import CHART_MEDIA_TYPES, SChartJob
+from app.services.chart_jobs import chart_jobs_client
+
+router = APIRouter(prefix="/charts")
+
+
+@router.get(
+    "/jobs/{job_id}/",
+    status_code=status.HTTP_200_OK,
+    summary="Get chart job result",
+    responses={
+        200: {
+            "content": {
+                media_type: {} for media_type in CHART_MEDIA_TYPES.values()
+            }
+        },
+        202: {"model": SChartJob},
+    },
+)
+async def chart_job_get(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=30, description="Long polling, seconds"),
+    user: UserModel = Depends(get_active_verified_user),
+) -> Response:
+    try:
+        result = await chart_jobs_client.get_result(user.id, job_id, wait)
+    except ChartJobNotFound:
+        raise ChartJobNotFoundError()
+    if result.status == "failed":
+        raise ChartJobFailedError()
+    if result.status == "pending":
+        return ORJSONResponse(
+            content=SChartJob(job_id=job_id, status="pending").model_dump(),
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+    return Response(content=result.chart, media_type=result.media_type)
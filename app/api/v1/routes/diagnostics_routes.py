@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, status
+
+from app.api.dependencies.auth_dependencies import get_active_verified_user
+from app.db.dependencies import database_manager
+from app.schemas.diagnostics_schemas import SPoolStats
+
+router = APIRouter(
+    prefix="/diagnostics",
+    dependencies=[Depends(get_active_verified_user)],
+)
+
+
+@router.get(
+    "/db_pool/",
+    status_code=status.HTTP_200_OK,
+    summary="Get database connection pools stats",
+)
+async def db_pool_stats_get() -> list[SPoolStats]:
+    return [SPoolStats(**stats) for stats in database_manager.get_pool_stats()]
@@ -1,3 +1,5 @@
+from typing import cast
+
 from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,7 +20,7 @@ from app.api.exceptions.operations_exceptions import (
     GoalCurrentAmountError,
     GoalNotFoundError,
 )
-from app.db import get_db_session
+from app.db import get_db_session, get_read_db_session
 from app.exceptions.saving_goals_exceptions import (
     GoalCurrentAmountInvalid,
     GoalNotFound,
@@ -30,8 +32,10 @@ from app.schemas.saving_goals_schemas import (
     SGoalsSortParams,
     SSavingGoalCreate,
     SSavingGoalProgress,
+    SSavingGoalProgressItem,
     SSavingGoalResponse,
     SSavingGoalUpdatePartial,
+    SSavingGoalWithProgress,
 )
 from app.services.common_service import (
     apply_pagination,
@@ -56,6 +60,25 @@ async def saving_goal_set(
     return await saving_goals_service.set_goal(db_session, goal, user.id)
 
 
+@router.get(
+    "/progress/",
+    status_code=status.HTTP_200_OK,
+    summary="Get progress of all or selected saving goals",
+)
+async def saving_goals_progress_get(
+    user: UserModel = Depends(get_active_verified_user),
+    goal_id: list[int] | None = Query(None),
+    goal_status: GoalStatus | None = Query(None),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> list[SSavingGoalProgressItem]:
+    return await saving_goals_service.get_goals_progress(
+        session=db_session,
+        user_id=user.id,
+        goal_ids=goal_id,
+        status=goal_status,
+    )
+
+
 @router.get(
     "/progress/{goal_id}/",
     status_code=status.HTTP_200_OK,
@@ -84,9 +107,16 @@ async def saving_goal_progress_get(
 async def saving_goal_get(
     goal_id: int,
     user: UserModel = Depends(get_active_verified_user),
+    with_progress: bool = Query(False),
     db_session: AsyncSession = Depends(get_db_session),
-) -> SSavingGoalResponse:
+) -> SSavingGoalResponse | SSavingGoalWithProgress:
     try:
+        if with_progress:
+            return await saving_goals_service.get_goal_with_progress(
+                goal_id,
+                user.id,
+                db_session,
+            )
         return await saving_goals_service.get_goal(
             goal_id,
             user.id,
@@ -114,9 +144,11 @@ async def saving_goals_get_all(
     goal_status: GoalStatus | None = Query(None),
     pagination: SPagination = Depends(get_pagination_params),
     sort_params: SGoalsSortParams = Depends(get_goals_sort_params),
+    with_progress: bool = Query(False, description="Embed each goal's progress"),
     in_csv: bool = Depends(get_csv_params),
+    # not a replica: overdue goals are marked while they are listed
     db_session: AsyncSession = Depends(get_db_session),
-) -> list[SSavingGoalResponse] | Response:
+) -> list[SSavingGoalResponse] | list[SSavingGoalWithProgress] | Response:
     goals = await saving_goals_service.get_goals_all(
         session=db_session,
         user_id=user.id,
@@ -129,9 +161,13 @@ async def saving_goals_get_all(
         end_date_range=end_date_range,
         status=goal_status,
         sort_params=sort_params,
+        with_progress=with_progress and not in_csv,
     )
     if in_csv:
-        output_csv = make_csv_from_pydantic_models(goals)
+        # progress isn't embedded in CSV
+        output_csv = make_csv_from_pydantic_models(
+            cast(list[SSavingGoalResponse], goals)
+        )
         filename = get_filename_with_utc_datetime("saving_goals", "csv")
         return Response(
             content=output_csv,
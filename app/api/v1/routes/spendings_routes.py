@@ -1,15 +1,21 @@
 from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from app.api.dependencies.auth_dependencies import get_active_verified_user
+from app.api.dependencies.charts_dependencies import get_chart_render_params
 from app.api.dependencies.common_dependenceis import get_csv_params
 from app.api.dependencies.operations_dependencies import (
     get_amount_range,
+    get_buckets_params,
     get_categories_params,
     get_date_range,
     get_pagination_params,
+    get_rolling_params,
+    get_stats_params,
     get_transactions_sort_params,
+    get_trend_params,
 )
 from app.api.exceptions.operations_exceptions import (
     CannotDeleteDefaultCategoryError,
@@ -18,7 +24,7 @@ from app.api.exceptions.operations_exceptions import (
     CategoryNotFoundError,
     TransactionNotFoundError,
 )
-from app.db import get_db_session
+from app.db import get_db_session, get_read_db_session
 from app.exceptions.categories_exceptions import (
     CannotDeleteDefaultCategory,
     CategoryAlreadyExists,
@@ -27,6 +33,12 @@ from app.exceptions.categories_exceptions import (
 )
 from app.exceptions.transaction_exceptions import TransactionNotFound
 from app.models import UserModel
+from app.schemas.charts_schemas import (
+    SCategoriesChartData,
+    SChartJob,
+    SChartRenderParams,
+    SPeriodsChartData,
+)
 from app.schemas.common_schemas import (
     SAmountRange,
     SDatetimeRange,
@@ -40,18 +52,27 @@ from app.schemas.transaction_category_schemas import (
     TransactionsOnDeleteActions,
 )
 from app.schemas.transactions_schemas import (
+    BucketTransactionsSummary,
+    DayRollingSummary,
     DayTransactionsSummary,
     MonthTransactionsSummary,
+    SBucketsParams,
+    SRollingParams,
+    SStatsParams,
     STransactionCreate,
     STransactionResponse,
     STransactionsSortParams,
+    STransactionsStats,
     STransactionsSummary,
     STransactionUpdatePartial,
+    STrendParams,
+    YearTransactionsTrend,
 )
 from app.services import spendings_service
 from app.services.common_service import (
     apply_pagination,
     get_filename_with_utc_datetime,
+    make_csv_from_dicts,
     make_csv_from_pydantic_models,
 )
 from app.services.users_spending_categories_service import user_spend_cat_service
@@ -102,7 +123,7 @@ async def spendings_summary_get(
     amount_params: SAmountRange = Depends(get_amount_range),
     description_search_term: str | None = Query(None),
     datetime_range: SDatetimeRange = Depends(get_date_range),
-    db_session: AsyncSession = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ) -> list[STransactionsSummary]:
     try:
         spendings_summary = await spendings_service.get_summary(
@@ -130,7 +151,8 @@ async def spendings_summary_chart_get(
     amount_params: SAmountRange = Depends(get_amount_range),
     description_search_term: str | None = Query(None),
     datetime_range: SDatetimeRange = Depends(get_date_range),
-    db_session: AsyncSession = Depends(get_db_session),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ) -> Response:
     chart: bytes = await spendings_service.get_summary_chart(
         session=db_session,
@@ -140,8 +162,296 @@ async def spendings_summary_chart_get(
         amount_params=amount_params,
         search_term=description_search_term,
         datetime_range=datetime_range,
+        render_params=render_params,
+    )
+    return Response(
+        content=chart,
+        media_type=render_params.media_type,
+        headers={"Vary": "Accept"},
+    )
+
+
+@router.post(
+    "/summary/chart/jobs/",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start rendering a chart with spendings by category",
+)
+async def spendings_summary_chart_job_create(
+    user: UserModel = Depends(get_active_verified_user),
+    chart_type: str | None = Query(None),
+    categories_params: list[SCategoryQueryParams] = Depends(get_categories_params),
+    amount_params: SAmountRange = Depends(get_amount_range),
+    description_search_term: str | None = Query(None),
+    datetime_range: SDatetimeRange = Depends(get_date_range),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> SChartJob:
+    try:
+        chart = await spendings_service.prepare_summary_chart(
+            session=db_session,
+            user_id=user.id,
+            chart_type=chart_type,
+            categories_params=categories_params,
+            amount_params=amount_params,
+            search_term=description_search_term,
+            datetime_range=datetime_range,
+        )
+    except CategoryNotFound:
+        raise CategoryNotFoundError()
+    job_id = await spendings_service.submit_chart_job(
+        db_session, user.id, chart.with_render_params(render_params)
+    )
+    return SChartJob(job_id=job_id, status="pending")
+
+
+@router.get(
+    "/summary/chart_data/",
+    status_code=status.HTTP_200_OK,
+    summary="Get spendings by category as chart-ready data",
+)
+async def spendings_summary_chart_data_get(
+    user: UserModel = Depends(get_active_verified_user),
+    categories_params: list[SCategoryQueryParams] = Depends(get_categories_params),
+    amount_params: SAmountRange = Depends(get_amount_range),
+    description_search_term: str | None = Query(None),
+    datetime_range: SDatetimeRange = Depends(get_date_range),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> SCategoriesChartData:
+    try:
+        chart_data = await spendings_service.get_summary_chart_data(
+            session=db_session,
+            user_id=user.id,
+            categories_params=categories_params,
+            amount_params=amount_params,
+            search_term=description_search_term,
+            datetime_range=datetime_range,
+        )
+    except CategoryNotFound:
+        raise CategoryNotFoundError()
+    return chart_data
+
+
+@router.get(
+    "/summary/buckets/",
+    status_code=status.HTTP_200_OK,
+    summary="Get spendings summary by time buckets",
+    response_model=None,
+)
+async def spendings_buckets_summary_get(
+    user: UserModel = Depends(get_active_verified_user),
+    buckets_params: SBucketsParams = Depends(get_buckets_params),
+    in_csv: bool = Depends(get_csv_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> list[BucketTransactionsSummary] | Response:
+    summary = await spendings_service.get_buckets_summary(
+        session=db_session,
+        user_id=user.id,
+        params=buckets_params,
+    )
+    if in_csv:
+        prepared_data = spendings_service.prepare_buckets_summary_for_csv(
+            buckets_summary=summary,
+            split_by_category=buckets_params.split_by_category,
+        )
+        output_csv = make_csv_from_dicts(prepared_data)
+        filename = get_filename_with_utc_datetime(
+            f"{buckets_params.granularity}_spendings_summary", "csv"
+        )
+        return Response(
+            content=output_csv,
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+            },
+        )
+    return summary
+
+
+@router.get(
+    "/summary/buckets/chart_data/",
+    status_code=status.HTTP_200_OK,
+    summary="Get spendings summary by time buckets as chart-ready data",
+)
+async def spendings_buckets_summary_chart_data_get(
+    user: UserModel = Depends(get_active_verified_user),
+    buckets_params: SBucketsParams = Depends(get_buckets_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> SPeriodsChartData:
+    return await spendings_service.get_buckets_summary_chart_data(
+        session=db_session,
+        user_id=user.id,
+        params=buckets_params,
+    )
+
+
+@router.get(
+    "/summary/buckets/chart/",
+    status_code=status.HTTP_200_OK,
+    summary="Get spendings summary chart by time buckets",
+)
+async def spendings_buckets_summary_chart_get(
+    user: UserModel = Depends(get_active_verified_user),
+    buckets_params: SBucketsParams = Depends(get_buckets_params),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    chart: bytes = await spendings_service.get_buckets_summary_chart(
+        session=db_session,
+        user_id=user.id,
+        params=buckets_params,
+        transactions_type="spendings",
+        render_params=render_params,
+    )
+    return Response(
+        content=chart,
+        media_type=render_params.media_type,
+        headers={"Vary": "Accept"},
+    )
+
+
+@router.get(
+    "/summary/rolling/",
+    status_code=status.HTTP_200_OK,
+    summary="Get daily spendings with moving averages",
+    response_model=None,
+)
+async def spendings_rolling_summary_get(
+    user: UserModel = Depends(get_active_verified_user),
+    rolling_params: SRollingParams = Depends(get_rolling_params),
+    in_csv: bool = Depends(get_csv_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> list[DayRollingSummary] | Response:
+    summary = await spendings_service.get_rolling_summary(
+        session=db_session,
+        user_id=user.id,
+        params=rolling_params,
+    )
+    if in_csv:
+        prepared_data = spendings_service.prepare_rolling_summary_for_csv(summary)
+        output_csv = make_csv_from_dicts(prepared_data)
+        filename = get_filename_with_utc_datetime(
+            "rolling_spendings_summary", "csv"
+        )
+        return Response(
+            content=output_csv,
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+            },
+        )
+    return summary
+
+
+@router.get(
+    "/summary/stats/",
+    status_code=status.HTTP_200_OK,
+    summary="Get spendings amounts distribution by category",
+)
+async def spendings_stats_get(
+    user: UserModel = Depends(get_active_verified_user),
+    stats_params: SStatsParams = Depends(get_stats_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> STransactionsStats:
+    return await spendings_service.get_stats(
+        session=db_session,
+        user_id=user.id,
+        params=stats_params,
+    )
+
+
+@router.get(
+    "/summary/stats/chart/",
+    status_code=status.HTTP_200_OK,
+    summary="Get spendings amounts distribution box plot",
+)
+async def spendings_stats_chart_get(
+    user: UserModel = Depends(get_active_verified_user),
+    stats_params: SStatsParams = Depends(get_stats_params),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    chart: bytes = await spendings_service.get_stats_chart(
+        session=db_session,
+        user_id=user.id,
+        params=stats_params,
+        transactions_type="spendings",
+        render_params=render_params,
+    )
+    return Response(
+        content=chart,
+        media_type=render_params.media_type,
+        headers={"Vary": "Accept"},
+    )
+
+
+@router.get(
+    "/summary/trend/",
+    status_code=status.HTTP_200_OK,
+    summary="Get spendings trend over years",
+    response_model=None,
+)
+async def spendings_trend_get(
+    user: UserModel = Depends(get_active_verified_user),
+    trend_params: STrendParams = Depends(get_trend_params),
+    in_csv: bool = Depends(get_csv_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> list[YearTransactionsTrend] | Response:
+    trend = await spendings_service.get_trend(
+        session=db_session,
+        user_id=user.id,
+        params=trend_params,
+    )
+    if in_csv:
+        prepared_data = spendings_service.prepare_trend_for_csv(trend)
+        output_csv = make_csv_from_dicts(prepared_data)
+        filename = get_filename_with_utc_datetime(
+            f"{trend_params.year_from}_{trend_params.year_to}_spendings_trend",
+            "csv",
+        )
+        return Response(
+            content=output_csv,
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+            },
+        )
+    return trend
+
+
+@router.get(
+    "/summary/chart_data/{year}/",
+    status_code=status.HTTP_200_OK,
+    summary="Get annual spendings summary as chart-ready data",
+)
+async def spendings_annual_summary_chart_data_get(
+    user: UserModel = Depends(get_active_verified_user),
+    year: int = Path(),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> SPeriodsChartData:
+    return await spendings_service.get_annual_summary_chart_data(
+        session=db_session,
+        user_id=user.id,
+        year=year,
+    )
+
+
+@router.get(
+    "/summary/chart_data/{year}/{month}/",
+    status_code=status.HTTP_200_OK,
+    summary="Get monthly spendings summary as chart-ready data",
+)
+async def spendings_monthly_summary_chart_data_get(
+    user: UserModel = Depends(get_active_verified_user),
+    year: int = Path(),
+    month: int = Path(ge=1, le=12),
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> SPeriodsChartData:
+    return await spendings_service.get_monthly_summary_chart_data(
+        session=db_session,
+        user_id=user.id,
+        year=year,
+        month=month,
     )
-    return Response(content=chart, media_type="image/png")
 
 
 @router.get(
@@ -154,7 +464,7 @@ async def spendings_annual_summary_get(
     user: UserModel = Depends(get_active_verified_user),
     year: int = Path(),
     in_csv: bool = Depends(get_csv_params),
-    db_session: AsyncSession = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ) -> list[MonthTransactionsSummary] | Response:
     summary = await spendings_service.get_annual_summary(
         session=db_session,
@@ -188,7 +498,8 @@ async def spendings_annual_summary_chart_get(
     user: UserModel = Depends(get_active_verified_user),
     year: int = Path(),
     split_by_category: bool = Query(False),
-    db_session: AsyncSession = Depends(get_db_session),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ) -> Response:
     chart: bytes = await spendings_service.get_annual_summary_chart(
         session=db_session,
@@ -196,8 +507,38 @@ async def spendings_annual_summary_chart_get(
         year=year,
         transactions_type="spendings",
         split_by_category=split_by_category,
+        render_params=render_params,
+    )
+    return Response(
+        content=chart,
+        media_type=render_params.media_type,
+        headers={"Vary": "Accept"},
+    )
+
+
+@router.post(
+    "/summary/chart/{year}/jobs/",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start rendering annual spendings summary chart",
+)
+async def spendings_annual_summary_chart_job_create(
+    user: UserModel = Depends(get_active_verified_user),
+    year: int = Path(),
+    split_by_category: bool = Query(False),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> SChartJob:
+    chart = await spendings_service.prepare_annual_summary_chart(
+        session=db_session,
+        user_id=user.id,
+        year=year,
+        transactions_type="spendings",
+        split_by_category=split_by_category,
     )
-    return Response(content=chart, media_type="image/png")
+    job_id = await spendings_service.submit_chart_job(
+        db_session, user.id, chart.with_render_params(render_params)
+    )
+    return SChartJob(job_id=job_id, status="pending")
 
 
 @router.get(
@@ -211,7 +552,7 @@ async def spendings_monthly_summary_get(
     month: int = Path(ge=1, le=12),
     in_csv: bool = Depends(get_csv_params),
     user: UserModel = Depends(get_active_verified_user),
-    db_session: AsyncSession = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ) -> list[DayTransactionsSummary] | Response:
     summary = await spendings_service.get_monthly_summary(
         session=db_session,
@@ -247,7 +588,8 @@ async def spendings_monthly_summary_chart_get(
     year: int = Path(),
     month: int = Path(ge=1, le=12),
     split_by_category: bool = Query(False),
-    db_session: AsyncSession = Depends(get_db_session),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ) -> Response:
     chart: bytes = await spendings_service.get_monthly_summary_chart(
         session=db_session,
@@ -256,8 +598,40 @@ async def spendings_monthly_summary_chart_get(
         month=month,
         transactions_type="spendings",
         split_by_category=split_by_category,
+        render_params=render_params,
+    )
+    return Response(
+        content=chart,
+        media_type=render_params.media_type,
+        headers={"Vary": "Accept"},
     )
-    return Response(content=chart, media_type="image/png")
+
+
+@router.post(
+    "/summary/chart/{year}/{month}/jobs/",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start rendering monthly spendings summary chart",
+)
+async def spendings_monthly_summary_chart_job_create(
+    user: UserModel = Depends(get_active_verified_user),
+    year: int = Path(),
+    month: int = Path(ge=1, le=12),
+    split_by_category: bool = Query(False),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> SChartJob:
+    chart = await spendings_service.prepare_monthly_summary_chart(
+        session=db_session,
+        user_id=user.id,
+        year=year,
+        month=month,
+        transactions_type="spendings",
+        split_by_category=split_by_category,
+    )
+    job_id = await spendings_service.submit_chart_job(
+        db_session, user.id, chart.with_render_params(render_params)
+    )
+    return SChartJob(job_id=job_id, status="pending")
 
 
 @router.get(
@@ -333,6 +707,7 @@ async def spending_delete(
     "/",
     status_code=status.HTTP_200_OK,
     response_model=None,
+    responses={200: {"model": list[STransactionResponse]}},
 )
 async def spendings_get_all(
     user: UserModel = Depends(get_active_verified_user),
@@ -343,10 +718,10 @@ async def spendings_get_all(
     pagination: SPagination = Depends(get_pagination_params),
     sort_params: STransactionsSortParams = Depends(get_transactions_sort_params),
     in_csv: bool = Depends(get_csv_params),
-    db_session: AsyncSession = Depends(get_db_session),
-) -> list[STransactionResponse] | Response:
+    db_session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
     try:
-        spendings = await spendings_service.get_transactions(
+        spendings = await spendings_service.get_transactions_rows(
             session=db_session,
             user_id=user.id,
             categories_params=categories_params,
@@ -358,7 +733,7 @@ async def spendings_get_all(
     except CategoryNotFound:
         raise CategoryNotFoundError()
     if in_csv:
-        output_csv = make_csv_from_pydantic_models(spendings)
+        output_csv = make_csv_from_dicts(spendings)
         filename = get_filename_with_utc_datetime("spendings", "csv")
         return Response(
             content=output_csv,
@@ -368,7 +743,7 @@ async def spendings_get_all(
             },
         )
     spendings = apply_pagination(spendings, pagination)
-    return spendings
+    return ORJSONResponse(content=spendings)
 
 
 @router.post(
@@ -34,26 +34,88 @@ class DatabaseConfig(BaseModel):
     url: PostgresDsn
     echo: bool = False
     echo_pool: bool = False
+    # "queue" keeps connections open between requests, "null" opens one
+    # per checkout: for short-lived workers, or when PgBouncer pools them.
+    pool_class: Literal["queue", "null"] = "queue"
     pool_size: int = 50
     max_overflow: int = 10
+    pool_timeout: float = 30
+    # Replaces connections older than this (-1 never) and checks them
+    # on checkout, so ones closed by a pooler or a firewall aren't used.
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    # Reusing the most recent connections lets the idle ones time out.
+    pool_use_lifo: bool = False
+    # psycopg prepares a query after `prepare_threshold` executions and
+    # keeps up to `prepared_max` of them per connection. PgBouncer in
+    # transaction mode needs them off, unless it's 1.21+ with
+    # max_prepared_statements set.
+    prepared_statements: bool = True
+    prepare_threshold: int = 5
+    prepared_max: int = 100
+    # Compiled SQL statements SQLAlchemy keeps per engine.
+    query_cache_size: int = 500
+    unit_of_work: bool = True
+    # Read-only routes (listings, summaries) are served by the replicas,
+    # picked "round_robin" or by "least_connections".
+    replica_urls: list[PostgresDsn] = []
+    replica_selection: Literal["round_robin", "least_connections"] = "round_robin"
+    # A client reads from the primary for this long after its last write,
+    # so it sees its own changes despite the replication lag.
+    read_your_writes_sec: float = 5
+    # How spendings and income are partitioned: by month or year ranges
+    # of `date`, or by a hash of `user_id`. Must match the migrated schema.
+    partitioning: Literal["month", "year", "user_hash"] = "month"
+    hash_partitions: int = 16
+    # Range partitions kept ahead of the current period, and the number of
+    # past periods kept attached (None keeps all of them).
+    partitions_ahead: int = 3
+    partitions_retention: int | None = None
 
 
 class JWTAuth(BaseModel):
     certs_path: Path = get_correct_cwd() / "certs"
     private_key_path: Path = certs_path / "private_key.pem"
     public_key_path: Path = certs_path / "public_key.pem"
+    jwks_path: Path = certs_path / "jwks.json"
+    # "RS256" or "EdDSA" (Ed25519 keys), must match the key pair above.
     algorithm: str = "RS256"
+    key_id: str = "main"
     access_token_expires_sec: int = 180 * 60
+    bcrypt_rounds: int = 12
+    password_hashing_workers: int = 4
+    password_hashing_max_pending: int = 32
+    password_hashing_wait_sec: float = 5
 
 
 class AppConfig(BaseSettings):
     default_spending_category_name: str = "Other spendings"
     default_income_category_name: str = "Other income"
+    categories_cache_ttl_sec: int = 60
+    categories_cache_max_users: int = 10_000
+    # Time buckets a summary may be divided into
+    summary_max_buckets: int = 1000
+    # Years a trend may span
+    trend_max_years: int = 30
+    # Days a rolling summary may span, and its longest window
+    rolling_max_days: int = 731
+    rolling_max_window_days: int = 365
 
 
 class MessageBrokerConfig(BaseModel):
     url: str
     charts_service_queue_name: str = "charts-service-queue"
+    # Must match charts_service's setting, queue arguments can't differ
+    # between the declarations.
+    charts_queues_max_priority: int = 5
+    chart_jobs_result_ttl_sec: int = 10 * 60
+    chart_jobs_poll_interval_sec: float = 0.2
+    # Charts that aren't rendered in time fall back to their last image
+    # or a placeholder, so pages don't hang while charts_service is down.
+    charts_rpc_timeout_sec: float = 10
+    charts_breaker_failure_threshold: int = 5
+    charts_breaker_reset_timeout_sec: float = 30
+    charts_fallback_cache_size: int = 256
 
 
 class Settings(BaseSettings):
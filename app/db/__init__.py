@@ -1,6 +1,13 @@
-from .dependencies import close_db, get_db_session
+from .dependencies import (
+    close_db,
+    get_db_session,
+    get_read_db_session,
+    remember_writes,
+)
 
 __all__ = [
     "get_db_session",
+    "get_read_db_session",
+    "remember_writes",
     "close_db"
 ]
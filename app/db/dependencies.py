@@ -1,23 +1,88 @@
-from typing import AsyncGenerator
+import time
+from typing import AsyncGenerator, Awaitable, Callable
 
+from fastapi import Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.manager import DatabaseSessionManager
 
+LAST_WRITE_COOKIE = "last_write_at"
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
 database_manager = DatabaseSessionManager(
     url=str(settings.db.url),
     echo=settings.db.echo,
     echo_pool=settings.db.echo_pool,
+    pool_class=settings.db.pool_class,
     pool_size=settings.db.pool_size,
     max_overflow=settings.db.max_overflow,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    pool_use_lifo=settings.db.pool_use_lifo,
+    prepare_threshold=(
+        settings.db.prepare_threshold if settings.db.prepared_statements else None
+    ),
+    prepared_max=settings.db.prepared_max,
+    query_cache_size=settings.db.query_cache_size,
+    replica_urls=[str(url) for url in settings.db.replica_urls],
+    replica_selection=settings.db.replica_selection,
 )
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async for session in database_manager.get_session():
+    async for session in database_manager.get_session(
+        unit_of_work=settings.db.unit_of_work,
+    ):
+        yield session
+
+
+async def get_read_db_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    A session for read-only routes, served by a replica unless the client
+    has written recently (read-your-writes).
+    """
+    async for session in database_manager.get_session(
+        unit_of_work=settings.db.unit_of_work,
+        read_only=not wrote_recently(request),
+    ):
         yield session
 
 
+def wrote_recently(request: Request) -> bool:
+    try:
+        last_write_at = float(request.cookies.get(LAST_WRITE_COOKIE, 0))
+    except ValueError:
+        return False
+    return time.time() - last_write_at < settings.db.read_your_writes_sec
+
+
+async def remember_writes(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """
+    Middleware marking clients that have just changed data, so their
+    next reads go to the primary until the replicas catch up.
+    """
+    response = await call_next(request)
+    if (
+        database_manager.replica_engines
+        and request.method in WRITE_METHODS
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            str(time.time()),
+            max_age=max(1, round(settings.db.read_your_writes_sec)),
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
 async def close_db() -> None:
     await database_manager.dispose()
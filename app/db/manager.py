@@ -1,11 +1,18 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Literal, Sequence
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.db.unit_of_work import UNIT_OF_WORK_KEY
+
+ReplicaSelection = Literal["round_robin", "least_connections"]
+PoolClass = Literal["queue", "null"]
 
 
 class DatabaseSessionManager:
@@ -14,16 +21,51 @@ class DatabaseSessionManager:
         url: str,
         echo: bool = False,
         echo_pool: bool = False,
+        pool_class: PoolClass = "queue",
         pool_size: int = 5,
         max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        pool_use_lifo: bool = False,
+        prepare_threshold: int | None = 5,
+        prepared_max: int = 100,
+        query_cache_size: int = 500,
+        replica_urls: Sequence[str] = (),
+        replica_selection: ReplicaSelection = "round_robin",
     ):
-        self.engine: AsyncEngine = create_async_engine(
-            url=url,
+        engine_options: dict[str, Any] = dict(
             echo=echo,
             echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            query_cache_size=query_cache_size,
+            # None disables prepared statements
+            connect_args=dict(prepare_threshold=prepare_threshold),
         )
+        if pool_class == "null":
+            engine_options["poolclass"] = NullPool
+        else:
+            engine_options.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_use_lifo=pool_use_lifo,
+            )
+        self.prepared_max = prepared_max
+        self.engine: AsyncEngine = create_async_engine(url=url, **engine_options)
+        self.replica_engines: list[AsyncEngine] = [
+            create_async_engine(url=replica_url, **engine_options)
+            for replica_url in replica_urls
+        ]
+        self.replica_selection = replica_selection
+        self._next_replica = 0
+        # connections checked out of each replica's pool
+        self._replica_connections = [0] * len(self.replica_engines)
+        for number, engine in enumerate(self.replica_engines):
+            self._count_connections(engine, number)
+        for engine in (self.engine, *self.replica_engines):
+            event.listen(engine.sync_engine, "connect", self._set_prepared_max)
 
         self.session_factory: async_sessionmaker[AsyncSession] = (
             async_sessionmaker(
@@ -35,13 +77,90 @@ class DatabaseSessionManager:
         )
 
     async def dispose(self) -> None:
-        """Shutting down the engine and freeing up database resources."""
+        """Shutting down the engines and freeing up database resources."""
         await self.engine.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
+
+    def get_read_engine(self) -> AsyncEngine:
+        """
+        Picks a replica for a read-only session: in turn or the one with
+        the fewest connections in use. Without replicas it's the primary.
+        """
+        if not self.replica_engines:
+            return self.engine
+        if self.replica_selection == "least_connections":
+            number = min(
+                range(len(self.replica_engines)),
+                key=self._replica_connections.__getitem__,
+            )
+        else:
+            number = self._next_replica % len(self.replica_engines)
+            self._next_replica += 1
+        return self.replica_engines[number]
+
+    def get_pool_stats(self) -> list[dict[str, Any]]:
+        """
+        Live connection pool stats of the primary and the replicas.
+        A NullPool keeps no connections, so only its class is reported.
+        """
+        engines = {"primary": self.engine}
+        for number, engine in enumerate(self.replica_engines, start=1):
+            engines[f"replica-{number}"] = engine
+
+        stats = []
+        for name, engine in engines.items():
+            pool = engine.pool
+            engine_stats: dict[str, Any] = dict(
+                engine=name,
+                host=engine.url.host,
+                pool_class=type(pool).__name__,
+            )
+            if isinstance(pool, QueuePool):
+                engine_stats.update(
+                    size=pool.size(),
+                    checked_in=pool.checkedin(),
+                    checked_out=pool.checkedout(),
+                    overflow=pool.overflow(),
+                )
+            stats.append(engine_stats)
+        return stats
 
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Obtaining a session for executing queries in the database."""
-        async with self.session_factory() as session:
+    async def get_session(
+        self,
+        unit_of_work: bool = False,
+        read_only: bool = False,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Obtaining a session for executing queries in the database.
+
+        In the unit of work mode repositories only flush their changes,
+        and the session is committed once after the caller is done with it.
+        If the caller fails, the changes are rolled back on close.
+
+        Read-only sessions are bound to a replica, if there are any.
+        """
+        bind = self.get_read_engine() if read_only else self.engine
+        async with self.session_factory(
+            bind=bind,
+            info={UNIT_OF_WORK_KEY: unit_of_work},
+        ) as session:
             try:
                 yield session
+                if unit_of_work:
+                    await session.commit()
             finally:
                 await session.close()
+
+    def _set_prepared_max(self, dbapi_connection: Any, *args) -> None:
+        dbapi_connection.driver_connection.prepared_max = self.prepared_max
+
+    def _count_connections(self, engine: AsyncEngine, number: int) -> None:
+        def on_checkout(*args) -> None:
+            self._replica_connections[number] += 1
+
+        def on_checkin(*args) -> None:
+            self._replica_connections[number] -= 1
+
+        event.listen(engine.sync_engine, "checkout", on_checkout)
+        event.listen(engine.sync_engine, "checkin", on_checkin)
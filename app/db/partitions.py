@@ -0,0 +1,265 @@
+import argparse
+import asyncio
+from datetime import date, datetime
+from typing import Any, Literal
+
+from sqlalchemy import Connection, Table, event, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+
+PartitionScheme = Literal["month", "year", "user_hash"]
+
+PARTITIONED_TABLES = ("spendings", "income")
+
+
+def get_partition_key(scheme: PartitionScheme) -> str:
+    return "user_id" if scheme == "user_hash" else "date"
+
+
+def get_partition_by(scheme: PartitionScheme) -> str:
+    return "HASH (user_id)" if scheme == "user_hash" else "RANGE (date)"
+
+
+def get_period_start(day: date, scheme: PartitionScheme) -> date:
+    if scheme == "year":
+        return date(day.year, 1, 1)
+    return date(day.year, day.month, 1)
+
+
+def shift_period(start: date, scheme: PartitionScheme, periods: int) -> date:
+    if scheme == "year":
+        return date(start.year + periods, 1, 1)
+    months = start.year * 12 + start.month - 1 + periods
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def get_range_partition_name(
+    table: str,
+    start: date,
+    scheme: PartitionScheme,
+) -> str:
+    if scheme == "year":
+        return f"{table}_{start:%Y}"
+    return f"{table}_{start:%Y_%m}"
+
+
+def parse_range_partition_name(
+    table: str,
+    name: str,
+    scheme: PartitionScheme,
+) -> date | None:
+    """
+    The period start of a range partition, None for the default partition
+    and tables named otherwise.
+    """
+    date_format = "%Y" if scheme == "year" else "%Y_%m"
+    if not name.startswith(f"{table}_"):
+        return None
+    try:
+        return datetime.strptime(
+            name.removeprefix(f"{table}_"), date_format
+        ).date()
+    except ValueError:
+        return None
+
+
+def get_range_bounds(start: date, scheme: PartitionScheme) -> str:
+    end = shift_period(start, scheme, 1)
+    return f"FROM ('{start}') TO ('{end}')"
+
+
+def get_initial_partitions_ddl(
+    table: str,
+    scheme: PartitionScheme,
+    today: date,
+    first_day: date | None = None,
+) -> list[str]:
+    """
+    DDL of the partitions a new table starts with.
+
+    Range partitions cover the periods from `first_day` (the oldest row
+    of a migrated table) to `partitions_ahead` periods after today.
+    Rows out of them go to the default partition. Hash partitions
+    are all created at once.
+    """
+    if scheme == "user_hash":
+        modulus = settings.db.hash_partitions
+        return [
+            f"CREATE TABLE {table}_p{remainder} PARTITION OF {table} "
+            f"FOR VALUES WITH (MODULUS {modulus}, REMAINDER {remainder})"
+            for remainder in range(modulus)
+        ]
+
+    current = get_period_start(today, scheme)
+    start = min(get_period_start(first_day or today, scheme), current)
+    last = shift_period(current, scheme, settings.db.partitions_ahead)
+    ddl = [f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"]
+    while start <= last:
+        ddl.append(
+            f"CREATE TABLE {get_range_partition_name(table, start, scheme)} "
+            f"PARTITION OF {table} FOR VALUES {get_range_bounds(start, scheme)}"
+        )
+        start = shift_period(start, scheme, 1)
+    return ddl
+
+
+def create_partitions_with_table(table: Table) -> None:
+    """
+    Creates the initial partitions of a table created by
+    `metadata.create_all` (tests). The migration creates them itself.
+    """
+
+    @event.listens_for(table, "after_create")
+    def create_partitions(
+        target: Table, connection: Connection, **kw: Any
+    ) -> None:
+        for statement in get_initial_partitions_ddl(
+            target.name,
+            settings.db.partitioning,
+            date.today(),
+        ):
+            connection.exec_driver_sql(statement)
+
+
+async def get_attached_partitions(
+    connection: AsyncConnection,
+    table: str,
+) -> list[str]:
+    result = await connection.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :table
+            """
+        ),
+        {"table": table},
+    )
+    return list(result.scalars())
+
+
+async def create_range_partition(
+    connection: AsyncConnection,
+    table: str,
+    start: date,
+    scheme: PartitionScheme,
+) -> str:
+    """
+    Creates the partition of a period. Rows of the period that already
+    went to the default partition are moved to it first, attaching fails
+    while the default partition has rows in the new range.
+    """
+    name = get_range_partition_name(table, start, scheme)
+    end = shift_period(start, scheme, 1)
+    await connection.exec_driver_sql(
+        f"CREATE TABLE {name} "
+        f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    await connection.exec_driver_sql(
+        f"WITH moved AS ("
+        f"DELETE FROM {table}_default "
+        f"WHERE date >= '{start}' AND date < '{end}' RETURNING *"
+        f") INSERT INTO {name} SELECT * FROM moved"
+    )
+    await connection.exec_driver_sql(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} "
+        f"FOR VALUES {get_range_bounds(start, scheme)}"
+    )
+    return name
+
+
+async def maintain_partitions(
+    connection: AsyncConnection,
+    scheme: PartitionScheme,
+    today: date,
+    ahead: int,
+    retention: int | None,
+) -> list[str]:
+    """
+    Creates the range partitions up to `ahead` periods after today,
+    and detaches the ones older than `retention` periods. Detached
+    partitions are kept as standalone tables, to archive or drop.
+    Hash partitions are fixed and need no maintenance.
+
+    Returns the performed actions.
+    """
+    if scheme == "user_hash":
+        return []
+
+    current = get_period_start(today, scheme)
+    actions = []
+    for table in PARTITIONED_TABLES:
+        attached = {}
+        for name in await get_attached_partitions(connection, table):
+            start = parse_range_partition_name(table, name, scheme)
+            if start:
+                attached[start] = name
+
+        for periods in range(ahead + 1):
+            start = shift_period(current, scheme, periods)
+            if start not in attached:
+                name = await create_range_partition(
+                    connection, table, start, scheme
+                )
+                actions.append(f"created {name}")
+
+        if retention is None:
+            continue
+        oldest = shift_period(current, scheme, -retention)
+        for start, name in sorted(attached.items()):
+            if start < oldest:
+                await connection.exec_driver_sql(
+                    f"ALTER TABLE {table} DETACH PARTITION {name}"
+                )
+                actions.append(f"detached {name}")
+    return actions
+
+
+async def run_maintenance(dry_run: bool) -> list[str]:
+    # Imported here, the models import this module for the table events
+    # and shouldn't create the database engine with it.
+    from app.db.dependencies import database_manager
+
+    try:
+        async with database_manager.engine.connect() as connection:
+            actions = await maintain_partitions(
+                connection,
+                scheme=settings.db.partitioning,
+                today=date.today(),
+                ahead=settings.db.partitions_ahead,
+                retention=settings.db.partitions_retention,
+            )
+            if dry_run:
+                await connection.rollback()
+            else:
+                await connection.commit()
+    finally:
+        await database_manager.dispose()
+    return actions
+
+
+def main() -> None:
+    """
+    Partitions maintenance of spendings and income, run it periodically,
+    e.g. daily by cron: `python -m app.db.partitions`.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the actions and roll them back",
+    )
+    args = parser.parse_args()
+
+    actions = asyncio.run(run_maintenance(args.dry_run))
+    for action in actions:
+        print(action)
+    if not actions:
+        print("Partitions are up to date")
+
+
+if __name__ == "__main__":
+    main()
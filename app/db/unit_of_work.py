@@ -0,0 +1,77 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+AFTER_COMMIT_KEY = "after_commit_callbacks"
+FLUSHED_KEY = "has_flushed_changes"
+
+
+def is_unit_of_work(session: AsyncSession) -> bool:
+    return bool(session.info.get(UNIT_OF_WORK_KEY, False))
+
+
+async def save_changes(session: AsyncSession) -> None:
+    """
+    Sends pending changes to the database.
+
+    Sessions opened in the unit of work mode are only flushed, they are
+    committed once by the session owner at the end of the request.
+    Other sessions are committed right away.
+    """
+    if is_unit_of_work(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+async def release_connection(session: AsyncSession) -> None:
+    """
+    Ends the session's transaction so its connection goes back to the pool
+    before slow work that doesn't need the database (e.g. chart rendering).
+    The session stays usable and checks out a connection again on demand.
+    Meant for read paths: pending changes are committed first.
+    """
+    await session.commit()
+
+
+def call_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Runs `callback` once the session's transaction is committed, and drops
+    it if the transaction is rolled back. Meant for in-memory caches: they
+    must be invalidated only when the changes are visible to other sessions.
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+def has_uncommitted_changes(session: AsyncSession) -> bool:
+    """
+    True if the session has pending or flushed but not yet committed
+    changes, i.e. what it reads may differ from what other sessions see.
+    """
+    return bool(
+        session.new
+        or session.dirty
+        or session.deleted
+        or session.info.get(FLUSHED_KEY, False)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    session.info[FLUSHED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(FLUSHED_KEY, None)
+    for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(FLUSHED_KEY, None)
+    session.info.pop(AFTER_COMMIT_KEY, None)
@@ -0,0 +1,6 @@
+class AuthException(Exception):
+    pass
+
+
+class PasswordHashingOverloaded(AuthException):
+    pass
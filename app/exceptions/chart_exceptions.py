@@ -0,0 +1,6 @@
+class ChartException(Exception):
+    pass
+
+
+class ChartJobNotFound(ChartException):
+    pass
@@ -7,20 +7,29 @@ from fastapi.staticfiles import StaticFiles
 
 from app.api import router_v1
 from app.core.config import settings
-from app.db import close_db
+from app.db import close_db, remember_writes
 from app.pages import pages_router
+from app.services.auth_service import (
+    get_jwt_key_ring,
+    shutdown_password_hashing,
+)
+from app.services.chart_jobs import chart_jobs_client
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    get_jwt_key_ring()
     yield
     await close_db()
+    await chart_jobs_client.close()
+    shutdown_password_hashing()
 
 
 main_app = FastAPI(
     default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
+main_app.middleware("http")(remember_writes)
 main_app.mount(
     "/static", StaticFiles(directory=settings.pages.static_path), name="static"
 )
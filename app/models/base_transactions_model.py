@@ -1,24 +1,37 @@
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import ForeignKey, String, text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 
+from app.core.config import settings
+from app.db.partitions import get_partition_by, get_partition_key
 from app.models import Base
 from app.models.base_categories_model import BaseCategoriesModel
-from app.models.mixins import IdIntPKMixin
 
+PARTITION_KEY = get_partition_key(settings.db.partitioning)
+
+
+class BaseTranscationsModel(Base):
+    """
+    Transactions tables are partitioned by `settings.db.partitioning`
+    (see app.db.partitions). The partition key has to be a part of the
+    table's primary key, while rows are still identified by `id` alone.
+    """
 
-class BaseTranscationsModel(IdIntPKMixin, Base):
     __abstract__ = True
 
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     amount: Mapped[int] = mapped_column(nullable=False)
     description: Mapped[str] = mapped_column(String(100), nullable=True)
     date: Mapped[datetime] = mapped_column(
+        primary_key=PARTITION_KEY == "date",
         server_default=text("TIMEZONE ('utc', now())"),
         nullable=False,
     )
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=PARTITION_KEY == "user_id",
         nullable=False,
     )
 
@@ -29,3 +42,18 @@ class BaseTranscationsModel(IdIntPKMixin, Base):
     # category should be defined in the inherited class as a relationship
     # to the desired transaction model.
     category: Mapped["BaseCategoriesModel"]
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Any, ...]:
+        return (
+            Index(f"ix_{cls.__tablename__}_user_id_date", "user_id", "date"),
+            {
+                "postgresql_partition_by": get_partition_by(
+                    settings.db.partitioning
+                )
+            },
+        )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict[str, Any]:
+        return {"primary_key": [cls.__table__.c.id]}
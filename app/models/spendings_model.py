@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.db.partitions import create_partitions_with_table
 from app.models.base_transactions_model import BaseTranscationsModel
 
 if TYPE_CHECKING:
@@ -20,3 +21,6 @@ class SpendingsModel(BaseTranscationsModel):
     category: Mapped["UsersSpendingCategoriesModel"] = relationship(
         "UsersSpendingCategoriesModel",
     )
+
+
+create_partitions_with_table(cast(Table, SpendingsModel.__table__))
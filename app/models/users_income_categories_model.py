@@ -1,4 +1,4 @@
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, text
 
 from app.models.base_categories_model import BaseCategoriesModel
 
@@ -12,4 +12,10 @@ class UsersIncomeCategoriesModel(BaseCategoriesModel):
             "category_name",
             name="uq_user_income_category",
         ),
+        Index(
+            "uq_user_income_category_lower",
+            "user_id",
+            text("lower(category_name)"),
+            unique=True,
+        ),
     )
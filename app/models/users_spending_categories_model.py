@@ -1,4 +1,4 @@
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, text
 
 from app.models.base_categories_model import BaseCategoriesModel
 
@@ -8,4 +8,10 @@ class UsersSpendingCategoriesModel(BaseCategoriesModel):
 
     __table_args__ = (
         UniqueConstraint("user_id", "category_name", name="uq_user_category"),
+        Index(
+            "uq_user_category_lower",
+            "user_id",
+            text("lower(category_name)"),
+            unique=True,
+        ),
     )
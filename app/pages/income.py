@@ -4,15 +4,21 @@ from datetime import date
 import aiohttp
 from fastapi import APIRouter, Depends, Request, Query
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.dependencies.auth_dependencies import get_active_verified_user
+from app.api.dependencies.charts_dependencies import get_chart_render_params
 from app.api.v1.routes.income_routes import (
     income_categories_get,
     income_get_all,
-    income_summary_chart_get,
     income_summary_get,
 )
 from app.core.config import settings
+from app.db import get_read_db_session
+from app.models import UserModel
+from app.schemas.charts_schemas import SChartRenderParams
 from app.schemas.transaction_category_schemas import TransactionsOnDeleteActions
+from app.services.income_service import income_service
 
 router = APIRouter()
 templates = Jinja2Templates(directory="./templates")
@@ -148,85 +154,108 @@ async def income_categories_page(
 @router.get("/income/summary/full/")
 async def income_summary_full(
     request: Request,
+    chart_type: str | None = Query(None),
+    client_charts: bool = Query(False, description="Draw charts in the browser"),
     summary=Depends(income_summary_get),
-    chart=Depends(income_summary_chart_get),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ):
-    chart_base64 = base64.b64encode(chart.body).decode("utf-8")
-    return templates.TemplateResponse(
-        name="summary_full.html",
-        context={
-            "request": request,
-            "title": "Income summary",
-            "time_interval": "All time",
-            "summary": summary,
-            "chart": chart_base64,
-            "chart_width": "600",
-            "get_summary_url": f"{settings.api.prefix_v1}/income/summary/",
-            "get_summary_chart_url": f"{settings.api.prefix_v1}/income/summary/chart/",
-        },
-    )
+    context = {
+        "request": request,
+        "title": "Income summary",
+        "time_interval": "All time",
+        "summary": summary,
+        "chart_width": "600",
+        "get_summary_url": f"{settings.api.prefix_v1}/income/summary/",
+        "get_summary_chart_url": f"{settings.api.prefix_v1}/income/summary/chart/",
+    }
+    if client_charts:
+        chart_data = income_service.make_categories_chart_data(summary)
+        context["chart_data"] = chart_data.model_dump()
+    else:
+        chart_request = income_service.make_summary_chart(summary, chart_type)
+        chart = await income_service.render_chart(
+            db_session, chart_request.with_render_params(render_params)
+        )
+        context["chart"] = base64.b64encode(chart).decode("utf-8")
+        context["chart_media_type"] = render_params.media_type
+    return templates.TemplateResponse(name="summary_full.html", context=context)
 
 
 @router.get("/income/summary/annual/")
 async def income_summary_annual(
     request: Request,
+    client_charts: bool = Query(False, description="Draw charts in the browser"),
+    user: UserModel = Depends(get_active_verified_user),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ):
     year = date.today().year
-
-    async with aiohttp.ClientSession() as session:
-        url_prefix = f"http://0.0.0.0:8000{settings.api.prefix_v1}/income/summary"
-        summary_url = f"{url_prefix}/{year}/"
-        async with session.get(summary_url, cookies=request.cookies) as resp:
-            summary = await resp.json()
-
-        chart_url = f"{url_prefix}/chart/{year}/"
-        async with session.get(chart_url, cookies=request.cookies) as resp:
-            chart = await resp.content.read()
-
-    chart_base64 = base64.b64encode(chart).decode("utf-8")
-    return templates.TemplateResponse(
-        name="summary_annual.html",
-        context={
-            "request": request,
-            "title": "Income summary",
-            "time_interval": "Annual",
-            "tx_type_multiple": "income",
-            "summary": summary,
-            "chart": chart_base64,
-            "chart_width": "900",
-            "get_summary_prefix": f"{settings.api.prefix_v1}/income/summary",
-        },
-    )
+    summary = await income_service.get_annual_summary(db_session, user.id, year)
+    context = {
+        "request": request,
+        "title": "Income summary",
+        "time_interval": "Annual",
+        "tx_type_multiple": "income",
+        "summary": summary,
+        "chart_width": "900",
+        "get_summary_prefix": f"{settings.api.prefix_v1}/income/summary",
+    }
+    if client_charts:
+        chart_data = income_service.make_annual_chart_data(summary)
+        context["chart_data"] = chart_data.model_dump()
+    else:
+        # Both variants in one batch, so the split switch doesn't
+        # need another chart request for the current year.
+        chart, chart_split = await income_service.render_charts(
+            db_session,
+            [
+                income_service.make_annual_summary_chart(
+                    summary, year, "income", split_by_category
+                )
+                for split_by_category in (False, True)
+            ],
+        )
+        context["chart"] = base64.b64encode(chart).decode("utf-8")
+        context["chart_split"] = base64.b64encode(chart_split).decode("utf-8")
+        context["chart_key"] = str(year)
+    return templates.TemplateResponse(name="summary_annual.html", context=context)
 
 
 @router.get("/income/summary/monthly/")
 async def income_summary_monthly(
     request: Request,
+    client_charts: bool = Query(False, description="Draw charts in the browser"),
+    user: UserModel = Depends(get_active_verified_user),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ):
     year = date.today().year
     month = date.today().month
-
-    async with aiohttp.ClientSession() as session:
-        url_prefix = f"http://0.0.0.0:8000{settings.api.prefix_v1}/income/summary"
-        summary_url = f"{url_prefix}/{year}/{month}/"
-        async with session.get(summary_url, cookies=request.cookies) as resp:
-            summary = await resp.json()
-
-        chart_url = f"{url_prefix}/chart/{year}/{month}/"
-        async with session.get(chart_url, cookies=request.cookies) as resp:
-            chart = await resp.content.read()
-
-    chart_base64 = base64.b64encode(chart).decode("utf-8")
-    return templates.TemplateResponse(
-        name="summary_monthly.html",
-        context={
-            "request": request,
-            "title": "Income summary",
-            "time_interval": "Monthly",
-            "tx_type_multiple": "income",
-            "summary": summary,
-            "chart": chart_base64,
-            "chart_width": "900",
-            "get_summary_prefix": f"{settings.api.prefix_v1}/income/summary",
-        },
+    summary = await income_service.get_monthly_summary(
+        db_session, user.id, year, month
     )
+    context = {
+        "request": request,
+        "title": "Income summary",
+        "time_interval": "Monthly",
+        "tx_type_multiple": "income",
+        "summary": summary,
+        "chart_width": "900",
+        "get_summary_prefix": f"{settings.api.prefix_v1}/income/summary",
+    }
+    if client_charts:
+        chart_data = income_service.make_monthly_chart_data(summary, year, month)
+        context["chart_data"] = chart_data.model_dump()
+    else:
+        chart, chart_split = await income_service.render_charts(
+            db_session,
+            [
+                income_service.make_monthly_summary_chart(
+                    summary, year, month, "income", split_by_category
+                )
+                for split_by_category in (False, True)
+            ],
+        )
+        context["chart"] = base64.b64encode(chart).decode("utf-8")
+        context["chart_split"] = base64.b64encode(chart_split).decode("utf-8")
+        context["chart_key"] = f"{year}-{month}"
+    return templates.TemplateResponse(name="summary_monthly.html", context=context)
@@ -53,12 +53,13 @@ async def saving_goal_details_page(
 ):
     async with aiohttp.ClientSession() as session:
         url = f"http://0.0.0.0:8000{settings.api.prefix_v1}/goals/{goal_id}/"
-        async with session.get(url, cookies=request.cookies) as resp:
+        async with session.get(
+            url,
+            params={"with_progress": "true"},
+            cookies=request.cookies,
+        ) as resp:
             goal_info = await resp.json()
-
-        url = f"http://0.0.0.0:8000{settings.api.prefix_v1}/goals/progress/{goal_id}/"
-        async with session.get(url, cookies=request.cookies) as resp:
-            goal_progress = await resp.json()
+    goal_progress = goal_info.pop("progress", None)
 
     return templates.TemplateResponse(
         name="goal_details.html",
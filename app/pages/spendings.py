@@ -4,15 +4,21 @@ from datetime import date
 import aiohttp
 from fastapi import APIRouter, Depends, Request, Query
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.dependencies.auth_dependencies import get_active_verified_user
+from app.api.dependencies.charts_dependencies import get_chart_render_params
 from app.api.v1.routes.spendings_routes import (
     spendings_categories_get,
     spendings_get_all,
-    spendings_summary_chart_get,
     spendings_summary_get,
 )
 from app.core.config import settings
+from app.db import get_read_db_session
+from app.models import UserModel
+from app.schemas.charts_schemas import SChartRenderParams
 from app.schemas.transaction_category_schemas import TransactionsOnDeleteActions
+from app.services import spendings_service
 
 router = APIRouter()
 templates = Jinja2Templates(directory="./templates")
@@ -146,89 +152,110 @@ async def spending_categories_page(
 @router.get("/spendings/summary/full/")
 async def spending_summary_full(
     request: Request,
+    chart_type: str | None = Query(None),
+    client_charts: bool = Query(False, description="Draw charts in the browser"),
     summary=Depends(spendings_summary_get),
-    chart=Depends(spendings_summary_chart_get),
+    render_params: SChartRenderParams = Depends(get_chart_render_params),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ):
-    chart_base64 = base64.b64encode(chart.body).decode("utf-8")
-    return templates.TemplateResponse(
-        name="summary_full.html",
-        context={
-            "request": request,
-            "title": "Spendings summary",
-            "time_interval": "All time",
-            "summary": summary,
-            "chart": chart_base64,
-            "chart_width": "600",
-            "get_summary_url": f"{settings.api.prefix_v1}/spendings/summary/",
-            "get_summary_chart_url": f"{settings.api.prefix_v1}/spendings/summary/chart/",
-        },
-    )
+    context = {
+        "request": request,
+        "title": "Spendings summary",
+        "time_interval": "All time",
+        "summary": summary,
+        "chart_width": "600",
+        "get_summary_url": f"{settings.api.prefix_v1}/spendings/summary/",
+        "get_summary_chart_url": f"{settings.api.prefix_v1}/spendings/summary/chart/",
+    }
+    if client_charts:
+        chart_data = spendings_service.make_categories_chart_data(summary)
+        context["chart_data"] = chart_data.model_dump()
+    else:
+        chart_request = spendings_service.make_summary_chart(summary, chart_type)
+        chart = await spendings_service.render_chart(
+            db_session, chart_request.with_render_params(render_params)
+        )
+        context["chart"] = base64.b64encode(chart).decode("utf-8")
+        context["chart_media_type"] = render_params.media_type
+    return templates.TemplateResponse(name="summary_full.html", context=context)
 
 
 @router.get("/spendings/summary/annual/")
 async def spending_summary_annual(
     request: Request,
+    client_charts: bool = Query(False, description="Draw charts in the browser"),
+    user: UserModel = Depends(get_active_verified_user),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ):
     year = date.today().year
-
-    async with aiohttp.ClientSession() as session:
-        url_prefix = (
-            f"http://0.0.0.0:8000{settings.api.prefix_v1}/spendings/summary"
+    summary = await spendings_service.get_annual_summary(db_session, user.id, year)
+    context = {
+        "request": request,
+        "title": "Spendings summary",
+        "time_interval": "Annual",
+        "tx_type_multiple": "spendings",
+        "summary": summary,
+        "chart_width": "900",
+        "get_summary_prefix": f"{settings.api.prefix_v1}/spendings/summary",
+    }
+    if client_charts:
+        chart_data = spendings_service.make_annual_chart_data(summary)
+        context["chart_data"] = chart_data.model_dump()
+    else:
+        # Both variants in one batch, so the split switch doesn't
+        # need another chart request for the current year.
+        chart, chart_split = await spendings_service.render_charts(
+            db_session,
+            [
+                spendings_service.make_annual_summary_chart(
+                    summary, year, "spendings", split_by_category
+                )
+                for split_by_category in (False, True)
+            ],
         )
-        summary_url = f"{url_prefix}/{year}/"
-        async with session.get(summary_url, cookies=request.cookies) as resp:
-            summary = await resp.json()
-
-        chart_url = f"{url_prefix}/chart/{year}/"
-        async with session.get(chart_url, cookies=request.cookies) as resp:
-            chart = await resp.content.read()
-
-    chart_base64 = base64.b64encode(chart).decode("utf-8")
-    return templates.TemplateResponse(
-        name="summary_annual.html",
-        context={
-            "request": request,
-            "title": "Spendings summary",
-            "time_interval": "Annual",
-            "tx_type_multiple": "spendings",
-            "summary": summary,
-            "chart": chart_base64,
-            "chart_width": "900",
-            "get_summary_prefix": f"{settings.api.prefix_v1}/spendings/summary",
-        },
-    )
+        context["chart"] = base64.b64encode(chart).decode("utf-8")
+        context["chart_split"] = base64.b64encode(chart_split).decode("utf-8")
+        context["chart_key"] = str(year)
+    return templates.TemplateResponse(name="summary_annual.html", context=context)
 
 
 @router.get("/spendings/summary/monthly/")
 async def spending_summary_monthly(
     request: Request,
+    client_charts: bool = Query(False, description="Draw charts in the browser"),
+    user: UserModel = Depends(get_active_verified_user),
+    db_session: AsyncSession = Depends(get_read_db_session),
 ):
     year = date.today().year
     month = date.today().month
-
-    async with aiohttp.ClientSession() as session:
-        url_prefix = (
-            f"http://0.0.0.0:8000{settings.api.prefix_v1}/spendings/summary"
-        )
-        summary_url = f"{url_prefix}/{year}/{month}/"
-        async with session.get(summary_url, cookies=request.cookies) as resp:
-            summary = await resp.json()
-
-        chart_url = f"{url_prefix}/chart/{year}/{month}/"
-        async with session.get(chart_url, cookies=request.cookies) as resp:
-            chart = await resp.content.read()
-
-    chart_base64 = base64.b64encode(chart).decode("utf-8")
-    return templates.TemplateResponse(
-        name="summary_monthly.html",
-        context={
-            "request": request,
-            "title": "Spendings summary",
-            "time_interval": "Monthly",
-            "tx_type_multiple": "spendings",
-            "summary": summary,
-            "chart": chart_base64,
-            "chart_width": "900",
-            "get_summary_prefix": f"{settings.api.prefix_v1}/spendings/summary",
-        },
+    summary = await spendings_service.get_monthly_summary(
+        db_session, user.id, year, month
     )
+    context = {
+        "request": request,
+        "title": "Spendings summary",
+        "time_interval": "Monthly",
+        "tx_type_multiple": "spendings",
+        "summary": summary,
+        "chart_width": "900",
+        "get_summary_prefix": f"{settings.api.prefix_v1}/spendings/summary",
+    }
+    if client_charts:
+        chart_data = spendings_service.make_monthly_chart_data(
+            summary, year, month
+        )
+        context["chart_data"] = chart_data.model_dump()
+    else:
+        chart, chart_split = await spendings_service.render_charts(
+            db_session,
+            [
+                spendings_service.make_monthly_summary_chart(
+                    summary, year, month, "spendings", split_by_category
+                )
+                for split_by_category in (False, True)
+            ],
+        )
+        context["chart"] = base64.b64encode(chart).decode("utf-8")
+        context["chart_split"] = base64.b64encode(chart_split).decode("utf-8")
+        context["chart_key"] = f"{year}-{month}"
+    return templates.TemplateResponse(name="summary_monthly.html", context=context)
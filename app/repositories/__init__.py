@@ -5,6 +5,7 @@ from .spendings_repository import spendings_repo
 from .user_repository import user_repo
 from .users_income_categories_repository import user_income_cat_repo
 from .users_spending_categories_repository import user_spend_cat_repo
+from .balance_repository import balance_repo
 
 __all__ = [
     "user_repo",
@@ -14,4 +15,5 @@ __all__ = [
     "income_repo",
     "user_spend_cat_repo",
     "user_income_cat_repo",
+    "balance_repo",
 ]
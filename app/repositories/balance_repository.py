@@ -0,0 +1,145 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Row,
+    Select,
+    and_,
+    case,
+    cast,
+    false,
+    func,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.base_transactions_repository import (
+    BaseTransactionsRepository,
+)
+from app.repositories.income_repository import income_repo
+from app.repositories.spendings_repository import spendings_repo
+from app.schemas.balance_schemas import BalancePeriod
+
+
+class BalanceRepository:
+    """
+    Income and spendings of a user aggregated together.
+    """
+
+    def __init__(
+        self,
+        income_repo: BaseTransactionsRepository,
+        spendings_repo: BaseTransactionsRepository,
+    ):
+        self.income_repo = income_repo
+        self.spendings_repo = spendings_repo
+
+    async def get_balance_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        period: BalancePeriod,
+        datetime_from: datetime | None = None,
+        datetime_to: datetime | None = None,
+    ) -> list[Row]:
+        """
+        result example: [(date(2025, 3, 1), 1000, 700, 300)]
+        designations: [(period start, income, spendings, net)]
+        """
+        query = self.make_balance_query(
+            user_id, period, datetime_from, datetime_to
+        )
+        result = await session.execute(query)
+        return list(result.all())
+
+    def make_balance_query(
+        self,
+        user_id: int,
+        period: BalancePeriod,
+        datetime_from: datetime | None = None,
+        datetime_to: datetime | None = None,
+    ) -> Select:
+        """
+        Both tables are read in one pass and aggregated together:
+
+        SELECT CAST(date_trunc('month', date) AS DATE) AS period_start,
+               coalesce(SUM(amount) FILTER (WHERE is_income), 0) AS income,
+               coalesce(SUM(amount) FILTER (WHERE NOT is_income), 0)
+                   AS spendings,
+               SUM(CASE WHEN is_income THEN amount ELSE -amount END) AS net
+        FROM (
+            SELECT date, amount, true AS is_income FROM income
+            WHERE user_id = {user_id} AND date >= ... AND date <= ...
+            UNION ALL
+            SELECT date, amount, false AS is_income FROM spendings
+            WHERE user_id = {user_id} AND date >= ... AND date <= ...
+        ) AS transactions
+        GROUP BY period_start
+        ORDER BY period_start
+        """
+        transactions = union_all(
+            self._select_transactions(
+                self.income_repo,
+                true(),
+                user_id,
+                datetime_from,
+                datetime_to,
+            ),
+            self._select_transactions(
+                self.spendings_repo,
+                false(),
+                user_id,
+                datetime_from,
+                datetime_to,
+            ),
+        ).subquery("transactions")
+
+        amount = transactions.c.amount
+        is_income = transactions.c.is_income
+        return (
+            select(
+                cast(func.date_trunc(period, transactions.c.date), Date).label(
+                    "period_start"
+                ),
+                func.coalesce(func.sum(amount).filter(is_income), 0).label(
+                    "income"
+                ),
+                func.coalesce(func.sum(amount).filter(~is_income), 0).label(
+                    "spendings"
+                ),
+                func.sum(case((is_income, amount), else_=-amount)).label("net"),
+            )
+            .group_by("period_start")
+            .order_by("period_start")
+        )
+
+    @staticmethod
+    def _select_transactions(
+        repo: BaseTransactionsRepository,
+        is_income: ColumnElement[bool],
+        user_id: int,
+        datetime_from: datetime | None,
+        datetime_to: datetime | None,
+    ) -> Select:
+        model = repo.model
+        query = select(
+            model.date,
+            model.amount,
+            is_income.label("is_income"),
+        ).where(model.user_id == user_id)
+        filters = repo._get_transactions_filters(
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+        )
+        if filters:
+            query = query.where(and_(*filters))
+        return query
+
+
+balance_repo = BalanceRepository(
+    income_repo=income_repo,
+    spendings_repo=spendings_repo,
+)
@@ -1,6 +1,6 @@
 from typing import Type
 
-from sqlalchemy import select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.base_categories_model import BaseCategoriesModel
@@ -17,9 +17,17 @@ class BaseCategoriesRepository(BaseRepository[BaseCategoriesModel]):
         user_id: int,
         category_name: str,
     ) -> BaseCategoriesModel | None:
-        query = select(self.model).filter(
-            self.model.category_name.ilike(category_name),
-            self.model.user_id == user_id,
+        """
+        Case-insensitive lookup, served by the unique index
+        on (user_id, lower(category_name)). A lambda statement, so it's
+        built and compiled once per categories model.
+        """
+        model = self.model
+        query = lambda_stmt(
+            lambda: select(model).where(
+                func.lower(model.category_name) == func.lower(category_name),
+                model.user_id == user_id,
+            )
         )
         result = await session.execute(query)
         return result.scalar_one_or_none()
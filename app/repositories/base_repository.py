@@ -1,8 +1,9 @@
 from typing import Any, Generic, Literal, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.unit_of_work import save_changes
 from app.models import Base
 
 
@@ -22,10 +23,13 @@ class BaseRepository(Generic[T]):
         session: AsyncSession,
         obj_in: dict,
     ) -> T:
+        """
+        Server defaults are fetched by the INSERT ... RETURNING statement
+        emitted on flush, so the object doesn't need to be refreshed.
+        """
         db_obj = self.model(**obj_in)
         session.add(db_obj)
-        await session.commit()
-        await session.refresh(db_obj)
+        await save_changes(session)
         return db_obj
 
     async def get(
@@ -73,13 +77,24 @@ class BaseRepository(Generic[T]):
         object_id: int,
         params: dict,
     ) -> T:
-        object_from_db = await session.get(self.model, object_id)
+        """
+        Updates an entry with a single UPDATE ... RETURNING statement.
+        """
+        if not params:
+            object_from_db = await self.get(session, object_id)
+        else:
+            query = (
+                update(self.model)
+                .filter_by(id=object_id)
+                .values(**params)
+                .returning(self.model)
+                .execution_options(populate_existing=True)
+            )
+            result = await session.execute(query)
+            object_from_db = result.scalar_one_or_none()
         if not object_from_db:
             raise ObjectNotFound(f"Object with id: {object_id} not found")
-        for key, value in params.items():
-            setattr(object_from_db, key, value)
-        await session.commit()
-        await session.refresh(object_from_db)
+        await save_changes(session)
         return object_from_db
 
     async def delete(
@@ -90,4 +105,4 @@ class BaseRepository(Generic[T]):
         db_obj = await self.get(session, id_)
         if db_obj:
             await session.delete(db_obj)
-            await session.commit()
+            await save_changes(session)
@@ -1,14 +1,42 @@
-from datetime import datetime
-from typing import Type
+from datetime import datetime, time, timedelta
+from typing import Any, Literal, Type
 
-from sqlalchemy import ColumnElement, and_, desc, func, select
+from sqlalchemy import (
+    REAL,
+    ColumnElement,
+    Date,
+    Integer,
+    Interval,
+    Numeric,
+    Row,
+    Select,
+    StatementLambdaElement,
+    and_,
+    case,
+    cast,
+    desc,
+    func,
+    lambda_stmt,
+    literal,
+    select,
+    tablesample,
+    true,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
+from app.db.unit_of_work import save_changes
 from app.models.base_categories_model import BaseCategoriesModel
 from app.models.base_transactions_model import BaseTranscationsModel
 from app.repositories.base_repository import BaseRepository
 from app.schemas.common_schemas import SortParam
+from app.schemas.transactions_schemas import (
+    SBucketsParams,
+    SRollingParams,
+    SStatsParams,
+)
 
 
 class BaseTransactionsRepository(BaseRepository[BaseTranscationsModel]):
@@ -28,14 +56,71 @@ class BaseTransactionsRepository(BaseRepository[BaseTranscationsModel]):
         """
         Get transactions with `category` relation.
         """
-        query = (
-            select(self.model)
-            .filter_by(id=transaction_id)
-            .options(joinedload(self.model.category))
+        model = self.model
+        query = lambda_stmt(
+            lambda: (
+                select(model)
+                .where(model.id == transaction_id)
+                .options(joinedload(model.category))
+            )
         )
         result = await session.execute(query)
         return result.scalar_one_or_none()
 
+    async def update_transaction_with_category(
+        self,
+        session: AsyncSession,
+        transaction_id: int,
+        user_id: int,
+        params: dict[str, Any],
+        category_name: str | None = None,
+    ) -> Row | None:
+        """
+        Updates the user's transaction and resolves the new category by name
+        in a single statement. The category name is joined in the same
+        round trip. Returns None if either the transaction or the category
+        is not found.
+
+        UPDATE spendings
+        SET amount=:amount, category_id=users_spending_categories.id
+        FROM users_spending_categories
+        WHERE spendings.id = :id
+          AND spendings.user_id = :user_id
+          AND users_spending_categories.user_id = :user_id
+          AND lower(users_spending_categories.category_name) = lower(:name)
+        RETURNING spendings.id, spendings.amount, spendings.description,
+                  spendings.date, users_spending_categories.category_name
+        """
+        categories = self.tx_categories_model
+        query = update(self.model).where(
+            self.model.id == transaction_id,
+            self.model.user_id == user_id,
+        )
+        if category_name is None:
+            query = query.where(categories.id == self.model.category_id)
+        else:
+            query = query.where(
+                categories.user_id == user_id,
+                func.lower(categories.category_name) == func.lower(category_name),
+            )
+            params = {**params, "category_id": categories.id}
+
+        query = (
+            query.values(**params)
+            .returning(
+                self.model.id,
+                self.model.amount,
+                self.model.description,
+                self.model.date,
+                categories.category_name,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await session.execute(query)
+        updated_transaction = result.one_or_none()
+        await save_changes(session)
+        return updated_transaction
+
     async def get_transactions_from_db(
         self,
         session: AsyncSession,
@@ -50,22 +135,14 @@ class BaseTransactionsRepository(BaseRepository[BaseTranscationsModel]):
     ) -> list[BaseTranscationsModel]:
         query = select(self.model).where(self.model.user_id == user_id)
 
-        filters: list[ColumnElement[bool]] = []
-        if categories_ids:
-            filters.append(self.model.category_id.in_(categories_ids))
-        if description_search_term:
-            filters.append(
-                self.model.description.ilike(f"%{description_search_term}%"),
-            )
-        if min_amount:
-            filters.append(self.model.amount >= min_amount)
-        if max_amount:
-            filters.append(self.model.amount <= max_amount)
-        if datetime_from:
-            filters.append(self.model.date >= datetime_from)
-        if datetime_to:
-            filters.append(self.model.date <= datetime_to)
-
+        filters = self._get_transactions_filters(
+            categories_ids=categories_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            description_search_term=description_search_term,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+        )
         if filters:
             query = query.where(and_(*filters))
 
@@ -85,101 +162,755 @@ class BaseTransactionsRepository(BaseRepository[BaseTranscationsModel]):
         result = await session.execute(query)
         return list(result.scalars().all())
 
+    async def get_transactions_rows_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        categories_ids: list[int] | None = None,
+        min_amount: int | None = None,
+        max_amount: int | None = None,
+        description_search_term: str | None = None,
+        datetime_from: datetime | None = None,
+        datetime_to: datetime | None = None,
+        sort_params: list[SortParam] | None = None,
+    ) -> list[Row]:
+        """
+        The same as `get_transactions_from_db`, but selects only the columns
+        needed for the response, with the category name taken from a plain
+        join. Rows are returned as tuples, without ORM objects, in the field
+        order of the response schema. Microseconds are truncated in SQL.
+
+        SELECT spendings.amount, users_spending_categories.category_name,
+               spendings.description,
+               date_trunc('second', spendings.date) AS date, spendings.id
+        FROM spendings
+        INNER JOIN users_spending_categories
+           ON spendings.category_id = users_spending_categories.id
+        WHERE spendings.user_id = {user_id} AND ...
+        """
+        columns = {
+            "amount": self.model.amount,
+            "category_name": self.tx_categories_model.category_name,
+            "description": self.model.description,
+            "date": func.date_trunc(
+                "second",
+                self.model.date,
+                type_=self.model.date.type,
+            ).label("date"),
+            "id": self.model.id,
+        }
+        sort_columns = {**columns, "date": self.model.date}
+        query = (
+            select(*columns.values())
+            .join(
+                self.tx_categories_model,
+                self.model.category_id == self.tx_categories_model.id,
+            )
+            .where(self.model.user_id == user_id)
+        )
+
+        filters = self._get_transactions_filters(
+            categories_ids=categories_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            description_search_term=description_search_term,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+        )
+        if filters:
+            query = query.where(and_(*filters))
+
+        if sort_params:
+            for param in sort_params:
+                column = sort_columns[param.order_by]
+                if param.order_direction == "asc":
+                    query = query.order_by(column.asc())
+                else:
+                    query = query.order_by(column.desc())
+
+        result = await session.execute(query)
+        return list(result.all())
+
+    def _get_transactions_filters(
+        self,
+        categories_ids: list[int] | None = None,
+        min_amount: int | None = None,
+        max_amount: int | None = None,
+        description_search_term: str | None = None,
+        datetime_from: datetime | None = None,
+        datetime_to: datetime | None = None,
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
+        if categories_ids:
+            filters.append(self.model.category_id.in_(categories_ids))
+        if description_search_term:
+            filters.append(
+                self.model.description.ilike(f"%{description_search_term}%"),
+            )
+        if min_amount:
+            filters.append(self.model.amount >= min_amount)
+        if max_amount:
+            filters.append(self.model.amount <= max_amount)
+        if datetime_from:
+            filters.append(self.model.date >= datetime_from)
+        if datetime_to:
+            filters.append(self.model.date <= datetime_to)
+        return filters
+
     async def get_annual_summary_from_db(
         self,
         session: AsyncSession,
         user_id: int,
         year: int,
     ) -> list:
+        """
+        result example: [(700, 'Beer', Decimal('1'))]
+        designations: [(summary amount, category name, month number)]
+        """
+        query = self.make_annual_summary_query(user_id, year)
+        result = await session.execute(query)
+        return list(result)
+
+    def make_annual_summary_query(
+        self,
+        user_id: int,
+        year: int,
+    ) -> StatementLambdaElement:
         """
         SELECT SUM(amount) AS amount, category_name, EXTRACT(MONTH FROM date) AS month
         FROM spendings
         INNER JOIN users_spending_categories
            ON spendings.category_id = users_spending_categories.id
         WHERE spendings.user_id = {user_id}
-          AND EXTRACT(YEAR FROM date) = {year}
+          AND date >= '{year}-01-01' AND date < '{year + 1}-01-01'
         GROUP BY category_name, EXTRACT(MONTH FROM date)
         ORDER BY month, amount DESC, category_name
 
+        The date is compared with a range rather than EXTRACT(YEAR ...),
+        so the planner prunes partitions of other periods.
+        """
+        return self._make_summary_query(
+            user_id,
+            "month",
+            datetime(year, 1, 1),
+            datetime(year + 1, 1, 1),
+        )
+
+    async def get_monthly_summary_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int,
+    ) -> list:
+        """
         result example: [(700, 'Beer', Decimal('1'))]
-        designations: [(summary amount, category name, month number)]
+        designations: [(summary amount, category name, day number)]
         """
-        query = (
+        query = self.make_monthly_summary_query(user_id, year, month)
+        result = await session.execute(query)
+        return list(result)
+
+    def make_monthly_summary_query(
+        self,
+        user_id: int,
+        year: int,
+        month: int,
+    ) -> StatementLambdaElement:
+        """
+        SELECT SUM(amount) AS amount, category_name, EXTRACT(DAY FROM date) AS day
+        FROM spendings
+        INNER JOIN users_spending_categories
+           ON spendings.category_id = users_spending_categories.id
+        WHERE spendings.user_id=12
+          AND date >= '2025-03-01' AND date < '2025-04-01'
+        GROUP BY category_name, EXTRACT(DAY FROM date)
+        ORDER BY day, amount DESC, category_name
+        """
+        return self._make_summary_query(
+            user_id,
+            "day",
+            datetime(year, month, 1),
+            datetime(year + month // 12, month % 12 + 1, 1),
+        )
+
+    def _make_summary_query(
+        self,
+        user_id: int,
+        field: Literal["month", "day"],
+        date_from: datetime,
+        date_to: datetime,
+    ) -> StatementLambdaElement:
+        """
+        A lambda statement: the query is built and compiled once per model
+        and field, later calls only bind `user_id` and the dates. With the
+        same SQL each time psycopg prepares it on the server as well.
+        """
+        model = self.model
+        categories = self.tx_categories_model
+        period = func.extract(field, model.date)
+        period_label = period.label(field)
+
+        query = lambda_stmt(
+            lambda: select(
+                func.sum(model.amount).label("amount"),
+                categories.category_name,
+                period_label,
+            ).join(categories, model.category_id == categories.id)
+        )
+        query += lambda s: s.where(
+            model.user_id == user_id,
+            model.date >= date_from,
+            model.date < date_to,
+        )
+        query += lambda s: s.group_by(categories.category_name, period).order_by(
+            period_label, desc("amount"), categories.category_name
+        )
+        return query
+
+    async def get_buckets_summary_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SBucketsParams,
+    ) -> list[Row]:
+        """
+        result example: [(date(2025, 3, 1), 'Beer', 700), (date(2025, 4, 1), None, 0)]
+        designations: [(bucket start, category name, summary amount)]
+        The category name is None for buckets without transactions and
+        for all buckets unless they are split by category.
+        """
+        query = self.make_buckets_summary_query(user_id, params)
+        result = await session.execute(query)
+        return list(result.all())
+
+    def make_buckets_summary_query(
+        self,
+        user_id: int,
+        params: SBucketsParams,
+    ) -> Select:
+        """
+        Amounts are summed per bucket and then joined to the series of all
+        the buckets, so the empty ones are filled with zeros in SQL:
+
+        WITH totals AS (
+            SELECT date_trunc('week', date) AS bucket_start,
+                   category_name, SUM(amount) AS amount
+            FROM spendings
+            INNER JOIN users_spending_categories
+               ON spendings.category_id = users_spending_categories.id
+            WHERE spendings.user_id = {user_id}
+              AND date >= '2025-03-03' AND date < '2025-06-01'
+            GROUP BY bucket_start, category_name
+        )
+        SELECT CAST(series.bucket_start AS DATE) AS bucket_start,
+               totals.category_name, coalesce(totals.amount, 0) AS amount
+        FROM generate_series('2025-03-03', '2025-05-31', '1 week')
+             AS series(bucket_start)
+        LEFT OUTER JOIN totals ON totals.bucket_start = series.bucket_start
+        ORDER BY series.bucket_start, amount DESC, totals.category_name
+
+        `custom` buckets use date_bin with the first day as the origin.
+        """
+        step = cast(params.step, Interval)
+        first_bucket_start = datetime.combine(params.first_bucket_start, time())
+        last_day = datetime.combine(params.date_to, time())
+        if params.granularity == "custom":
+            bucket_start = func.date_bin(step, self.model.date, first_bucket_start)
+        else:
+            bucket_start = func.date_trunc(params.granularity, self.model.date)
+
+        columns: list[ColumnElement[Any]] = [bucket_start.label("bucket_start")]
+        group_by: list[Any] = ["bucket_start"]
+        if params.split_by_category:
+            columns.append(
+                self.tx_categories_model.category_name.label("category_name")
+            )
+            group_by.append(self.tx_categories_model.category_name)
+        totals_query = select(
+            *columns,
+            func.sum(self.model.amount).label("amount"),
+        ).where(
+            self.model.user_id == user_id,
+            self.model.date >= first_bucket_start,
+            self.model.date < last_day + timedelta(days=1),
+        )
+        if params.split_by_category:
+            totals_query = totals_query.join(
+                self.tx_categories_model,
+                self.model.category_id == self.tx_categories_model.id,
+            )
+        totals = totals_query.group_by(*group_by).cte("totals")
+
+        series = (
+            func.generate_series(first_bucket_start, last_day, step)
+            .table_valued("bucket_start")
+            .render_derived(name="series")
+        )
+        category_name = (
+            totals.c.category_name
+            if params.split_by_category
+            else cast(None, self.tx_categories_model.category_name.type)
+        )
+        return (
+            select(
+                cast(series.c.bucket_start, Date).label("bucket_start"),
+                category_name.label("category_name"),
+                func.coalesce(totals.c.amount, 0).label("amount"),
+            )
+            .select_from(series)
+            .outerjoin(totals, totals.c.bucket_start == series.c.bucket_start)
+            .order_by(series.c.bucket_start, desc("amount"), "category_name")
+        )
+
+    async def get_trend_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        year_from: int,
+        year_to: int,
+    ) -> list[Row]:
+        """
+        result example: [(2025, None, None, 7000, 500, Decimal('7.7')),
+                         (2025, 3, None, 700, None, None),
+                         (2025, None, 'Beer', 900, -100, Decimal('-10.0'))]
+        designations: [(year, month number, category name, summary amount,
+                        delta to the previous year, delta in percent)]
+        Year totals have neither a month nor a category.
+        """
+        query = self.make_trend_query(user_id, year_from, year_to)
+        result = await session.execute(query)
+        return list(result.all())
+
+    def make_trend_query(
+        self,
+        user_id: int,
+        year_from: int,
+        year_to: int,
+    ) -> Select:
+        """
+        Year, year-month and year-category totals are summed in one pass
+        with grouping sets. The previous year is read as well, so the
+        year-over-year deltas of the first year are computed by the window
+        functions too, and filtered out afterwards:
+
+        WITH totals AS (
+            SELECT CAST(EXTRACT(YEAR FROM date) AS INTEGER) AS year,
+                   CAST(EXTRACT(MONTH FROM date) AS INTEGER) AS month,
+                   category_name, SUM(amount) AS amount,
+                   GROUPING(month, category_name) AS level
+            FROM spendings
+            INNER JOIN users_spending_categories
+               ON spendings.category_id = users_spending_categories.id
+            WHERE spendings.user_id = {user_id}
+              AND date >= '{year_from - 1}-01-01'
+              AND date < '{year_to + 1}-01-01'
+            GROUP BY GROUPING SETS ((year), (year, month), (year, category_name))
+        )
+        SELECT * FROM (
+            SELECT year, month, category_name, amount,
+                   CASE WHEN LAG(year) OVER w = year - 1
+                        THEN amount - LAG(amount) OVER w END AS yoy_delta,
+                   CASE WHEN LAG(year) OVER w = year - 1
+                        THEN round(100.0 * (amount - LAG(amount) OVER w)
+                                   / nullif(LAG(amount) OVER w, 0), 1)
+                   END AS yoy_percent
+            FROM totals
+            WINDOW w AS (PARTITION BY level, month, category_name ORDER BY year)
+        ) AS trend
+        WHERE year >= {year_from}
+        ORDER BY year, month, amount DESC, category_name
+        """
+        year = cast(func.extract("year", self.model.date), Integer)
+        month = cast(func.extract("month", self.model.date), Integer)
+        category_name = self.tx_categories_model.category_name
+        totals = (
             select(
+                year.label("year"),
+                month.label("month"),
+                category_name.label("category_name"),
                 func.sum(self.model.amount).label("amount"),
-                self.tx_categories_model.category_name,
-                func.extract("month", self.model.date).label("month"),
+                func.grouping(month, category_name).label("level"),
             )
             .join(
                 self.tx_categories_model,
                 self.model.category_id == self.tx_categories_model.id,
             )
             .where(
-                and_(
-                    self.model.user_id == user_id,
-                    func.extract("year", self.model.date) == year,
-                )
+                self.model.user_id == user_id,
+                self.model.date >= datetime(year_from - 1, 1, 1),
+                self.model.date < datetime(year_to + 1, 1, 1),
             )
             .group_by(
-                self.tx_categories_model.category_name,
-                func.extract("month", self.model.date),
+                func.grouping_sets(
+                    tuple_(year),
+                    tuple_(year, month),
+                    tuple_(year, category_name),
+                )
             )
+            .cte("totals")
+        )
+
+        partition_by = [totals.c.level, totals.c.month, totals.c.category_name]
+        previous_amount = func.lag(totals.c.amount).over(
+            partition_by=partition_by,
+            order_by=totals.c.year,
+        )
+        previous_year = func.lag(totals.c.year).over(
+            partition_by=partition_by,
+            order_by=totals.c.year,
+        )
+        has_previous_year = previous_year == totals.c.year - 1
+        trend = select(
+            totals.c.year,
+            totals.c.month,
+            totals.c.category_name,
+            totals.c.amount,
+            case(
+                (has_previous_year, totals.c.amount - previous_amount),
+            ).label("yoy_delta"),
+            case(
+                (
+                    has_previous_year,
+                    func.round(
+                        100.0
+                        * (totals.c.amount - previous_amount)
+                        / func.nullif(previous_amount, 0),
+                        1,
+                    ),
+                ),
+            ).label("yoy_percent"),
+        ).subquery("trend")
+        return (
+            select(trend)
+            .where(trend.c.year >= year_from)
             .order_by(
-                "month",
-                desc("amount"),
-                self.tx_categories_model.category_name,
+                trend.c.year,
+                trend.c.month,
+                trend.c.amount.desc(),
+                trend.c.category_name,
             )
         )
+
+    async def get_rolling_summary_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SRollingParams,
+    ) -> list[Row]:
+        """
+        result example: [(date(2025, 3, 2), 'Beer', 70, 210, Decimal('12.86'),
+                          Decimal('7.00'))]
+        designations: [(day, category name, day amount, month-to-date amount,
+                        average of each window in `params.windows` order)]
+        The category name is None unless the days are split by category.
+        """
+        query = self.make_rolling_summary_query(user_id, params)
         result = await session.execute(query)
-        return list(result)
+        return list(result.all())
 
-    async def get_monthly_summary_from_db(
+    def make_rolling_summary_query(
+        self,
+        user_id: int,
+        params: SRollingParams,
+    ) -> Select:
+        """
+        Amounts are summed per day and joined to the series of all the
+        days, so every window is a fixed number of rows. The averages and
+        the month-to-date totals are window functions over that series,
+        computed by the database in a single scan of the transactions:
+
+        WITH daily AS (
+            SELECT CAST(date AS DATE) AS day, SUM(amount) AS amount
+            FROM spendings
+            WHERE spendings.user_id = {user_id}
+              AND date >= '{read_from}' AND date < '{date_to + 1 day}'
+            GROUP BY day
+        )
+        SELECT * FROM (
+            SELECT '{read_from}' + series.day_number AS day,
+                   coalesce(daily.amount, 0) AS amount,
+                   SUM(coalesce(daily.amount, 0)) OVER (
+                       PARTITION BY date_trunc('month', '{read_from}' + day_number)
+                       ORDER BY series.day_number
+                   ) AS month_to_date,
+                   round(CAST(SUM(coalesce(daily.amount, 0)) OVER (
+                       ORDER BY series.day_number
+                       RANGE BETWEEN 6 PRECEDING AND CURRENT ROW
+                   ) AS NUMERIC) / 7, 2) AS avg_7,
+                   ...
+            FROM generate_series(0, {days}) AS series(day_number)
+            LEFT OUTER JOIN daily ON daily.day = '{read_from}' + day_number
+        ) AS rolling
+        WHERE day >= '{date_from}'
+        ORDER BY day
+
+        Split by category, the series is crossed with the categories that
+        have transactions in the range, and the windows are partitioned
+        by category.
+        """
+        read_from = params.read_from
+        days = (params.date_to - read_from).days
+        daily_columns: list[ColumnElement[Any]] = [
+            cast(self.model.date, Date).label("day")
+        ]
+        group_by: list[Any] = ["day"]
+        if params.split_by_category:
+            daily_columns.append(
+                self.tx_categories_model.category_name.label("category_name")
+            )
+            group_by.append(self.tx_categories_model.category_name)
+        daily_query = select(
+            *daily_columns,
+            func.sum(self.model.amount).label("amount"),
+        ).where(
+            self.model.user_id == user_id,
+            self.model.date >= datetime.combine(read_from, time()),
+            self.model.date
+            < datetime.combine(params.date_to + timedelta(days=1), time()),
+        )
+        if params.split_by_category:
+            daily_query = daily_query.join(
+                self.tx_categories_model,
+                self.model.category_id == self.tx_categories_model.id,
+            )
+        daily = daily_query.group_by(*group_by).cte("daily")
+
+        series = (
+            func.generate_series(0, days)
+            .table_valued("day_number")
+            .render_derived(name="series")
+        )
+        day = literal(read_from, Date) + series.c.day_number
+        join_on = daily.c.day == day
+        from_clause: Any = series
+        partition_by: list[Any] = []
+        category_name: ColumnElement = cast(
+            None, self.tx_categories_model.category_name.type
+        )
+        if params.split_by_category:
+            categories = select(daily.c.category_name).distinct().cte("categories")
+            from_clause = series.join(categories, true())
+            category_name = categories.c.category_name
+            join_on = and_(join_on, daily.c.category_name == category_name)
+            partition_by.append(category_name)
+
+        amount = func.coalesce(daily.c.amount, 0)
+        averages = [
+            func.round(
+                cast(
+                    func.sum(amount).over(
+                        partition_by=partition_by,
+                        order_by=series.c.day_number,
+                        range_=(-(window - 1), 0),
+                    ),
+                    Numeric,
+                )
+                / window,
+                2,
+            ).label(f"avg_{window}")
+            for window in params.windows
+        ]
+        rolling = (
+            select(
+                day.label("day"),
+                category_name.label("category_name"),
+                amount.label("amount"),
+                func.sum(amount)
+                .over(
+                    partition_by=[*partition_by, func.date_trunc("month", day)],
+                    order_by=series.c.day_number,
+                )
+                .label("month_to_date"),
+                *averages,
+            )
+            .select_from(from_clause)
+            .outerjoin(daily, join_on)
+            .subquery("rolling")
+        )
+        return (
+            select(rolling)
+            .where(rolling.c.day >= params.date_from)
+            .order_by(rolling.c.day, rolling.c.category_name)
+        )
+
+    async def get_stats_from_db(
         self,
         session: AsyncSession,
         user_id: int,
-        year: int,
-        month: int,
-    ) -> list:
+        params: SStatsParams,
+    ) -> list[Row]:
         """
-        SELECT SUM(amount) AS amount, category_name, EXTRACT(DAY FROM date) AS day
+        result example: [(date(2025, 3, 1), 'Beer', 12, 90, 150.0, 200.0,
+                          320.0, 410.0, 700)]
+        designations: [(month, category name, transactions count, min amount,
+                        25th, 50th, 75th and 90th percentiles, max amount)]
+        """
+        query = self.make_stats_query(user_id, params)
+        result = await session.execute(query)
+        return list(result.all())
+
+    def make_stats_query(
+        self,
+        user_id: int,
+        params: SStatsParams,
+    ) -> Select:
+        """
+        Postgres sorts the amounts of each group once for all the
+        percentile_cont aggregates, they have the same input:
+
+        SELECT CAST(date_trunc('month', date) AS DATE) AS month, category_name,
+               count(*), min(amount),
+               percentile_cont(0.25) WITHIN GROUP (ORDER BY amount) AS q1,
+               ...
+               max(amount)
         FROM spendings
         INNER JOIN users_spending_categories
            ON spendings.category_id = users_spending_categories.id
-        WHERE spendings.user_id=12
-          AND EXTRACT(YEAR FROM date)=2025
-          AND EXTRACT(MONTH FROM date)=3
-        GROUP BY category_name, EXTRACT(DAY FROM date)
-        ORDER BY day, amount DESC, category_name
+        WHERE spendings.user_id = {user_id}
+          AND date >= '{date_from}' AND date < '{date_to + 1 day}'
+        GROUP BY month, category_name
+        ORDER BY month, category_name
+        """
+        model = self._get_stats_source(params)
+        category_name = self.tx_categories_model.category_name
+        month = cast(func.date_trunc("month", model.date), Date)
+        percentiles = [
+            func.percentile_cont(fraction).within_group(model.amount).label(name)
+            for name, fraction in (
+                ("q1", 0.25),
+                ("median", 0.5),
+                ("q3", 0.75),
+                ("p90", 0.9),
+            )
+        ]
+        return (
+            select(
+                month.label("month"),
+                category_name,
+                func.count().label("count"),
+                func.min(model.amount).label("min"),
+                *percentiles,
+                func.max(model.amount).label("max"),
+            )
+            .join(
+                self.tx_categories_model,
+                model.category_id == self.tx_categories_model.id,
+            )
+            .where(*self._get_stats_filters(model, user_id, params))
+            .group_by("month", category_name)
+            .order_by("month", category_name)
+        )
 
-        result example: [(700, 'Beer', Decimal('1'))]
-        designations: [(summary amount, category name, day number)]
+    async def get_histograms_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SStatsParams,
+    ) -> list[Row]:
         """
-        query = (
+        result example: [('Beer', 90, 701, 1, 3), ('Beer', 90, 701, 10, 1)]
+        designations: [(category name, lowest bin edge, highest bin edge,
+                        bin number from 1 to `params.bins`, amounts count)]
+        Empty bins aren't returned.
+        """
+        query = self.make_histograms_query(user_id, params)
+        result = await session.execute(query)
+        return list(result.all())
+
+    def make_histograms_query(
+        self,
+        user_id: int,
+        params: SStatsParams,
+    ) -> Select:
+        """
+        The bins of a category span its amounts, the bounds come from
+        window functions, so the transactions are read once:
+
+        SELECT category_name, low, high,
+               width_bucket(amount, low, high, {bins}) AS bin, count(*)
+        FROM (
+            SELECT category_name, amount,
+                   min(amount) OVER (PARTITION BY category_name) AS low,
+                   max(amount) OVER (PARTITION BY category_name) + 1 AS high
+            FROM spendings
+            INNER JOIN users_spending_categories
+               ON spendings.category_id = users_spending_categories.id
+            WHERE ...
+        ) AS amounts
+        GROUP BY category_name, low, high, bin
+        ORDER BY category_name, bin
+        """
+        model = self._get_stats_source(params)
+        category_name = self.tx_categories_model.category_name
+        amounts = (
             select(
-                func.sum(self.model.amount).label("amount"),
-                self.tx_categories_model.category_name,
-                func.extract("day", self.model.date).label("day"),
+                category_name,
+                model.amount,
+                func.min(model.amount)
+                .over(partition_by=category_name)
+                .label("low"),
+                # the upper bound is excluded from the last bin
+                (
+                    func.max(model.amount).over(partition_by=category_name) + 1
+                ).label("high"),
             )
             .join(
                 self.tx_categories_model,
-                self.model.category_id == self.tx_categories_model.id,
+                model.category_id == self.tx_categories_model.id,
             )
-            .where(
-                and_(
-                    self.model.user_id == user_id,
-                    func.extract("year", self.model.date) == year,
-                    func.extract("month", self.model.date) == month,
-                )
+            .where(*self._get_stats_filters(model, user_id, params))
+            .subquery("amounts")
+        )
+        return (
+            select(
+                amounts.c.category_name,
+                amounts.c.low,
+                amounts.c.high,
+                func.width_bucket(
+                    amounts.c.amount,
+                    amounts.c.low,
+                    amounts.c.high,
+                    params.bins,
+                ).label("bin"),
+                func.count().label("count"),
             )
             .group_by(
-                self.tx_categories_model.category_name,
-                func.extract("day", self.model.date),
-            )
-            .order_by(
-                "day",
-                desc("amount"),
-                self.tx_categories_model.category_name,
+                amounts.c.category_name,
+                amounts.c.low,
+                amounts.c.high,
+                "bin",
             )
+            .order_by(amounts.c.category_name, "bin")
         )
-        result = await session.execute(query)
-        return list(result)
+
+    def _get_stats_source(self, params: SStatsParams) -> Any:
+        """
+        The transactions table, or a sample of its pages for the approximate
+        stats. The sample is repeatable, so the stats and the histograms
+        are computed from the same rows.
+        """
+        if params.sample_percent is None:
+            return self.model
+        return aliased(
+            self.model,
+            tablesample(
+                self.model,
+                func.system(cast(params.sample_percent, REAL)),
+                name="sampled",
+                seed=literal(0),
+            ),
+        )
+
+    @staticmethod
+    def _get_stats_filters(
+        model: Any,
+        user_id: int,
+        params: SStatsParams,
+    ) -> list[ColumnElement[bool]]:
+        return [
+            model.user_id == user_id,
+            model.date >= datetime.combine(params.date_from, time()),
+            model.date
+            < datetime.combine(params.date_to + timedelta(days=1), time()),
+        ]
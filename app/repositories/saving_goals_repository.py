@@ -1,6 +1,18 @@
 from datetime import date
+from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Numeric,
+    Row,
+    Select,
+    and_,
+    case,
+    cast,
+    func,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import SavingGoalsModel
@@ -17,6 +29,86 @@ class SavingGoalsRepository(BaseRepository[SavingGoalsModel]):
         self,
         session: AsyncSession,
         user_id: int,
+        **filters: Any,
+    ) -> list[SavingGoalsModel]:
+        """
+        filters: the filters and the sorting of `make_goals_query`.
+        """
+        query = self.make_goals_query(user_id, **filters)
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_goals_with_progress_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        today: date,
+        **filters: Any,
+    ) -> list[Row]:
+        """
+        result example: [(<SavingGoalsModel>, 300, 700, 30.0, 10, 70)]
+        designations: [(goal, rest amount, percentage progress, days left,
+                        expected daily payment)]
+        """
+        query = self.make_goals_query(user_id, **filters).add_columns(
+            *self.make_progress_columns(today)
+        )
+        result = await session.execute(query)
+        return list(result.all())
+
+    async def get_goals_progress_from_db(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        today: date,
+        **filters: Any,
+    ) -> list[Row]:
+        """
+        result example: [(12, 300, 1000, 700, 30.0, 10, 70)]
+        designations: [(goal id, current amount, target amount, rest amount,
+                        percentage progress, days left, expected daily payment)]
+        """
+        query = self.make_goals_query(user_id, **filters).with_only_columns(
+            self.model.id.label("goal_id"),
+            self.model.current_amount,
+            self.model.target_amount,
+            *self.make_progress_columns(today),
+        )
+        result = await session.execute(query)
+        return list(result.all())
+
+    def make_progress_columns(self, today: date) -> list[ColumnElement]:
+        """
+        The progress of a goal as of `today`, computed by the database
+        the same way SavingGoalsService.get_goal_progress does it.
+        """
+        rest_amount = self.model.target_amount - self.model.current_amount
+        days_left = func.abs(self.model.target_date - today)
+        return [
+            rest_amount.label("rest_amount"),
+            case(
+                (self.model.target_amount == 0, 0),
+                else_=func.round(
+                    cast(self.model.current_amount, Numeric)
+                    * 100
+                    / self.model.target_amount,
+                    2,
+                ),
+            ).label("percentage_progress"),
+            days_left.label("days_left"),
+            case(
+                (days_left == 0, rest_amount),
+                else_=cast(
+                    func.round(cast(rest_amount, Numeric) / days_left),
+                    Integer,
+                ),
+            ).label("expected_daily_payment"),
+        ]
+
+    def make_goals_query(
+        self,
+        user_id: int,
+        goal_ids: list[int] | None = None,
         min_current_amount: int | None = None,
         max_current_amount: int | None = None,
         min_target_amount: int | None = None,
@@ -31,10 +123,12 @@ class SavingGoalsRepository(BaseRepository[SavingGoalsModel]):
         end_date_to: date | None = None,
         status: GoalStatus | None = None,
         sort_params: list[SortParam] | None = None,
-    ) -> list[SavingGoalsModel]:
+    ) -> Select:
         query = select(self.model).where(self.model.user_id == user_id)
 
-        filters = []
+        filters: list[ColumnElement[bool]] = []
+        if goal_ids is not None:
+            filters.append(self.model.id.in_(goal_ids))
         if min_current_amount:
             filters.append(self.model.current_amount >= min_current_amount)
         if max_current_amount:
@@ -75,9 +169,7 @@ class SavingGoalsRepository(BaseRepository[SavingGoalsModel]):
                     query = query.order_by(
                         getattr(self.model, param.order_by).desc()
                     )
-
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        return query
 
 
 saving_goals_repo = SavingGoalsRepository()
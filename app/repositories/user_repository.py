@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import UserModel
@@ -14,7 +14,13 @@ class UserRepository(BaseRepository[UserModel]):
         session: AsyncSession,
         username: str,
     ) -> UserModel | None:
-        query = select(self.model).filter(self.model.username.ilike(username))
+        """
+        Runs on every sign in, so it's a lambda statement: built and
+        compiled once, only the username is bound on later calls.
+        """
+        query = lambda_stmt(
+            lambda: select(UserModel).where(UserModel.username.ilike(username))
+        )
         user = await session.execute(query)
         return user.scalar_one_or_none()
 
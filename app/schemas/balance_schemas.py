@@ -0,0 +1,20 @@
+from datetime import date
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+BalancePeriod = Literal["day", "month", "year"]
+
+
+class SBalance(BaseModel):
+    """
+    Income, spendings and their difference over a period,
+    which starts on `period_start`.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    period_start: date
+    income: int
+    spendings: int
+    net: int
@@ -0,0 +1,44 @@
+from datetime import date
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+ChartFormat = Literal["png", "svg", "webp"]
+
+CHART_MEDIA_TYPES: dict[ChartFormat, str] = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "webp": "image/webp",
+}
+
+
+class SChartRenderParams(BaseModel):
+    format: ChartFormat = "png"
+    dpi: int | None = Field(None, ge=30, le=600)
+
+    @property
+    def media_type(self) -> str:
+        return CHART_MEDIA_TYPES[self.format]
+
+
+class SChartJob(BaseModel):
+    job_id: str
+    status: Literal["pending", "done", "failed"]
+
+
+class SCategoriesChartData(BaseModel):
+    categories: list[str]
+    amounts: list[int]
+
+
+class SPeriodsChartData(BaseModel):
+    """
+    A period × category matrix: `values[i][j]` is the amount
+    of `categories[i]` in `periods[j]`. Periods are month or day numbers,
+    or the start dates of time buckets.
+    """
+
+    periods: list[int] | list[date]
+    categories: list[str]
+    values: list[list[int]]
+    totals: list[int]
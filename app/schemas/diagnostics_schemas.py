@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class SPoolStats(BaseModel):
+    """
+    Connections of an engine's pool. Only a queue pool reports them,
+    `overflow` is negative while the pool isn't full yet.
+    """
+
+    engine: str
+    host: str | None
+    pool_class: str
+    size: int | None = None
+    checked_in: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
@@ -119,5 +119,13 @@ class SSavingGoalProgress(BaseModel):
     expected_daily_payment: int
 
 
+class SSavingGoalProgressItem(SSavingGoalProgress):
+    goal_id: int
+
+
+class SSavingGoalWithProgress(SSavingGoalResponse):
+    progress: SSavingGoalProgress
+
+
 class SGoalsSortParams(SSortParamsBase):
     allowed_fields: dict = SSavingGoalResponse.model_fields
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Literal
 
 from pydantic import (
     BaseModel,
@@ -90,3 +91,181 @@ class DayTransactionsSummaryCSV(BaseModel):
     category_name: str
     amount: int
     total_amount: int
+
+
+BucketGranularity = Literal["day", "week", "month", "quarter", "year", "custom"]
+
+# Postgres intervals between bucket starts, `custom` buckets are `bucket_days`
+BUCKET_STEPS: dict[BucketGranularity, str] = {
+    "day": "1 day",
+    "week": "1 week",
+    "month": "1 month",
+    "quarter": "3 months",
+    "year": "1 year",
+}
+# The shortest bucket of each granularity, to estimate the buckets number
+BUCKET_MIN_DAYS: dict[BucketGranularity, int] = {
+    "day": 1,
+    "week": 7,
+    "month": 28,
+    "quarter": 90,
+    "year": 365,
+}
+
+
+class SBucketsParams(BaseModel):
+    """
+    Time buckets of a summary: calendar periods truncated like Postgres
+    `date_trunc` does (weeks start on Monday), or `custom` buckets
+    of `bucket_days` counted from `date_from`.
+    """
+
+    granularity: BucketGranularity = "month"
+    date_from: date
+    date_to: date
+    bucket_days: int | None = Field(None, ge=1)
+    split_by_category: bool = False
+
+    @property
+    def step(self) -> str:
+        if self.granularity == "custom":
+            return f"{self.bucket_days} days"
+        return BUCKET_STEPS[self.granularity]
+
+    @property
+    def first_bucket_start(self) -> date:
+        day = self.date_from
+        if self.granularity == "week":
+            return day - timedelta(days=day.weekday())
+        if self.granularity == "month":
+            return day.replace(day=1)
+        if self.granularity == "quarter":
+            return date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+        if self.granularity == "year":
+            return date(day.year, 1, 1)
+        return day
+
+    def estimate_buckets_count(self) -> int:
+        days = (self.date_to - self.first_bucket_start).days
+        bucket_days = self.bucket_days or BUCKET_MIN_DAYS[self.granularity]
+        return days // bucket_days + 1
+
+
+class BucketTransactionsSummary(BasePeriodTransactionsSummary):
+    """
+    A bucket starting on `bucket_start`, its `summary` is split
+    by category on request only.
+    """
+
+    bucket_start: date
+
+
+class STrendParams(BaseModel):
+    year_from: int
+    year_to: int
+
+
+class BaseTrendTotal(BaseModel):
+    """
+    A total with its change since the same period of the previous year,
+    None when there were no transactions then.
+    """
+
+    total_amount: int
+    yoy_delta: int | None = None
+    yoy_percent: float | None = None
+
+
+class MonthTrendTotal(BaseTrendTotal):
+    month_number: int
+
+
+class CategoryTrendTotal(BaseTrendTotal):
+    category_name: str
+
+
+class YearTransactionsTrend(BaseTrendTotal):
+    year: int
+    months: list[MonthTrendTotal]
+    categories: list[CategoryTrendTotal]
+
+
+class SRollingParams(BaseModel):
+    """
+    Daily totals of `date_from`..`date_to` with their moving averages
+    over each of `windows` days, and by category if requested.
+    """
+
+    date_from: date
+    date_to: date
+    windows: list[int] = [7, 30, 90]
+    split_by_category: bool = False
+
+    @property
+    def read_from(self) -> date:
+        """
+        The first day the averages and the month-to-date totals
+        of the range depend on.
+        """
+        return min(
+            self.date_from - timedelta(days=max(self.windows) - 1),
+            self.date_from.replace(day=1),
+        )
+
+
+class DayRollingSummary(BaseModel):
+    """
+    `averages` are daily averages over the last N days, the day included,
+    by window size N. Days without transactions count as zeros.
+    """
+
+    day: date
+    category_name: str | None = None
+    amount: int
+    month_to_date: int
+    averages: dict[int, float]
+
+
+class SStatsParams(BaseModel):
+    """
+    With `sample_percent` the stats are approximate, computed from about
+    that percent of the table pages.
+    """
+
+    date_from: date
+    date_to: date
+    bins: int = Field(10, ge=1, le=50)
+    sample_percent: float | None = Field(None, gt=0, le=100)
+
+
+class CategoryMonthStats(BaseModel):
+    """
+    The distribution of single transaction amounts of a category in a month.
+    """
+
+    month: date
+    category_name: str
+    count: int
+    min: int
+    q1: float
+    median: float
+    q3: float
+    p90: float
+    max: int
+
+
+class CategoryHistogram(BaseModel):
+    """
+    `counts` of the amounts in `bins` equal bins between the category's
+    smallest and largest amounts, `bin_edges` has one more item.
+    """
+
+    category_name: str
+    bin_edges: list[float]
+    counts: list[int]
+
+
+class STransactionsStats(BaseModel):
+    sample_percent: float | None = None
+    stats: list[CategoryMonthStats]
+    histograms: list[CategoryHistogram]
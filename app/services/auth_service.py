@@ -1,17 +1,39 @@
+import asyncio
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import cache
+from typing import Any, Callable, TypeVar
 
 import bcrypt
 import jwt
 
 from app.core.config import settings
+from app.exceptions.auth_exceptions import PasswordHashingOverloaded
+from app.services.jwt_key_ring import JWTKeyRing
+
+T = TypeVar("T")
+
+# bcrypt releases the GIL, so hashing in threads keeps the event loop free.
+_password_hashing_executor = ThreadPoolExecutor(
+    max_workers=settings.auth.password_hashing_workers,
+    thread_name_prefix="password-hashing",
+)
+_password_hashing_limiter = asyncio.Semaphore(
+    settings.auth.password_hashing_max_pending,
+)
+
+
+@cache
+def get_jwt_key_ring() -> JWTKeyRing:
+    return JWTKeyRing.from_config(settings.auth)
 
 
 def create_access_token(
     payload: dict,
-    private_key: str = settings.auth.private_key_path.read_text(),
-    algorithm: str = settings.auth.algorithm,
+    key_ring: JWTKeyRing | None = None,
 ) -> str:
+    signing_key = (key_ring or get_jwt_key_ring()).signing_key
     to_encode = payload.copy()
     iat = datetime.now(UTC).timestamp()
     expire = iat + settings.auth.access_token_expires_sec
@@ -21,29 +43,73 @@ def create_access_token(
     )
     encoded_jwt = jwt.encode(
         payload=to_encode,
-        key=private_key,
-        algorithm=algorithm,
+        key=signing_key.private_key,
+        algorithm=signing_key.algorithm,
+        headers={"kid": signing_key.kid},
     )
     return encoded_jwt
 
 
 def decode_access_token(
     token: str | bytes,
-    public_key: str = settings.auth.public_key_path.read_text(),
-    algorithm: str = settings.auth.algorithm,
+    key_ring: JWTKeyRing | None = None,
 ) -> dict:
-    decoded = jwt.decode(jwt=token, key=public_key, algorithms=[algorithm])
+    kid = jwt.get_unverified_header(token).get("kid")
+    key = (key_ring or get_jwt_key_ring()).get_verification_key(kid)
+    decoded = jwt.decode(
+        jwt=token,
+        key=key.public_key,
+        algorithms=[key.algorithm],
+    )
     return decoded
 
 
 def hash_password(password: str) -> bytes:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+    salt = bcrypt.gensalt(rounds=settings.auth.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt)
 
 
 def verify_password(password: str, hashed_password: bytes) -> bool:
     return bcrypt.checkpw(password.encode(), hashed_password)
 
 
+async def hash_password_async(password: str) -> bytes:
+    return await _run_password_hashing(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: bytes) -> bool:
+    return await _run_password_hashing(verify_password, password, hashed_password)
+
+
+async def _run_password_hashing(func: Callable[..., T], *args: Any) -> T:
+    """
+    Runs bcrypt in the bounded thread pool.
+
+    At most `password_hashing_max_pending` calls may wait for the pool,
+    the rest are rejected after `password_hashing_wait_sec`, so a login
+    storm can't pile up and take the whole worker down with it.
+    """
+    try:
+        async with asyncio.timeout(settings.auth.password_hashing_wait_sec):
+            await _password_hashing_limiter.acquire()
+    except TimeoutError:
+        raise PasswordHashingOverloaded
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _password_hashing_executor,
+            func,
+            *args,
+        )
+    finally:
+        _password_hashing_limiter.release()
+
+
+def shutdown_password_hashing() -> None:
+    _password_hashing_executor.shutdown(wait=True, cancel_futures=True)
+
+
 def validate_username(username: str) -> bool:
     valid_pattern = re.compile(r"^[a-zA-Z0-9_]{3,24}$")
     return bool(valid_pattern.match(username))
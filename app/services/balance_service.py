@@ -0,0 +1,100 @@
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.unit_of_work import release_connection
+from app.repositories import balance_repo
+from app.repositories.balance_repository import BalanceRepository
+from app.schemas.balance_schemas import BalancePeriod, SBalance
+from app.schemas.charts_schemas import SChartRenderParams
+from app.schemas.common_schemas import SDatetimeRange
+from app.services.base_transactions_service import TransactionsService
+from app.services.chart_jobs import ChartRequest
+
+PERIOD_LABEL_FORMATS: dict[BalancePeriod, str] = {
+    "day": "%Y-%m-%d",
+    "month": "%Y-%m",
+    "year": "%Y",
+}
+
+
+class BalanceService:
+    def __init__(self, balance_repo: BalanceRepository) -> None:
+        self.balance_repo = balance_repo
+
+    async def get_balance(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        period: BalancePeriod,
+        datetime_range: SDatetimeRange | None = None,
+    ) -> list[SBalance]:
+        """
+        Returns income, spendings and net per period, periods without
+        transactions are left out.
+        """
+        datetime_range = datetime_range or SDatetimeRange()
+        balance = await self.balance_repo.get_balance_from_db(
+            session=session,
+            user_id=user_id,
+            period=period,
+            datetime_from=datetime_range.start,
+            datetime_to=datetime_range.end,
+        )
+        return [SBalance.model_validate(row) for row in balance]
+
+    async def get_balance_chart(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        period: BalancePeriod,
+        datetime_range: SDatetimeRange | None = None,
+        render_params: SChartRenderParams | None = None,
+    ) -> bytes:
+        chart = await self.prepare_balance_chart(
+            session, user_id, period, datetime_range
+        )
+        await release_connection(session)
+        [rendered_chart] = await TransactionsService.rpc_call_many(
+            [chart.with_render_params(render_params)]
+        )
+        return rendered_chart
+
+    async def prepare_balance_chart(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        period: BalancePeriod,
+        datetime_range: SDatetimeRange | None = None,
+    ) -> ChartRequest:
+        balance = await self.get_balance(session, user_id, period, datetime_range)
+        return self.make_balance_chart(balance, period)
+
+    @staticmethod
+    def make_balance_chart(
+        balance: list[SBalance],
+        period: BalancePeriod,
+    ) -> ChartRequest:
+        return ChartRequest(
+            "create_balance_chart",
+            dict(
+                labels=[
+                    get_period_label(record.period_start, period)
+                    for record in balance
+                ],
+                income=[record.income for record in balance],
+                spendings=[record.spendings for record in balance],
+                net=[record.net for record in balance],
+                title=f"Balance by {period}",
+                xlabel=period.capitalize(),
+                width=min(max(9, len(balance) // 3), 30),
+                height=5,
+            ),
+        )
+
+
+def get_period_label(period_start: date, period: BalancePeriod) -> str:
+    return period_start.strftime(PERIOD_LABEL_FORMATS[period])
+
+
+balance_service = BalanceService(balance_repo=balance_repo)
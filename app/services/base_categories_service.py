@@ -1,7 +1,9 @@
+from functools import partial
 from typing import Iterable, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.unit_of_work import call_after_commit, save_changes
 from app.exceptions.categories_exceptions import (
     CannotDeleteDefaultCategory,
     CategoryAlreadyExists,
@@ -18,6 +20,7 @@ from app.schemas.transaction_category_schemas import (
     STransactionCategoryUpdate,
     TransactionsOnDeleteActions,
 )
+from app.services.categories_cache import CategoriesCache
 
 
 class BaseCategoriesService:
@@ -25,11 +28,13 @@ class BaseCategoriesService:
         self,
         category_repo: BaseCategoriesRepository,
         transaction_repo: BaseTransactionsRepository,
+        categories_cache: CategoriesCache,
         default_category_name: str,
         out_schema: Type[STransactionCategoryOut],
     ) -> None:
         self.category_repo = category_repo
         self.transaction_repo = transaction_repo
+        self.categories_cache = categories_cache
         self.default_category_name = default_category_name
         self.out_schema = out_schema
 
@@ -68,13 +73,19 @@ class BaseCategoriesService:
         category_name: str,
         session: AsyncSession,
     ) -> STransactionCategoryOut:
-        category = await self.get_category(user_id, category_name, session)
-        if category:
+        category_id = await self.categories_cache.get_category_id(
+            user_id,
+            category_name,
+            session,
+            verify=True,
+        )
+        if category_id is not None:
             raise CategoryAlreadyExists
         category = await self.category_repo.add(
             session,
             dict(user_id=user_id, category_name=category_name),
         )
+        self._invalidate_cache_after_commit(user_id, session)
         return self.out_schema.model_validate(category)
 
     async def get_user_categories(
@@ -107,21 +118,30 @@ class BaseCategoriesService:
         category_update_obj: STransactionCategoryUpdate,
         session: AsyncSession,
     ) -> STransactionCategoryOut:
-        category = await self.get_category(user_id, category_name, session)
-        if not category:
+        category_id = await self.categories_cache.get_category_id(
+            user_id,
+            category_name,
+            session,
+            verify=True,
+        )
+        if category_id is None:
             raise CategoryNotFound
 
-        new_category = await self.get_category(
-            user_id, category_update_obj.category_name, session
+        new_category_id = await self.categories_cache.get_category_id(
+            user_id,
+            category_update_obj.category_name,
+            session,
+            verify=True,
         )
-        if new_category:
+        if new_category_id is not None:
             raise CategoryAlreadyExists
 
         updated_category = await self.category_repo.update(
             session=session,
-            object_id=category.id,
+            object_id=category_id,
             params=dict(category_name=category_update_obj.category_name),
         )
+        self._invalidate_cache_after_commit(user_id, session)
         return self.out_schema.model_validate(updated_category)
 
     async def delete_category(
@@ -135,14 +155,17 @@ class BaseCategoriesService:
         if category_name.capitalize() == self.default_category_name:
             raise CannotDeleteDefaultCategory
 
-        category_for_delete = await self.get_category(
-            user_id, category_name, session
+        category_for_delete_id = await self.categories_cache.get_category_id(
+            user_id,
+            category_name,
+            session,
+            verify=True,
         )
-        if category_for_delete is None:
+        if category_for_delete_id is None:
             raise CategoryNotFound
 
         transactions = await self.transaction_repo.get_all(
-            session, dict(category_id=category_for_delete.id, user_id=user_id)
+            session, dict(category_id=category_for_delete_id, user_id=user_id)
         )
 
         if transactions_actions == TransactionsOnDeleteActions.DELETE:
@@ -164,20 +187,34 @@ class BaseCategoriesService:
                     new_category_name,
                     session,
                 )
-            category = await self.get_category(
+            category_id = await self.categories_cache.get_category_id(
                 user_id,
                 new_category_name,
                 session,
+                verify=True,
             )
-            if category is None:
+            if category_id is None:
                 raise CategoryNotFound
 
             await self._change_transactions_category(
                 transactions,
-                category.id,
+                category_id,
                 session,
             )
-        await self.category_repo.delete(session, category_for_delete.id)
+        await self.category_repo.delete(session, category_for_delete_id)
+        self._invalidate_cache_after_commit(user_id, session)
+
+    def _invalidate_cache_after_commit(
+        self,
+        user_id: int,
+        session: AsyncSession,
+    ) -> None:
+        # Before the commit other requests still read the old categories,
+        # and could cache them again right after an earlier invalidation.
+        call_after_commit(
+            session,
+            partial(self.categories_cache.invalidate, user_id),
+        )
 
     async def _change_transactions_category(
         self,
@@ -199,4 +236,4 @@ class BaseCategoriesService:
             if transaction_in_db:
                 transaction_in_db.category_id = new_category_id
 
-        await session.commit()
+        await save_changes(session)
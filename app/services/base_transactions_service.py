@@ -1,12 +1,17 @@
+import asyncio
 import calendar
+import logging
+import math
 from collections import defaultdict
+from datetime import date
 from typing import Any, Sequence, Type
 
 from aio_pika import connect_robust
-from aio_pika.patterns import RPC
+from aio_pika.exceptions import AMQPError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.db.unit_of_work import release_connection
 from app.exceptions.categories_exceptions import (
     CategoryNotFound,
 )
@@ -15,6 +20,11 @@ from app.repositories import (
     BaseCategoriesRepository,
     BaseTransactionsRepository,
 )
+from app.schemas.charts_schemas import (
+    SCategoriesChartData,
+    SChartRenderParams,
+    SPeriodsChartData,
+)
 from app.schemas.common_schemas import (
     SAmountRange,
     SDatetimeRange,
@@ -22,19 +32,50 @@ from app.schemas.common_schemas import (
 from app.schemas.transaction_category_schemas import SCategoryQueryParams
 from app.schemas.transactions_schemas import (
     BasePeriodTransactionsSummary,
+    BaseTrendTotal,
+    BucketTransactionsSummary,
+    CategoryHistogram,
+    CategoryMonthStats,
+    CategoryTrendTotal,
+    DayRollingSummary,
     DayTransactionsSummary,
     DayTransactionsSummaryCSV,
     MonthTransactionsSummary,
     MonthTransactionsSummaryCSV,
+    MonthTrendTotal,
+    SBucketsParams,
+    SRollingParams,
+    SStatsParams,
     STransactionCreate,
     STransactionCreateInDB,
     STransactionResponse,
     STransactionsSortParams,
+    STransactionsStats,
     STransactionsSummary,
     STransactionUpdatePartial,
     STransactionUpdatePartialInDB,
+    STrendParams,
+    YearTransactionsTrend,
+)
+from app.services.categories_cache import CategoriesCache
+from app.services.chart_jobs import (
+    DEFAULT_CHART_PRIORITY,
+    SPLIT_CHART_PRIORITY,
+    ChartRequest,
+    chart_jobs_client,
+)
+from app.services.charts_fallback import (
+    charts_breaker,
+    get_fallback_chart,
+    rendered_charts_cache,
 )
 from app.services.common_service import parse_sort_params_for_query
+from charts_service.rpc import ChartsRPC
+
+logger = logging.getLogger(__name__)
+
+# charts_service is down, unreachable or too busy to answer in time
+CHARTS_UNAVAILABLE_ERRORS = (TimeoutError, AMQPError, OSError)
 
 
 class TransactionsService:
@@ -42,6 +83,7 @@ class TransactionsService:
         self,
         tx_repo: BaseTransactionsRepository,
         tx_categories_repo: BaseCategoriesRepository,
+        categories_cache: CategoriesCache,
         default_tx_category_name: str,
         creation_schema: Type[STransactionCreate],
         creation_in_db_schema: Type[STransactionCreateInDB],
@@ -50,6 +92,7 @@ class TransactionsService:
     ) -> None:
         self.tx_repo = tx_repo
         self.tx_categories_repo = tx_categories_repo
+        self.categories_cache = categories_cache
         self.default_tx_category_name = default_tx_category_name
         self.creation_schema = creation_schema
         self.creation_in_db_schema = creation_in_db_schema
@@ -65,7 +108,20 @@ class TransactionsService:
         category_name = transaction.category_name
         if not category_name:
             category_name = self.default_tx_category_name
-        category_id = await self._get_category_id(user_id, category_name, session)
+        category_id = await self._get_category_id(
+            user_id,
+            category_name,
+            session,
+            verify=True,
+        )
+        # Categories are matched case-insensitively, respond with the stored
+        # name rather than the one the user typed. Looked up before the insert,
+        # while the cached map can still be used.
+        stored_category_name = await self.categories_cache.get_category_name(
+            user_id,
+            category_id,
+            session,
+        )
         transaction_to_create = self.creation_in_db_schema(
             amount=transaction.amount,
             description=transaction.description,
@@ -78,7 +134,7 @@ class TransactionsService:
             transaction_to_create.model_dump(),
         )
         transaction_out = self.out_schema.model_validate(transaction_from_db)
-        transaction_out.category_name = category_name
+        transaction_out.category_name = stored_category_name or category_name
         return transaction_out
 
     async def update_transaction(
@@ -88,44 +144,38 @@ class TransactionsService:
         transaction_update_obj: STransactionUpdatePartial,
         session: AsyncSession,
     ) -> STransactionResponse:
-        transaction = await self.tx_repo.get_transaction_with_category(
-            session,
-            transaction_id,
-        )
-        if not transaction or transaction.user_id != user_id:
-            raise TransactionNotFound
-
         transaction_to_update = self.update_partial_in_db_schema(
             amount=transaction_update_obj.amount,
             description=transaction_update_obj.description,
             date=transaction_update_obj.date,
         )
+        update_params = transaction_to_update.model_dump(exclude_none=True)
 
         new_cat_name = transaction_update_obj.category_name
         if new_cat_name:
             new_cat_name = new_cat_name.strip()
-            if new_cat_name != transaction.category.category_name:
-                new_category = await self.tx_categories_repo.get_category(
-                    session=session,
-                    user_id=user_id,
-                    category_name=new_cat_name,
-                )
-                if new_category is None:
-                    raise CategoryNotFound
-                transaction.category_id = new_category.id
-                await session.commit()
-                await session.refresh(transaction)
 
-        updated_transaction = await self.tx_repo.update(
-            session,
-            transaction_id,
-            transaction_to_update.model_dump(exclude_none=True),
+        if not update_params and not new_cat_name:
+            return await self.get_transaction(transaction_id, user_id, session)
+
+        updated_transaction = await self.tx_repo.update_transaction_with_category(
+            session=session,
+            transaction_id=transaction_id,
+            user_id=user_id,
+            params=update_params,
+            category_name=new_cat_name or None,
         )
+        if updated_transaction is None:
+            # Nothing was updated, find out which of the two lookups failed.
+            transaction = await self.tx_repo.get(session, transaction_id)
+            if not transaction or transaction.user_id != user_id:
+                raise TransactionNotFound
+            raise CategoryNotFound
 
         transaction_out = self.out_schema(
             amount=updated_transaction.amount,
             description=updated_transaction.description,
-            category_name=transaction.category.category_name,
+            category_name=updated_transaction.category_name,
             date=updated_transaction.date,
             id=updated_transaction.id,
         )
@@ -168,15 +218,17 @@ class TransactionsService:
         user_id: int,
         category_name: str,
         session: AsyncSession,
+        verify: bool = False,
     ) -> int:
-        category = await self.tx_categories_repo.get_category(
-            session=session,
-            user_id=user_id,
-            category_name=category_name,
+        category_id = await self.categories_cache.get_category_id(
+            user_id,
+            category_name,
+            session,
+            verify=verify,
         )
-        if not category:
+        if category_id is None:
             raise CategoryNotFound
-        return category.id
+        return category_id
 
     async def get_transactions(
         self,
@@ -188,6 +240,32 @@ class TransactionsService:
         datetime_range: SDatetimeRange | None = None,
         sort_params: STransactionsSortParams | None = None,
     ) -> list[STransactionResponse]:
+        transactions = await self.get_transactions_rows(
+            session=session,
+            user_id=user_id,
+            categories_params=categories_params,
+            amount_params=amount_params,
+            search_term=search_term,
+            datetime_range=datetime_range,
+            sort_params=sort_params,
+        )
+        return [self.out_schema.model_validate(tx) for tx in transactions]
+
+    async def get_transactions_rows(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        categories_params: list[SCategoryQueryParams],
+        amount_params: SAmountRange | None = None,
+        search_term: str | None = None,
+        datetime_range: SDatetimeRange | None = None,
+        sort_params: STransactionsSortParams | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Returns transactions as dicts in the shape of the `out_schema`,
+        ready to be encoded with orjson. Response models aren't built,
+        since the rows already come out of the database in the right shape.
+        """
         categories_ids = await self._extract_category_ids(
             session=session,
             user_id=user_id,
@@ -199,7 +277,7 @@ class TransactionsService:
         else:
             parsed_sort_params = None
 
-        transactions = await self.tx_repo.get_transactions_from_db(
+        transactions = await self.tx_repo.get_transactions_rows_from_db(
             session=session,
             user_id=user_id,
             categories_ids=categories_ids if categories_ids else None,
@@ -210,17 +288,7 @@ class TransactionsService:
             datetime_from=datetime_range.start if datetime_range else None,
             datetime_to=datetime_range.end if datetime_range else None,
         )
-        result = []
-        for transaction in transactions:
-            transaction_out = self.out_schema(
-                amount=transaction.amount,
-                category_name=transaction.category.category_name,
-                description=transaction.description,
-                date=transaction.date,
-                id=transaction.id,
-            )
-            result.append(transaction_out)
-        return result
+        return [tx._asdict() for tx in transactions]
 
     async def get_summary(
         self,
@@ -240,7 +308,7 @@ class TransactionsService:
             categories_params=categories_params,
         )
 
-        transactions = await self.tx_repo.get_transactions_from_db(
+        transactions = await self.tx_repo.get_transactions_rows_from_db(
             session=session,
             user_id=user_id,
             categories_ids=categories_ids if categories_ids else None,
@@ -250,16 +318,7 @@ class TransactionsService:
             datetime_from=datetime_range.start if datetime_range else None,
             datetime_to=datetime_range.end if datetime_range else None,
         )
-        tx_out = []
-        for transaction in transactions:
-            transaction_out = self.out_schema(
-                amount=transaction.amount,
-                category_name=transaction.category.category_name,
-                description=transaction.description,
-                date=transaction.date,
-                id=transaction.id,
-            )
-            tx_out.append(transaction_out)
+        tx_out = [self.out_schema.model_validate(tx) for tx in transactions]
 
         summary = self._summarize(tx_out)
         summary = self._sort_summarize(summary)
@@ -275,7 +334,31 @@ class TransactionsService:
         amount_params: SAmountRange | None = None,
         search_term: str | None = None,
         datetime_range: SDatetimeRange | None = None,
+        render_params: SChartRenderParams | None = None,
     ) -> bytes:
+        chart = await self.prepare_summary_chart(
+            session=session,
+            user_id=user_id,
+            categories_params=categories_params,
+            chart_type=chart_type,
+            amount_params=amount_params,
+            search_term=search_term,
+            datetime_range=datetime_range,
+        )
+        return await self.render_chart(
+            session, chart.with_render_params(render_params)
+        )
+
+    async def prepare_summary_chart(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        categories_params: list[SCategoryQueryParams],
+        chart_type: str | None = None,
+        amount_params: SAmountRange | None = None,
+        search_term: str | None = None,
+        datetime_range: SDatetimeRange | None = None,
+    ) -> ChartRequest:
         summary = await self.get_summary(
             session=session,
             user_id=user_id,
@@ -284,22 +367,50 @@ class TransactionsService:
             search_term=search_term,
             datetime_range=datetime_range,
         )
-        categories = []
-        amounts = []
-        for s in summary:
-            categories.append(s.category_name)
-            amounts.append(s.amount)
+        return self.make_summary_chart(summary, chart_type)
 
-        result = await self.rpc_call(
+    def make_summary_chart(
+        self,
+        summary: list[STransactionsSummary],
+        chart_type: str | None = None,
+    ) -> ChartRequest:
+        chart_data = self.make_categories_chart_data(summary)
+        return ChartRequest(
             "create_simple_chart",
             dict(
-                values=amounts,
-                labels=categories,
+                values=chart_data.amounts,
+                labels=chart_data.categories,
                 chart_type=chart_type or "barplot",
             ),
         )
 
-        return result
+    async def get_summary_chart_data(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        categories_params: list[SCategoryQueryParams],
+        amount_params: SAmountRange | None = None,
+        search_term: str | None = None,
+        datetime_range: SDatetimeRange | None = None,
+    ) -> SCategoriesChartData:
+        summary = await self.get_summary(
+            session=session,
+            user_id=user_id,
+            categories_params=categories_params,
+            amount_params=amount_params,
+            search_term=search_term,
+            datetime_range=datetime_range,
+        )
+        return self.make_categories_chart_data(summary)
+
+    @staticmethod
+    def make_categories_chart_data(
+        summary: list[STransactionsSummary],
+    ) -> SCategoriesChartData:
+        return SCategoriesChartData(
+            categories=[s.category_name for s in summary],
+            amounts=[s.amount for s in summary],
+        )
 
     async def get_annual_summary(
         self,
@@ -340,9 +451,54 @@ class TransactionsService:
         year: int,
         transactions_type: str,
         split_by_category: bool,
-    ):
+        render_params: SChartRenderParams | None = None,
+    ) -> bytes:
+        chart = await self.prepare_annual_summary_chart(
+            session, user_id, year, transactions_type, split_by_category
+        )
+        return await self.render_chart(
+            session, chart.with_render_params(render_params)
+        )
+
+    async def prepare_annual_summary_chart(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+        transactions_type: str,
+        split_by_category: bool,
+    ) -> ChartRequest:
         annual_summary = await self.get_annual_summary(session, user_id, year)
+        return self.make_annual_summary_chart(
+            annual_summary, year, transactions_type, split_by_category
+        )
 
+    async def get_annual_summary_chart_data(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+    ) -> SPeriodsChartData:
+        annual_summary = await self.get_annual_summary(session, user_id, year)
+        return self.make_annual_chart_data(annual_summary)
+
+    def make_annual_chart_data(
+        self,
+        annual_summary: list[MonthTransactionsSummary],
+    ) -> SPeriodsChartData:
+        return self._make_periods_chart_data(
+            annual_summary,
+            periods=list(range(1, 13)),
+            period_field="month_number",
+        )
+
+    def make_annual_summary_chart(
+        self,
+        annual_summary: list[MonthTransactionsSummary],
+        year: int,
+        transactions_type: str,
+        split_by_category: bool,
+    ) -> ChartRequest:
         months = list(range(1, 13))
         amounts = [0] * len(months)
         rpc_params: dict[str, Any] = {
@@ -352,12 +508,10 @@ class TransactionsService:
             "height": 5,
         }
         if split_by_category:
-            categories = self._get_categories_from_summary(annual_summary)
-            prepared_data = self._prepare_data_for_chart_with_categories_split(
-                annual_summary, categories
-            )
+            chart_data = self.make_annual_chart_data(annual_summary)
             rpc_method_name = "create_annual_chart_with_categories"
-            rpc_params.update(dict(data=prepared_data, categories=categories))
+            rpc_params.update(chart_data.model_dump())
+            priority = SPLIT_CHART_PRIORITY
 
         else:
             total_amounts = amounts.copy()
@@ -365,9 +519,9 @@ class TransactionsService:
                 total_amounts[record.month_number - 1] = record.total_amount
             rpc_method_name = "create_simple_bar_chart"
             rpc_params.update(dict(values=total_amounts))
+            priority = DEFAULT_CHART_PRIORITY
 
-        result = await self.rpc_call(rpc_method_name, rpc_params)
-        return result
+        return ChartRequest(rpc_method_name, rpc_params, priority)
 
     async def get_monthly_summary(
         self,
@@ -411,11 +565,64 @@ class TransactionsService:
         month: int,
         transactions_type: str,
         split_by_category: bool,
-    ):
+        render_params: SChartRenderParams | None = None,
+    ) -> bytes:
+        chart = await self.prepare_monthly_summary_chart(
+            session, user_id, year, month, transactions_type, split_by_category
+        )
+        return await self.render_chart(
+            session, chart.with_render_params(render_params)
+        )
+
+    async def prepare_monthly_summary_chart(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int,
+        transactions_type: str,
+        split_by_category: bool,
+    ) -> ChartRequest:
+        monthly_summary = await self.get_monthly_summary(
+            session, user_id, year, month
+        )
+        return self.make_monthly_summary_chart(
+            monthly_summary, year, month, transactions_type, split_by_category
+        )
+
+    async def get_monthly_summary_chart_data(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int,
+    ) -> SPeriodsChartData:
         monthly_summary = await self.get_monthly_summary(
             session, user_id, year, month
         )
+        return self.make_monthly_chart_data(monthly_summary, year, month)
+
+    def make_monthly_chart_data(
+        self,
+        monthly_summary: list[DayTransactionsSummary],
+        year: int,
+        month: int,
+    ) -> SPeriodsChartData:
+        days_in_month = calendar.monthrange(year, month)[1]
+        return self._make_periods_chart_data(
+            monthly_summary,
+            periods=list(range(1, days_in_month + 1)),
+            period_field="day_number",
+        )
 
+    def make_monthly_summary_chart(
+        self,
+        monthly_summary: list[DayTransactionsSummary],
+        year: int,
+        month: int,
+        transactions_type: str,
+        split_by_category: bool,
+    ) -> ChartRequest:
         month_name = calendar.month_name[month]
         days_in_month = calendar.monthrange(year, month)[1]
         amounts = [0] * days_in_month
@@ -426,29 +633,407 @@ class TransactionsService:
             "height": 5,
         }
         if split_by_category:
-            categories = self._get_categories_from_summary(monthly_summary)
-            prepared_data = self._prepare_data_for_chart_with_categories_split(
-                monthly_summary, categories
-            )
-
+            chart_data = self.make_monthly_chart_data(monthly_summary, year, month)
             rpc_method_name = "create_monthly_chart_with_categories"
-            rpc_params.update(
-                dict(
-                    data=prepared_data,
-                    categories=categories,
-                    days_in_month=days_in_month,
-                )
-            )
+            rpc_params.update(chart_data.model_dump())
+            priority = SPLIT_CHART_PRIORITY
         else:
             total_amounts = amounts.copy()
             for record in monthly_summary:  # type: DayTransactionsSummary
                 total_amounts[record.day_number - 1] = record.total_amount
             rpc_method_name = "create_simple_bar_chart"
             rpc_params.update(dict(values=total_amounts))
+            priority = DEFAULT_CHART_PRIORITY
+
+        return ChartRequest(rpc_method_name, rpc_params, priority)
+
+    async def get_buckets_summary(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SBucketsParams,
+    ) -> list[BucketTransactionsSummary]:
+        """
+        Returns a summary divided by time buckets, and by category if
+        requested. Every bucket of the range is there, empty ones with
+        zero amounts.
+        """
+        buckets_summary = await self.tx_repo.get_buckets_summary_from_db(
+            session=session,
+            user_id=user_id,
+            params=params,
+        )
+        buckets: dict[date, BucketTransactionsSummary] = {}
+        for bucket_start, category_name, amount in buckets_summary:
+            bucket = buckets.setdefault(
+                bucket_start,
+                BucketTransactionsSummary(
+                    bucket_start=bucket_start,
+                    total_amount=0,
+                    summary=[],
+                ),
+            )
+            bucket.total_amount += amount
+            if category_name is not None:
+                bucket.summary.append(
+                    STransactionsSummary(
+                        amount=amount,
+                        category_name=category_name,
+                    )
+                )
+        return list(buckets.values())
+
+    async def get_buckets_summary_chart(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SBucketsParams,
+        transactions_type: str,
+        render_params: SChartRenderParams | None = None,
+    ) -> bytes:
+        buckets_summary = await self.get_buckets_summary(session, user_id, params)
+        chart = self.make_buckets_summary_chart(
+            buckets_summary, params, transactions_type
+        )
+        return await self.render_chart(
+            session, chart.with_render_params(render_params)
+        )
+
+    async def get_buckets_summary_chart_data(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SBucketsParams,
+    ) -> SPeriodsChartData:
+        buckets_summary = await self.get_buckets_summary(session, user_id, params)
+        return self.make_buckets_chart_data(buckets_summary)
 
-        result = await self.rpc_call(rpc_method_name, rpc_params)
+    def make_buckets_chart_data(
+        self,
+        buckets_summary: list[BucketTransactionsSummary],
+    ) -> SPeriodsChartData:
+        return self._make_periods_chart_data(
+            buckets_summary,
+            periods=[bucket.bucket_start for bucket in buckets_summary],
+            period_field="bucket_start",
+        )
+
+    def make_buckets_summary_chart(
+        self,
+        buckets_summary: list[BucketTransactionsSummary],
+        params: SBucketsParams,
+        transactions_type: str,
+    ) -> ChartRequest:
+        chart_data = self.make_buckets_chart_data(buckets_summary)
+        granularity = (
+            f"{params.bucket_days} days"
+            if params.granularity == "custom"
+            else params.granularity
+        )
+        return ChartRequest(
+            "create_buckets_chart",
+            dict(
+                labels=[
+                    bucket.bucket_start.isoformat() for bucket in buckets_summary
+                ],
+                categories=chart_data.categories,
+                values=chart_data.values,
+                totals=chart_data.totals,
+                title=(
+                    f"{transactions_type.capitalize()} "
+                    f"{params.date_from} - {params.date_to}"
+                ),
+                xlabel=granularity.capitalize(),
+                width=min(max(9, len(buckets_summary) // 3), 30),
+                height=5,
+            ),
+            SPLIT_CHART_PRIORITY
+            if params.split_by_category
+            else DEFAULT_CHART_PRIORITY,
+        )
+
+    @staticmethod
+    def prepare_buckets_summary_for_csv(
+        buckets_summary: list[BucketTransactionsSummary],
+        split_by_category: bool,
+    ) -> list[dict[str, Any]]:
+        """
+        A row per bucket, or per bucket and category when split,
+        with the bucket total repeated in each of its rows.
+        """
+        result: list[dict[str, Any]] = []
+        for bucket in buckets_summary:
+            if not split_by_category or not bucket.summary:
+                result.append(
+                    {
+                        "bucket_start": bucket.bucket_start,
+                        "category_name": None,
+                        "amount": bucket.total_amount,
+                        "total_amount": bucket.total_amount,
+                    }
+                )
+                continue
+            for summ in bucket.summary:
+                result.append(
+                    {
+                        "bucket_start": bucket.bucket_start,
+                        "category_name": summ.category_name,
+                        "amount": summ.amount,
+                        "total_amount": bucket.total_amount,
+                    }
+                )
         return result
 
+    async def get_trend(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: STrendParams,
+    ) -> list[YearTransactionsTrend]:
+        """
+        Returns the totals of every year of the range, by month and by
+        category, compared with the previous year. Years without
+        transactions are there with zero totals.
+        """
+        trend_rows = await self.tx_repo.get_trend_from_db(
+            session=session,
+            user_id=user_id,
+            year_from=params.year_from,
+            year_to=params.year_to,
+        )
+        years = {
+            year: YearTransactionsTrend(
+                year=year,
+                total_amount=0,
+                months=[],
+                categories=[],
+            )
+            for year in range(params.year_from, params.year_to + 1)
+        }
+        for row in trend_rows:
+            year, month, category_name, amount, yoy_delta, yoy_percent = row
+            totals = dict(
+                total_amount=amount,
+                yoy_delta=yoy_delta,
+                yoy_percent=yoy_percent,
+            )
+            year_trend = years[year]
+            if month is not None:
+                year_trend.months.append(
+                    MonthTrendTotal(month_number=month, **totals)
+                )
+            elif category_name is not None:
+                year_trend.categories.append(
+                    CategoryTrendTotal(category_name=category_name, **totals)
+                )
+            else:
+                years[year] = YearTransactionsTrend(
+                    year=year,
+                    months=year_trend.months,
+                    categories=year_trend.categories,
+                    **totals,
+                )
+        return list(years.values())
+
+    @staticmethod
+    def prepare_trend_for_csv(
+        trend: list[YearTransactionsTrend],
+    ) -> list[dict[str, Any]]:
+        """
+        A row per year, then per month and per category of the year,
+        the rows of a year total have neither a month nor a category.
+        """
+        result = []
+        for year_trend in trend:
+            rows: list[tuple[int | None, str | None, BaseTrendTotal]] = [
+                (None, None, year_trend)
+            ]
+            rows += [(m.month_number, None, m) for m in year_trend.months]
+            rows += [(None, c.category_name, c) for c in year_trend.categories]
+            for month_number, category_name, total in rows:
+                result.append(
+                    {
+                        "year": year_trend.year,
+                        "month_number": month_number,
+                        "category_name": category_name,
+                        "total_amount": total.total_amount,
+                        "yoy_delta": total.yoy_delta,
+                        "yoy_percent": total.yoy_percent,
+                    }
+                )
+        return result
+
+    async def get_rolling_summary(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SRollingParams,
+    ) -> list[DayRollingSummary]:
+        """
+        Returns every day of the range with its amount, the month-to-date
+        amount and the moving averages, per category if requested.
+        """
+        rolling_summary = await self.tx_repo.get_rolling_summary_from_db(
+            session=session,
+            user_id=user_id,
+            params=params,
+        )
+        days = []
+        for row in rolling_summary:
+            day, category_name, amount, month_to_date, *averages = row
+            days.append(
+                DayRollingSummary(
+                    day=day,
+                    category_name=category_name,
+                    amount=amount,
+                    month_to_date=month_to_date,
+                    averages=dict(zip(params.windows, averages)),
+                )
+            )
+        return days
+
+    @staticmethod
+    def prepare_rolling_summary_for_csv(
+        rolling_summary: list[DayRollingSummary],
+    ) -> list[dict[str, Any]]:
+        """
+        A column per moving average, named after its window.
+        """
+        result = []
+        for record in rolling_summary:
+            data = record.model_dump(exclude={"averages"})
+            for window, average in record.averages.items():
+                data[f"avg_{window}_days"] = average
+            result.append(data)
+        return result
+
+    async def get_stats(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SStatsParams,
+    ) -> STransactionsStats:
+        """
+        Returns the amounts distribution of each category by month,
+        and a histogram of each category's amounts over the whole range.
+        """
+        stats = await self.tx_repo.get_stats_from_db(
+            session=session,
+            user_id=user_id,
+            params=params,
+        )
+        histograms_rows = await self.tx_repo.get_histograms_from_db(
+            session=session,
+            user_id=user_id,
+            params=params,
+        )
+        histograms: dict[str, CategoryHistogram] = {}
+        for category_name, low, high, bin_number, count in histograms_rows:
+            histogram = histograms.get(category_name)
+            if histogram is None:
+                bin_width = (high - low) / params.bins
+                histogram = histograms[category_name] = CategoryHistogram(
+                    category_name=category_name,
+                    bin_edges=[
+                        round(low + i * bin_width, 2)
+                        for i in range(params.bins + 1)
+                    ],
+                    counts=[0] * params.bins,
+                )
+            histogram.counts[bin_number - 1] = count
+        return STransactionsStats(
+            sample_percent=params.sample_percent,
+            stats=[
+                CategoryMonthStats.model_validate(row, from_attributes=True)
+                for row in stats
+            ],
+            histograms=list(histograms.values()),
+        )
+
+    async def get_stats_chart(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        params: SStatsParams,
+        transactions_type: str,
+        render_params: SChartRenderParams | None = None,
+    ) -> bytes:
+        stats = await self.get_stats(session, user_id, params)
+        chart = self.make_stats_chart(stats, params, transactions_type)
+        return await self.render_chart(
+            session, chart.with_render_params(render_params)
+        )
+
+    @staticmethod
+    def make_stats_chart(
+        stats: STransactionsStats,
+        params: SStatsParams,
+        transactions_type: str,
+    ) -> ChartRequest:
+        """
+        A box per category and month: min, quartiles, p90 and max.
+        """
+        title = (
+            f"{transactions_type.capitalize()} amounts "
+            f"{params.date_from} - {params.date_to}"
+        )
+        if params.sample_percent is not None:
+            title += f" (~{params.sample_percent:g}% sample)"
+        return ChartRequest(
+            "create_box_plot_chart",
+            dict(
+                labels=[
+                    f"{s.category_name}\n{s.month:%Y-%m}" for s in stats.stats
+                ],
+                boxes=[
+                    [s.min, s.q1, s.median, s.q3, s.p90, s.max]
+                    for s in stats.stats
+                ],
+                title=title,
+                width=min(max(9, len(stats.stats) // 2), 30),
+                height=6,
+            ),
+            DEFAULT_CHART_PRIORITY,
+        )
+
+    async def render_chart(
+        self,
+        session: AsyncSession,
+        chart: ChartRequest,
+    ) -> bytes:
+        """
+        Renders a prepared chart and waits for it. The session's connection
+        is released first, so a slow render doesn't hold it.
+        """
+        await release_connection(session)
+        [rendered_chart] = await self.rpc_call_many([chart])
+        return rendered_chart
+
+    async def render_charts(
+        self,
+        session: AsyncSession,
+        charts: Sequence[ChartRequest],
+    ) -> list[bytes]:
+        """
+        Renders several prepared charts with one RPC call,
+        e.g. all charts of a page.
+        """
+        await release_connection(session)
+        return await self.rpc_call_many(charts)
+
+    @staticmethod
+    async def submit_chart_job(
+        session: AsyncSession,
+        user_id: int,
+        chart: ChartRequest,
+    ) -> str:
+        """
+        Sends a prepared chart to charts_service without waiting for it.
+        Returns the job id to poll the result with.
+        """
+        await release_connection(session)
+        return await chart_jobs_client.submit(user_id, chart)
+
     @staticmethod
     def _get_categories_from_summary(
         summary: Sequence[BasePeriodTransactionsSummary],
@@ -462,45 +1047,108 @@ class TransactionsService:
                 categories.add(item.category_name)
         return categories
 
-    @staticmethod
-    def _prepare_data_for_chart_with_categories_split(
+    def _make_periods_chart_data(
+        self,
         summary: Sequence[BasePeriodTransactionsSummary],
-        categories: set,
-    ) -> list[dict[str, Any]]:
+        periods: list[int] | list[date],
+        period_field: str,
+    ) -> SPeriodsChartData:
         """
-        Prepares data in a json-compatible format.
-        Adds data about all categories to each period.
+        Per-category series in a columnar layout: category names are listed
+        once, `values[i][j]` is the amount of `categories[i]` in `periods[j]`.
+        Periods without transactions are filled with zeros.
 
         Output example:
-        [
-            {'Food': 70, 'Clothes': 0, 'month_number': 1, 'total_amount': 70},
-            {'Food': 0, 'Clothes': 60, 'month_number': 2, 'total_amount': 60},
-            {'Food': 10, 'Clothes': 40, 'month_number': 3, 'total_amount': 50},
-        ]
+        {
+            'periods': [1, 2, 3],
+            'categories': ['Clothes', 'Food'],
+            'values': [[0, 60, 40], [70, 0, 10]],
+            'totals': [70, 60, 50],
+        }
         """
-        transformed_data = []
-        for record in summary:
-            period_data = record.model_dump(exclude={"summary"})
-
-            for category in categories:
-                period_data[category] = 0
+        categories = sorted(self._get_categories_from_summary(summary))
+        columns = {period: column for column, period in enumerate(periods)}
+        rows = {category: row for row, category in enumerate(categories)}
 
+        values = [[0] * len(columns) for _ in categories]
+        totals = [0] * len(columns)
+        for record in summary:
+            column = columns[getattr(record, period_field)]
+            totals[column] = record.total_amount
             for item in record.summary:
-                period_data[item.category_name] = item.amount
+                values[rows[item.category_name]][column] = item.amount
 
-            transformed_data.append(period_data)
-        return transformed_data
+        return SPeriodsChartData(
+            periods=periods,
+            categories=categories,
+            values=values,
+            totals=totals,
+        )
 
     @staticmethod
-    async def rpc_call(method_name: str, params: dict[str, Any]) -> Any:
-        connection = await connect_robust(settings.broker.url)
-        async with connection:
-            channel = await connection.channel()
-            rpc = await RPC.create(channel)
-            return await rpc.call(
-                method_name=method_name,
-                kwargs=params,
+    async def rpc_call(
+        method_name: str,
+        params: dict[str, Any],
+        priority: int = DEFAULT_CHART_PRIORITY,
+        timeout_sec: float | None = None,
+    ) -> Any:
+        """
+        Raises TimeoutError if there's no result in `timeout_sec`. The call
+        message expires in the queue by then too, so charts_service doesn't
+        render a chart nobody waits for.
+        """
+        async with asyncio.timeout(timeout_sec):
+            connection = await connect_robust(settings.broker.url)
+            async with connection:
+                channel = await connection.channel()
+                rpc = await ChartsRPC.create(channel)
+                return await rpc.call(
+                    method_name=method_name,
+                    kwargs=params,
+                    priority=priority,
+                    expiration=math.ceil(timeout_sec) if timeout_sec else None,
+                )
+
+    @classmethod
+    async def rpc_call_many(cls, charts: Sequence[ChartRequest]) -> list[bytes]:
+        """
+        Renders charts with a single `render_charts` call: one broker round
+        trip, and charts_service renders them in parallel.
+
+        All charts go through the one `render_charts` priority queue, so
+        simple charts are taken before split ones waiting there. A call is
+        as urgent as its most urgent chart.
+
+        If charts_service doesn't answer in `charts_rpc_timeout_sec`, or
+        the breaker is open after repeated failures, every chart falls back
+        to its last rendered image or a placeholder.
+        """
+        if not charts_breaker.allow():
+            return [get_fallback_chart(chart) for chart in charts]
+        try:
+            rendered_charts = await cls.rpc_call(
+                "render_charts",
+                dict(
+                    charts=[
+                        dict(method_name=chart.method_name, params=chart.params)
+                        for chart in charts
+                    ]
+                ),
+                max(
+                    (chart.priority for chart in charts),
+                    default=DEFAULT_CHART_PRIORITY,
+                ),
+                timeout_sec=settings.broker.charts_rpc_timeout_sec,
             )
+        except CHARTS_UNAVAILABLE_ERRORS as error:
+            charts_breaker.record_failure()
+            logger.warning("Charts are unavailable, falling back: %r", error)
+            return [get_fallback_chart(chart) for chart in charts]
+
+        charts_breaker.record_success()
+        for chart, rendered_chart in zip(charts, rendered_charts):
+            rendered_charts_cache.put(chart, rendered_chart)
+        return rendered_charts
 
     @staticmethod
     def _summarize(
@@ -541,14 +1189,11 @@ class TransactionsService:
         category_ids: set[int] = set()
         for cat_params in categories_params:
             if cat_params.category_name and cat_params.category_id is None:
-                category = await self.tx_categories_repo.get_category(
-                    session=session,
-                    user_id=user_id,
-                    category_name=cat_params.category_name,
+                cat_params.category_id = await self._get_category_id(
+                    user_id,
+                    cat_params.category_name,
+                    session,
                 )
-                if not category:
-                    raise CategoryNotFound
-                cat_params.category_id = category.id
             if cat_params.category_id:
                 category_ids.add(cat_params.category_id)
         return list(category_ids)
@@ -0,0 +1,167 @@
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.unit_of_work import has_uncommitted_changes
+from app.repositories import (
+    BaseCategoriesRepository,
+    user_income_cat_repo,
+    user_spend_cat_repo,
+)
+
+
+@dataclass
+class UserCategoriesMap:
+    ids_by_name: dict[str, int] = field(default_factory=dict)
+    names_by_id: dict[int, str] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def add(self, category_id: int, category_name: str) -> None:
+        self.ids_by_name[category_name.casefold()] = category_id
+        self.names_by_id[category_id] = category_name
+
+
+class CategoriesCache:
+    """
+    Per-user in-memory map of transaction categories.
+
+    The map of a user is loaded with one query and invalidated by the
+    categories service once a create, rename or delete is committed.
+    Other workers don't see the invalidation, so entries also expire after
+    `ttl_sec`, and names missing from the map are looked up in the database.
+    Within the TTL a cached id may be stale, so writes ask for `verify`,
+    which checks the id against the database before it is used.
+
+    Only committed data is cached: sessions with uncommitted changes get
+    a map of their own, and a load that raced an invalidation isn't kept.
+    """
+
+    def __init__(
+        self,
+        category_repo: BaseCategoriesRepository,
+        ttl_sec: int,
+        max_users: int,
+    ) -> None:
+        self.category_repo = category_repo
+        self.ttl_sec = ttl_sec
+        self.max_users = max_users
+        self._maps: dict[int, UserCategoriesMap] = {}
+        # bumped on every invalidation, loads started before it are stale
+        self._generation = 0
+
+    async def get_user_categories(
+        self,
+        user_id: int,
+        session: AsyncSession,
+    ) -> UserCategoriesMap:
+        if has_uncommitted_changes(session):
+            return await self._load_user_categories(user_id, session)
+
+        categories_map = self._maps.get(user_id)
+        if categories_map and not self._is_expired(categories_map):
+            return categories_map
+
+        generation = self._generation
+        categories_map = await self._load_user_categories(user_id, session)
+        if generation != self._generation:
+            return categories_map
+
+        self._maps.pop(user_id, None)
+        if len(self._maps) >= self.max_users:
+            oldest_user_id = next(iter(self._maps))
+            del self._maps[oldest_user_id]
+        self._maps[user_id] = categories_map
+        return categories_map
+
+    async def get_category_id(
+        self,
+        user_id: int,
+        category_name: str,
+        session: AsyncSession,
+        verify: bool = False,
+    ) -> int | None:
+        """
+        Case-insensitive lookup of the category id by its name.
+
+        With `verify` a cached id is re-checked in the database, and the
+        user's map is dropped when another worker renamed or deleted it.
+        """
+        categories_map = await self.get_user_categories(user_id, session)
+        category_id = categories_map.ids_by_name.get(category_name.casefold())
+        if category_id is not None:
+            if not verify:
+                return category_id
+            category = await self.category_repo.get(session, category_id)
+            if (
+                category is not None
+                and category.user_id == user_id
+                and category.category_name.casefold() == category_name.casefold()
+            ):
+                return category_id
+            self.invalidate(user_id)
+
+        generation = self._generation
+        category = await self.category_repo.get_category(
+            session=session,
+            user_id=user_id,
+            category_name=category_name,
+        )
+        if category is None:
+            return None
+        if generation == self._generation:
+            categories_map.add(category.id, category.category_name)
+        return category.id
+
+    async def get_category_name(
+        self,
+        user_id: int,
+        category_id: int,
+        session: AsyncSession,
+    ) -> str | None:
+        categories_map = await self.get_user_categories(user_id, session)
+        category_name = categories_map.names_by_id.get(category_id)
+        if category_name is not None:
+            return category_name
+
+        generation = self._generation
+        category = await self.category_repo.get(session, category_id)
+        if category is None or category.user_id != user_id:
+            return None
+        if generation == self._generation:
+            categories_map.add(category.id, category.category_name)
+        return category.category_name
+
+    def invalidate(self, user_id: int) -> None:
+        self._generation += 1
+        self._maps.pop(user_id, None)
+
+    async def _load_user_categories(
+        self,
+        user_id: int,
+        session: AsyncSession,
+    ) -> UserCategoriesMap:
+        categories = await self.category_repo.get_all(
+            session,
+            dict(user_id=user_id),
+        )
+        categories_map = UserCategoriesMap()
+        for category in categories:
+            categories_map.add(category.id, category.category_name)
+        return categories_map
+
+    def _is_expired(self, categories_map: UserCategoriesMap) -> bool:
+        return time.monotonic() - categories_map.loaded_at > self.ttl_sec
+
+
+spending_categories_cache = CategoriesCache(
+    category_repo=user_spend_cat_repo,
+    ttl_sec=settings.app.categories_cache_ttl_sec,
+    max_users=settings.app.categories_cache_max_users,
+)
+income_categories_cache = CategoriesCache(
+    category_repo=user_income_cat_repo,
+    ttl_sec=settings.app.categories_cache_ttl_sec,
+    max_users=settings.app.categories_cache_max_users,
+)
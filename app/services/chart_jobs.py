@@ -0,0 +1,172 @@
+import asyncio
+from dataclasses import dataclass, replace
+from typing import Any, Literal
+from uuid import uuid4
+
+from aio_pika import Message, connect_robust
+from aio_pika.abc import AbstractRobustConnection
+from aio_pika.exceptions import ChannelNotFoundEntity
+
+from app.core.config import settings
+from app.exceptions.chart_exceptions import ChartJobNotFound
+from app.schemas.charts_schemas import SChartRenderParams
+from charts_service.rpc import JSON_CONTENT_TYPE, dumps_payload
+
+# charts_service queues are priority queues: interactive charts are taken
+# before the heavy split ones waiting in the same queue.
+DEFAULT_CHART_PRIORITY = 5
+SPLIT_CHART_PRIORITY = 1
+
+
+@dataclass(frozen=True, slots=True)
+class ChartRequest:
+    """
+    A charts_service method with its kwargs, built from the database data
+    before any rendering starts.
+    """
+
+    method_name: str
+    params: dict[str, Any]
+    priority: int = DEFAULT_CHART_PRIORITY
+
+    def with_render_params(
+        self,
+        render_params: SChartRenderParams | None,
+    ) -> "ChartRequest":
+        if render_params is None:
+            return self
+        return replace(
+            self,
+            params={**self.params, **render_params.model_dump(exclude_none=True)},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ChartJobResult:
+    status: Literal["pending", "done", "failed"]
+    chart: bytes | None = None
+    media_type: str = "image/png"
+
+
+class ChartJobsClient:
+    """
+    Sends chart jobs to charts_service and reads their results.
+
+    Each job gets its own result queue, which is the result store:
+    charts_service publishes the rendered chart there, and any app worker
+    can read it, so polling requests don't have to hit the worker that
+    created the job. The queue is removed by RabbitMQ once nobody has
+    polled it for `result_ttl_sec`.
+
+    Result queue names include the user id, so a user can't read someone
+    else's job even knowing its id.
+    """
+
+    def __init__(
+        self,
+        broker_url: str,
+        jobs_queue_name: str,
+        jobs_queue_max_priority: int,
+        result_ttl_sec: int,
+        poll_interval_sec: float,
+    ):
+        self.broker_url = broker_url
+        self.jobs_queue_name = jobs_queue_name
+        self.jobs_queue_max_priority = jobs_queue_max_priority
+        self.result_ttl_sec = result_ttl_sec
+        self.poll_interval_sec = poll_interval_sec
+        self._connection: AbstractRobustConnection | None = None
+        self._connection_lock = asyncio.Lock()
+
+    async def submit(self, user_id: int, chart: ChartRequest) -> str:
+        job_id = uuid4().hex
+        result_queue_name = self._get_result_queue_name(user_id, job_id)
+        body, content_encoding = dumps_payload(chart.params)
+        connection = await self._get_connection()
+        async with connection.channel() as channel:
+            await channel.declare_queue(
+                self.jobs_queue_name,
+                durable=True,
+                arguments={"x-max-priority": self.jobs_queue_max_priority},
+            )
+            await channel.declare_queue(
+                result_queue_name,
+                arguments={"x-expires": self.result_ttl_sec * 1000},
+            )
+            await channel.default_exchange.publish(
+                Message(
+                    body=body,
+                    content_type=JSON_CONTENT_TYPE,
+                    content_encoding=content_encoding,
+                    headers={"method_name": chart.method_name},
+                    priority=chart.priority,
+                    correlation_id=job_id,
+                    reply_to=result_queue_name,
+                    expiration=self.result_ttl_sec,
+                ),
+                routing_key=self.jobs_queue_name,
+            )
+        return job_id
+
+    async def get_result(
+        self,
+        user_id: int,
+        job_id: str,
+        wait_sec: float = 0,
+    ) -> ChartJobResult:
+        """
+        Returns the job result, waiting for it up to `wait_sec` (long polling).
+
+        The result message is put back after reading, so the result can be
+        fetched again until the queue expires.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_sec
+        connection = await self._get_connection()
+        async with connection.channel() as channel:
+            try:
+                queue = await channel.declare_queue(
+                    self._get_result_queue_name(user_id, job_id),
+                    passive=True,
+                )
+            except ChannelNotFoundEntity:
+                raise ChartJobNotFound
+
+            while True:
+                message = await queue.get(no_ack=False, fail=False)
+                if message:
+                    await message.nack(requeue=True)
+                    if message.headers.get("status") == "done":
+                        return ChartJobResult(
+                            status="done",
+                            chart=message.body,
+                            media_type=message.content_type or "image/png",
+                        )
+                    return ChartJobResult(status="failed")
+                if loop.time() >= deadline:
+                    return ChartJobResult(status="pending")
+                await asyncio.sleep(self.poll_interval_sec)
+
+    async def close(self) -> None:
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+
+    async def _get_connection(self) -> AbstractRobustConnection:
+        async with self._connection_lock:
+            if self._connection is None:
+                self._connection = await connect_robust(self.broker_url)
+        return self._connection
+
+    @staticmethod
+    def _get_result_queue_name(user_id: int, job_id: str) -> str:
+        return f"chart-jobs.{user_id}.{job_id}"
+
+
+chart_jobs_client = ChartJobsClient(
+    broker_url=settings.broker.url,
+    jobs_queue_name=settings.broker.charts_service_queue_name,
+    jobs_queue_max_priority=settings.broker.charts_queues_max_priority,
+    result_ttl_sec=settings.broker.chart_jobs_result_ttl_sec,
+    poll_interval_sec=settings.broker.chart_jobs_poll_interval_sec,
+)
@@ -0,0 +1,111 @@
+import hashlib
+import time
+from collections import OrderedDict
+from functools import cache
+
+import orjson
+
+from app.core.config import settings
+from app.schemas.charts_schemas import ChartFormat
+from app.services.chart_jobs import ChartRequest
+
+
+class CircuitBreaker:
+    """
+    Stops calling charts_service after `failure_threshold` failures in a row,
+    so requests fall back at once instead of each waiting for its deadline.
+
+    After `reset_timeout_sec` one call is let through again (half-open):
+    a success closes the breaker, a failure opens it for another timeout.
+    The state is per app process.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout_sec: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_sec = reset_timeout_sec
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout_sec:
+            return False
+        # The trial call re-arms the timeout, so other calls keep falling
+        # back until it's done, even if it never reports.
+        self.opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class RenderedChartsCache:
+    """
+    The last rendered image of each chart, served while charts_service is
+    unavailable. Charts are keyed by their method and kwargs, so an image
+    is only reused for exactly the same chart.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._charts: OrderedDict[bytes, bytes] = OrderedDict()
+
+    def get(self, chart: ChartRequest) -> bytes | None:
+        key = self._make_key(chart)
+        rendered_chart = self._charts.get(key)
+        if rendered_chart is not None:
+            self._charts.move_to_end(key)
+        return rendered_chart
+
+    def put(self, chart: ChartRequest, rendered_chart: bytes) -> None:
+        key = self._make_key(chart)
+        self._charts[key] = rendered_chart
+        self._charts.move_to_end(key)
+        if len(self._charts) > self.max_size:
+            self._charts.popitem(last=False)
+
+    @staticmethod
+    def _make_key(chart: ChartRequest) -> bytes:
+        return hashlib.sha256(
+            orjson.dumps(
+                [chart.method_name, chart.params],
+                option=orjson.OPT_SORT_KEYS,
+            )
+        ).digest()
+
+
+@cache
+def get_placeholder_chart(chart_format: ChartFormat) -> bytes:
+    return (
+        settings.pages.static_path / "img" / f"chart_unavailable.{chart_format}"
+    ).read_bytes()
+
+
+def get_fallback_chart(chart: ChartRequest) -> bytes:
+    """
+    The last image of the chart if there is one, the placeholder otherwise.
+    """
+    return rendered_charts_cache.get(chart) or get_placeholder_chart(
+        chart.params.get("format", "png")
+    )
+
+
+charts_breaker = CircuitBreaker(
+    failure_threshold=settings.broker.charts_breaker_failure_threshold,
+    reset_timeout_sec=settings.broker.charts_breaker_reset_timeout_sec,
+)
+rendered_charts_cache = RenderedChartsCache(
+    max_size=settings.broker.charts_fallback_cache_size,
+)
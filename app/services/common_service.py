@@ -45,7 +45,13 @@ def parse_sort_params_for_query(
 
 
 def make_csv_from_pydantic_models(data: list[AnyPydanticModel]) -> str:
-    df = pd.DataFrame([row.model_dump() for row in data])
+    return make_csv_from_dicts([row.model_dump() for row in data])
+
+
+def make_csv_from_dicts(data: Sequence[dict]) -> str:
+    # values are written as they are, without upcasting integer columns
+    # with missing values to floats
+    df = pd.DataFrame(list(data), dtype=object)
     return df.to_csv(index=False)
 
 
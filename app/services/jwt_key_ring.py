@@ -0,0 +1,84 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import jwt
+from jwt import InvalidTokenError, PyJWKSet
+
+from app.core.config import JWTAuth
+
+
+@dataclass(frozen=True, slots=True)
+class JWTKey:
+    """
+    A parsed key: PEM/JWK text is turned into `cryptography` key objects
+    once, so PyJWT doesn't re-parse it on every encode and decode.
+    """
+
+    kid: str
+    algorithm: str
+    public_key: Any
+    private_key: Any = None
+
+
+class JWTKeyRing:
+    """
+    Tokens are signed with the current key and carry its `kid` header.
+    Verification picks the key by `kid`, so tokens signed with retired keys
+    stay valid for as long as their public keys are kept in the JWKS file.
+    """
+
+    def __init__(
+        self,
+        signing_key: JWTKey,
+        verification_keys: list[JWTKey] | None = None,
+    ):
+        self.signing_key = signing_key
+        self._keys_by_kid = {key.kid: key for key in verification_keys or []}
+        self._keys_by_kid[signing_key.kid] = signing_key
+
+    @classmethod
+    def from_config(cls, config: JWTAuth) -> "JWTKeyRing":
+        algorithm = jwt.get_algorithm_by_name(config.algorithm)
+        signing_key = JWTKey(
+            kid=config.key_id,
+            algorithm=config.algorithm,
+            private_key=algorithm.prepare_key(
+                config.private_key_path.read_bytes()
+            ),
+            public_key=algorithm.prepare_key(config.public_key_path.read_bytes()),
+        )
+        return cls(signing_key, load_jwks(config.jwks_path))
+
+    @property
+    def kids(self) -> list[str]:
+        return list(self._keys_by_kid)
+
+    def get_verification_key(self, kid: str | None) -> JWTKey:
+        # Tokens issued before key ids were introduced have no `kid`.
+        if kid is None:
+            return self.signing_key
+        try:
+            return self._keys_by_kid[kid]
+        except KeyError:
+            raise InvalidTokenError(f"Unknown key id: {kid}")
+
+
+def load_jwks(jwks_path: Path) -> list[JWTKey]:
+    """
+    Reads public keys from a JWKS file (`{"keys": [...]}`), if it exists.
+    Every key must have `kid` and `alg`.
+    """
+    if not jwks_path.is_file():
+        return []
+    jwks = PyJWKSet(json.loads(jwks_path.read_text())["keys"])
+    return [
+        JWTKey(
+            kid=jwk.key_id,
+            algorithm=jwk.algorithm_name,
+            public_key=jwk.key,
+        )
+        for jwk in jwks.keys
+        if jwk.key_id is not None
+    ]
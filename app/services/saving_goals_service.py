@@ -1,5 +1,6 @@
 from datetime import date
-from typing import Type
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,8 +20,10 @@ from app.schemas.saving_goals_schemas import (
     SSavingGoalCreate,
     SSavingGoalCreateInDB,
     SSavingGoalProgress,
+    SSavingGoalProgressItem,
     SSavingGoalResponse,
     SSavingGoalUpdatePartial,
+    SSavingGoalWithProgress,
 )
 from app.services.common_service import parse_sort_params_for_query
 
@@ -138,6 +141,45 @@ class SavingGoalsService:
         )
         return goal_progress
 
+    async def get_goal_with_progress(
+        self,
+        goal_id: int,
+        user_id: int,
+        session: AsyncSession,
+    ) -> SSavingGoalWithProgress:
+        goals = await self.repo.get_goals_with_progress_from_db(
+            session=session,
+            user_id=user_id,
+            today=date.today(),
+            goal_ids=[goal_id],
+        )
+        if not goals:
+            raise GoalNotFound
+        return self._make_goal_with_progress(goals[0])
+
+    async def get_goals_progress(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        goal_ids: list[int] | None = None,
+        status: GoalStatus | None = None,
+    ) -> list[SSavingGoalProgressItem]:
+        """
+        Progress of all the user's goals, or of the given ones,
+        computed in a single query.
+        """
+        progress = await self.repo.get_goals_progress_from_db(
+            session=session,
+            user_id=user_id,
+            today=date.today(),
+            goal_ids=goal_ids,
+            status=status,
+        )
+        return [
+            SSavingGoalProgressItem.model_validate(row, from_attributes=True)
+            for row in progress
+        ]
+
     async def update_current_amount(
         self,
         goal_id: int,
@@ -174,7 +216,8 @@ class SavingGoalsService:
         end_date_range: SDateRange | None = None,
         status: GoalStatus | None = None,
         sort_params: SGoalsSortParams | None = None,
-    ) -> list[SSavingGoalResponse]:
+        with_progress: bool = False,
+    ) -> list[SSavingGoalResponse] | list[SSavingGoalWithProgress]:
         if sort_params:
             parsed_sort_params = parse_sort_params_for_query(sort_params)
         else:
@@ -215,9 +258,7 @@ class SavingGoalsService:
             end_date_from = None
             end_date_to = None
 
-        goals = await self.repo.get_goals_from_db(
-            session=session,
-            user_id=user_id,
+        filters: dict[str, Any] = dict(
             min_current_amount=min_current_amount,
             max_current_amount=max_current_amount,
             min_target_amount=min_target_amount,
@@ -233,15 +274,43 @@ class SavingGoalsService:
             status=status,
             sort_params=parsed_sort_params,
         )
-        result = []
+        if with_progress:
+            rows = await self.repo.get_goals_with_progress_from_db(
+                session=session,
+                user_id=user_id,
+                today=date.today(),
+                **filters,
+            )
+            goals = [row[0] for row in rows]
+        else:
+            goals = await self.repo.get_goals_from_db(
+                session=session,
+                user_id=user_id,
+                **filters,
+            )
+
         for goal in goals:
             if self._is_goal_overdue(goal):
                 await self.make_saving_goal_overdue(goal.id, session)
-                await session.refresh(goal)
 
-            goal_out = self.out_schema.model_validate(goal)
-            result.append(goal_out)
-        return result
+        if with_progress:
+            return [self._make_goal_with_progress(row) for row in rows]
+        return [self.out_schema.model_validate(goal) for goal in goals]
+
+    @staticmethod
+    def _make_goal_with_progress(row: Any) -> SSavingGoalWithProgress:
+        goal, rest_amount, percentage, days_left, expected_payment = row
+        return SSavingGoalWithProgress(
+            **SSavingGoalResponse.model_validate(goal).model_dump(),
+            progress=SSavingGoalProgress(
+                current_amount=goal.current_amount,
+                target_amount=goal.target_amount,
+                rest_amount=rest_amount,
+                percentage_progress=percentage,
+                days_left=days_left,
+                expected_daily_payment=expected_payment,
+            ),
+        )
 
     async def _complete_saving_goal(
         self,
@@ -281,10 +350,12 @@ class SavingGoalsService:
         """
         first_num: The number whose percentage is to be calculated.
         second_num: The number relative to which the percentage is calculated.
+        Rounded to 2 decimals, halves away from zero.
         """
         if second_num == 0:
             return 0
-        return round(first_num / second_num * 100, 2)
+        percentage = Decimal(first_num * 100) / second_num
+        return float(percentage.quantize(Decimal("0.01"), ROUND_HALF_UP))
 
     @staticmethod
     def get_days_between_dates(
@@ -296,9 +367,14 @@ class SavingGoalsService:
 
     @staticmethod
     def get_expected_daily_payment(rest_amount: int, days_left: int) -> int:
+        """
+        Halves are rounded away from zero, as round(numeric) in the
+        database does for the progress of many goals at once.
+        """
         if days_left == 0:
             return rest_amount
-        return round(rest_amount / days_left)
+        payment = Decimal(rest_amount) / days_left
+        return int(payment.quantize(Decimal(1), ROUND_HALF_UP))
 
 
 saving_goals_service = SavingGoalsService(
@@ -7,10 +7,12 @@ from app.schemas.transactions_schemas import (
     STransactionUpdatePartialInDB,
 )
 from app.services.base_transactions_service import TransactionsService
+from app.services.categories_cache import spending_categories_cache
 
 spendings_service = TransactionsService(
     tx_repo=spendings_repo,
     tx_categories_repo=user_spend_cat_repo,
+    categories_cache=spending_categories_cache,
     default_tx_category_name=settings.app.default_spending_category_name,
     creation_schema=STransactionCreate,
     creation_in_db_schema=STransactionCreateInDB,
@@ -2,10 +2,12 @@ from app.core.config import settings
 from app.repositories import spendings_repo, user_spend_cat_repo
 from app.schemas.transaction_category_schemas import STransactionCategoryOut
 from app.services.base_categories_service import BaseCategoriesService
+from app.services.categories_cache import spending_categories_cache
 
 user_spend_cat_service = BaseCategoriesService(
     category_repo=user_spend_cat_repo,
     transaction_repo=spendings_repo,
+    categories_cache=spending_categories_cache,
     default_category_name=settings.app.default_spending_category_name,
     out_schema=STransactionCategoryOut,
 )
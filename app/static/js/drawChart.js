@@ -0,0 +1,74 @@
+// Draws bar charts as inline SVG from the chart_data endpoints,
+// so pages in the client charts mode don't need charts_service.
+
+const CHART_COLORS = [
+    "#005f73", "#0a9396", "#94d2bd", "#e9d8a6", "#ee9b00",
+    "#ca6702", "#bb3e03", "#ae2012", "#9b2226", "#52b69a",
+    "#168aad", "#1e6091", "#b5838d", "#6d6875", "#52796f",
+];
+
+function escapeHtml(text) {
+    return String(text)
+        .replaceAll("&", "&amp;")
+        .replaceAll("<", "&lt;")
+        .replaceAll(">", "&gt;")
+        .replaceAll('"', "&quot;");
+}
+
+// series: [{name, values}], stacked on top of each other
+function drawBarChart(container, labels, series, width = 900, height = 450) {
+    const margin = {top: 20, right: 10, bottom: 30, left: 10};
+    const plotHeight = height - margin.top - margin.bottom;
+    const step = (width - margin.left - margin.right) / Math.max(labels.length, 1);
+    const barWidth = step * 0.7;
+    const totals = labels.map((_, i) => series.reduce((sum, s) => sum + s.values[i], 0));
+    const scale = plotHeight / Math.max(1, ...totals);
+    const baseline = margin.top + plotHeight;
+
+    const parts = [];
+    labels.forEach((label, i) => {
+        const x = margin.left + i * step + (step - barWidth) / 2;
+        let top = baseline;
+        series.forEach((s, j) => {
+            const barHeight = s.values[i] * scale;
+            if (barHeight <= 0) {
+                return;
+            }
+            top -= barHeight;
+            parts.push(
+                `<rect x="${x}" y="${top}" width="${barWidth}" height="${barHeight}" ` +
+                `fill="${CHART_COLORS[j % CHART_COLORS.length]}">` +
+                `<title>${escapeHtml(s.name)}: ${s.values[i]}</title></rect>`
+            );
+        });
+        const center = x + barWidth / 2;
+        if (totals[i]) {
+            parts.push(`<text x="${center}" y="${top - 4}" text-anchor="middle" font-size="11">${totals[i]}</text>`);
+        }
+        parts.push(`<text x="${center}" y="${baseline + 16}" text-anchor="middle" font-size="11">${escapeHtml(label)}</text>`);
+    });
+    parts.push(`<line x1="${margin.left}" y1="${baseline}" x2="${width - margin.right}" y2="${baseline}" stroke="#999"/>`);
+
+    const legend = series.length > 1
+        ? series.map((s, j) => (
+            `<span class="me-3"><span style="color: ${CHART_COLORS[j % CHART_COLORS.length]}">&#9632;</span> ` +
+            `${escapeHtml(s.name)}</span>`
+        )).join("")
+        : "";
+    container.innerHTML =
+        `<svg viewBox="0 0 ${width} ${height}" width="${width}" height="${height}">${parts.join("")}</svg>` +
+        `<div>${legend}</div>`;
+}
+
+// data: {categories, amounts}
+function drawCategoriesChart(container, data) {
+    drawBarChart(container, data.categories, [{name: "Amount", values: data.amounts}], 600, 400);
+}
+
+// data: {periods, categories, values, totals}
+function drawPeriodsChart(container, data, splitByCategory) {
+    const series = splitByCategory
+        ? data.categories.map((name, i) => ({name, values: data.values[i]}))
+        : [{name: "Total", values: data.totals}];
+    drawBarChart(container, data.periods, series);
+}
@@ -46,6 +46,24 @@ document.getElementById("filter-form").addEventListener("submit", function (e) {
         })
         .catch((error) => console.error("Error:", error));
 
+    if (window.initialChartData) {
+        fetch(`${window.getSummaryPrefix}/chart_data/${year}/`)
+            .then((response) => response.json())
+            .then((chartData) => {
+                const container = document.getElementById("summary-chart-container");
+                drawPeriodsChart(container, chartData, splitByCategory === "on");
+            })
+            .catch((error) => console.error("Error:", error));
+        return;
+    }
+
+    // both variants of the page's initial period come with the page
+    const preloadedChart = window.preloadedCharts?.[`${year}`]?.[splitByCategory === "on"];
+    if (preloadedChart) {
+        document.getElementById("summary-chart").src = `data:image/png;base64,${preloadedChart}`;
+        return;
+    }
+
     fetch(url_chart)
         .then((response) => response.arrayBuffer())
         .then((arrayBuffer) => {
@@ -56,3 +74,7 @@ document.getElementById("filter-form").addEventListener("submit", function (e) {
         })
         .catch((error) => console.error("Error:", error));
 });
+
+if (window.initialChartData) {
+    drawPeriodsChart(document.getElementById("summary-chart-container"), window.initialChartData, false);
+}
@@ -25,9 +25,21 @@ document.getElementById("filter-form").addEventListener("submit", function (e) {
                         `;
                 tableBody.appendChild(row);
             });
+
+            if (window.initialChartData) {
+                drawCategoriesChart(document.getElementById("summary-chart-container"), {
+                    categories: data.map((summary_record) => summary_record.category_name),
+                    amounts: data.map((summary_record) => summary_record.amount),
+                });
+            }
         })
         .catch((error) => console.error("Error:", error));
 
+    // in the client charts mode the chart is drawn from the summary above
+    if (window.initialChartData) {
+        return;
+    }
+
     fetch(`${window.getSummaryChartUrl}?${params}`)
         .then((response) => response.arrayBuffer())
         .then((arrayBuffer) => {
@@ -37,4 +49,8 @@ document.getElementById("filter-form").addEventListener("submit", function (e) {
             imgElement.src = `data:image/jpeg;base64,${base64String}`;
         })
         .catch((error) => console.error("Error:", error));
-});
\ No newline at end of file
+});
+
+if (window.initialChartData) {
+    drawCategoriesChart(document.getElementById("summary-chart-container"), window.initialChartData);
+}
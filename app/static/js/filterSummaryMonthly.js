@@ -57,6 +57,24 @@ document.getElementById("filter-form").addEventListener("submit", function (e) {
         })
         .catch((error) => console.error("Error:", error));
 
+    if (window.initialChartData) {
+        fetch(`${window.getSummaryPrefix}/chart_data/${year}/${month}/`)
+            .then((response) => response.json())
+            .then((chartData) => {
+                const container = document.getElementById("summary-chart-container");
+                drawPeriodsChart(container, chartData, splitByCategory === "on");
+            })
+            .catch((error) => console.error("Error:", error));
+        return;
+    }
+
+    // both variants of the page's initial period come with the page
+    const preloadedChart = window.preloadedCharts?.[`${year}-${month}`]?.[splitByCategory === "on"];
+    if (preloadedChart) {
+        document.getElementById("summary-chart").src = `data:image/png;base64,${preloadedChart}`;
+        return;
+    }
+
     fetch(url_chart)
         .then((response) => response.arrayBuffer())
         .then((arrayBuffer) => {
@@ -66,4 +84,8 @@ document.getElementById("filter-form").addEventListener("submit", function (e) {
             imgElement.src = `data:image/png;base64,${base64String}`;
         })
         .catch((error) => console.error("Error:", error));
-});
\ No newline at end of file
+});
+
+if (window.initialChartData) {
+    drawPeriodsChart(document.getElementById("summary-chart-container"), window.initialChartData, false);
+}
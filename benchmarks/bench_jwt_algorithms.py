@@ -0,0 +1,87 @@
+"""
+Compares the cost of issuing and checking an access token per request.
+
+Every authenticated request decodes the token, sign-in also creates one:
+pem:    RS256 with PEM text passed to PyJWT, as the service used to do,
+        so the key is parsed on every call.
+RS256:  RS256 with key objects from `JWTKeyRing`.
+EdDSA:  Ed25519 key objects.
+
+Keys are generated in memory, no certs are needed, but settings are:
+    python -m benchmarks.bench_jwt_algorithms
+"""
+
+import timeit
+from functools import partial
+from typing import Callable
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from app.services.auth_service import create_access_token, decode_access_token
+from app.services.jwt_key_ring import JWTKey, JWTKeyRing
+
+NUMBER = 300
+PAYLOAD = {"sub": "etoo"}
+
+
+def make_key_ring(algorithm: str, private_key) -> JWTKeyRing:
+    return JWTKeyRing(
+        JWTKey(
+            kid=algorithm,
+            algorithm=algorithm,
+            private_key=private_key,
+            public_key=private_key.public_key(),
+        )
+    )
+
+
+def to_pem(private_key) -> tuple[str, str]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem.decode(), public_pem.decode()
+
+
+def per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER * 1e6
+
+
+def main() -> None:
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem, public_pem = to_pem(rsa_key)
+    pem_token = jwt.encode(PAYLOAD, private_pem, algorithm="RS256")
+
+    results: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+        "pem": (
+            lambda: jwt.encode(PAYLOAD, private_pem, algorithm="RS256"),
+            lambda: jwt.decode(pem_token, public_pem, algorithms=["RS256"]),
+        ),
+    }
+    for algorithm, private_key in (
+        ("RS256", rsa_key),
+        ("EdDSA", ed25519.Ed25519PrivateKey.generate()),
+    ):
+        key_ring = make_key_ring(algorithm, private_key)
+        token = create_access_token(PAYLOAD, key_ring=key_ring)
+        results[algorithm] = (
+            partial(create_access_token, PAYLOAD, key_ring),
+            partial(decode_access_token, token, key_ring),
+        )
+
+    for name, (encode, decode) in results.items():
+        print(
+            f"{name:>5}: encode {per_call_us(encode):8.1f} us, "
+            f"decode {per_call_us(decode):8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the event loop lag during a burst of concurrent sign-ins.
+
+A ticker task sleeps for `TICK_SEC` in a loop and records how late it
+wakes up, while `SIGN_INS` password checks run concurrently:
+sync:  bcrypt called right in the coroutine, as the handlers used to do.
+async: bcrypt in the bounded thread pool via `verify_password_async`.
+
+Run from the project root (settings and certs are needed for the import):
+    python -m benchmarks.bench_password_hashing_event_loop_lag
+"""
+
+import asyncio
+import time
+
+from app.core.config import settings
+from app.services.auth_service import (
+    hash_password,
+    verify_password,
+    verify_password_async,
+)
+
+SIGN_INS = 20
+TICK_SEC = 0.01
+
+
+async def verify_password_sync(password: str, hashed_password: bytes) -> bool:
+    return verify_password(password, hashed_password)
+
+
+async def measure_lag(verify, hashed_password: bytes) -> tuple[float, float]:
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(TICK_SEC)
+            lags.append(time.perf_counter() - started - TICK_SEC)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_SEC)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(verify("password", hashed_password) for _ in range(SIGN_INS))
+    )
+    total = time.perf_counter() - started
+
+    done.set()
+    await ticker_task
+    return max(lags), total
+
+
+async def main() -> None:
+    hashed_password = hash_password("password")
+    print(f"bcrypt rounds: {settings.auth.bcrypt_rounds}, sign-ins: {SIGN_INS}")
+    for name, verify in (
+        ("sync", verify_password_sync),
+        ("async", verify_password_async),
+    ):
+        max_lag, total = await measure_lag(verify, hashed_password)
+        print(
+            f"{name:>5}: max event loop lag {max_lag * 1000:8.1f} ms, "
+            f"burst took {total * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,169 @@
+"""
+Python-side cost of preparing the hot repository queries for execution:
+building the statement and getting its compiled form, no database needed.
+
+select:   select() built per call, compiled each time (no compiled cache).
+cached:   select() built per call, its cache key generated and the compiled
+          form taken from the compiled cache, the engine's default.
+lambda:   the repository's lambda statement, built and compiled once,
+          later calls only look up the cache and extract the parameters.
+
+Run from the project root:
+    python -m benchmarks.bench_statement_compilation
+"""
+
+import re
+import timeit
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy import and_, desc, func, select
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+from sqlalchemy.orm import joinedload
+
+from app.models import SpendingsModel, UserModel, UsersSpendingCategoriesModel
+from app.repositories import spendings_repo, user_repo, user_spend_cat_repo
+
+NUMBER = 2_000
+REPEAT = 5
+USER_ID = 12
+
+
+def make_annual_summary_select(user_id: int, year: int) -> Any:
+    return (
+        select(
+            func.sum(SpendingsModel.amount).label("amount"),
+            UsersSpendingCategoriesModel.category_name,
+            func.extract("month", SpendingsModel.date).label("month"),
+        )
+        .join(
+            UsersSpendingCategoriesModel,
+            SpendingsModel.category_id == UsersSpendingCategoriesModel.id,
+        )
+        .where(
+            and_(
+                SpendingsModel.user_id == user_id,
+                SpendingsModel.date >= datetime(year, 1, 1),
+                SpendingsModel.date < datetime(year + 1, 1, 1),
+            )
+        )
+        .group_by(
+            UsersSpendingCategoriesModel.category_name,
+            func.extract("month", SpendingsModel.date),
+        )
+        .order_by(
+            "month",
+            desc("amount"),
+            UsersSpendingCategoriesModel.category_name,
+        )
+    )
+
+
+def make_category_select(user_id: int, category_name: str) -> Any:
+    return select(UsersSpendingCategoriesModel).filter(
+        func.lower(UsersSpendingCategoriesModel.category_name)
+        == func.lower(category_name),
+        UsersSpendingCategoriesModel.user_id == user_id,
+    )
+
+
+def make_transaction_select(transaction_id: int) -> Any:
+    return (
+        select(SpendingsModel)
+        .filter_by(id=transaction_id)
+        .options(joinedload(SpendingsModel.category))
+    )
+
+
+def make_user_select(username: str) -> Any:
+    return select(UserModel).filter(UserModel.username.ilike(username))
+
+
+def get_sql(compiled: Any) -> str:
+    return re.sub(r"%\(\w+\)s", "?", str(compiled))
+
+
+class Executed(Exception):
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+class StatementCatcher:
+    async def execute(self, statement: Any) -> Any:
+        raise Executed(statement)
+
+
+def get_lambda_statement(method: Callable, *args: Any) -> Any:
+    """
+    The statement a repository method executes, caught from its
+    `session.execute` call.
+    """
+    coroutine = method(StatementCatcher(), *args)
+    try:
+        coroutine.send(None)
+    except Executed as executed:
+        return executed.statement
+    finally:
+        coroutine.close()
+
+
+QUERIES: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+    "annual summary": (
+        lambda: make_annual_summary_select(USER_ID, 2025),
+        lambda: spendings_repo.make_annual_summary_query(USER_ID, 2025),
+    ),
+    "category lookup": (
+        lambda: make_category_select(USER_ID, "Food"),
+        lambda: get_lambda_statement(
+            user_spend_cat_repo.get_category, USER_ID, "Food"
+        ),
+    ),
+    "transaction by id": (
+        lambda: make_transaction_select(42),
+        lambda: get_lambda_statement(
+            spendings_repo.get_transaction_with_category, 42
+        ),
+    ),
+    "user by username": (
+        lambda: make_user_select("user"),
+        lambda: get_lambda_statement(user_repo.get_by_username, "user"),
+    ),
+}
+
+
+def main() -> None:
+    dialect = PGDialect_psycopg()
+    compiled_cache: dict = {}
+
+    def compile_with_cache(statement: Any) -> Any:
+        compiled, *_ = statement._compile_w_cache(
+            dialect,
+            compiled_cache=compiled_cache,
+            column_keys=[],
+        )
+        return compiled
+
+    for name, (make_select, make_lambda) in QUERIES.items():
+        # the same SQL, up to the names of the bound parameters
+        assert get_sql(compile_with_cache(make_select())) == get_sql(
+            compile_with_cache(make_lambda())
+        )
+
+        timings = [
+            min(timeit.repeat(run, number=NUMBER, repeat=REPEAT)) / NUMBER
+            for run in (
+                lambda: make_select().compile(dialect=dialect),
+                lambda: compile_with_cache(make_select()),
+                lambda: compile_with_cache(make_lambda()),
+            )
+        ]
+        select_time, cached_time, lambda_time = (t * 1e6 for t in timings)
+        print(
+            f"{name:>18}: select {select_time:7.1f} us, "
+            f"cached {cached_time:7.1f} us, lambda {lambda_time:7.1f} us, "
+            f"x{cached_time / lambda_time:.1f} vs cached"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares serialization of the transactions list response.
+
+old: rows -> STransactionResponse per row -> jsonable_encoder -> orjson,
+     which is what FastAPI does for a `response_model=None` route.
+new: rows as dicts (microseconds already truncated in SQL) -> orjson,
+     which is what the list routes return as ORJSONResponse.
+
+Run from the project root:
+    python -m benchmarks.bench_transactions_serialization
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas.transactions_schemas import STransactionResponse
+
+ROWS_QTY = (100, 1_000, 10_000)
+REPEAT = 5
+
+
+def make_rows(qty: int) -> list[dict]:
+    start = datetime(2025, 1, 1)
+    return [
+        {
+            "amount": i * 10,
+            "category_name": f"Category {i % 12}",
+            "description": f"Transaction number {i}",
+            "date": start + timedelta(minutes=i),
+            "id": i,
+        }
+        for i in range(qty)
+    ]
+
+
+def serialize_with_models(rows: list[dict]) -> bytes:
+    models = [STransactionResponse.model_validate(row) for row in rows]
+    return orjson.dumps(jsonable_encoder(models))
+
+
+def serialize_rows(rows: list[dict]) -> bytes:
+    return orjson.dumps(rows)
+
+
+def main() -> None:
+    for qty in ROWS_QTY:
+        rows = make_rows(qty)
+        assert orjson.loads(serialize_with_models(rows)) == orjson.loads(
+            serialize_rows(rows)
+        )
+
+        old = min(
+            timeit.repeat(
+                lambda: serialize_with_models(rows), number=1, repeat=REPEAT
+            )
+        )
+        new = min(
+            timeit.repeat(lambda: serialize_rows(rows), number=1, repeat=REPEAT)
+        )
+        print(
+            f"{qty:>6} rows: models {old * 1000:8.2f} ms, "
+            f"rows {new * 1000:8.2f} ms, x{old / new:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
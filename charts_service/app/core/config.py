@@ -25,6 +25,34 @@ def get_correct_cwd(
 class MessageBrokerConfig(BaseModel):
     url: str
     charts_service_queue_name: str = "charts-service-queue"
+    # Must match the app's setting, queue arguments can't differ
+    # between the declarations.
+    charts_queues_max_priority: int = 5
+
+
+class ChartsConfig(BaseModel):
+    # Consumer processes, None means one per CPU core
+    workers: int | None = None
+    # Render processes of each worker for several charts of a page,
+    # None means the CPU cores are split between the workers
+    batch_workers: int | None = None
+    # Unacked messages a worker takes from a queue at once. A worker
+    # renders one chart at a time, with a higher prefetch the rest wait
+    # for it even when other workers are idle.
+    prefetch_count: int = 1
+    # Overrides by queue: "render_charts" for the charts RPC, or "jobs"
+    # for the chart jobs queue, e.g. CHARTS__HANDLERS_PREFETCH_COUNT='{"jobs": 2}'
+    handlers_prefetch_count: dict[str, int] = {}
+
+    # How long stopping workers may finish renders in flight
+    # before they are killed
+    drain_timeout_sec: float = 30
+    # Port of the /health and /ready endpoints, None disables them
+    health_host: str = "0.0.0.0"
+    health_port: int | None = 8081
+
+    def get_prefetch_count(self, handler_name: str) -> int:
+        return self.handlers_prefetch_count.get(handler_name, self.prefetch_count)
 
 
 class Settings(BaseSettings):
@@ -36,6 +64,7 @@ class Settings(BaseSettings):
     )
 
     broker: MessageBrokerConfig
+    charts: ChartsConfig = ChartsConfig()
 
 
 settings = Settings()  # type: ignore
@@ -1,53 +1,284 @@
 import asyncio
+import inspect
+import logging
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache, partial
+from multiprocessing.synchronize import Event
+from typing import Any, Callable
 
-from aio_pika import connect_robust
-from aio_pika.patterns import RPC
+from aio_pika import Message, connect_robust
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractIncomingMessage,
+    AbstractQueue,
+    AbstractRobustConnection,
+    ConsumerTag,
+)
 
-from app.core.config import settings
+from charts_service.app.core.config import settings
 from charts_service.app.services import (
+    MEDIA_TYPES,
     create_annual_chart_with_categories,
+    create_balance_chart,
+    create_box_plot_chart,
+    create_buckets_chart,
     create_monthly_chart_with_categories,
     create_simple_bar_chart,
     create_simple_chart,
 )
+from charts_service.app.supervisor import Supervisor
+from charts_service.rpc import ChartsRPC, loads_payload
 
+logger = logging.getLogger(__name__)
 
-async def main() -> None:
-    connection = await connect_robust(
-        settings.broker.url,
+CHART_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "create_simple_chart": create_simple_chart,
+    "create_simple_bar_chart": create_simple_bar_chart,
+    "create_annual_chart_with_categories": create_annual_chart_with_categories,
+    "create_monthly_chart_with_categories": create_monthly_chart_with_categories,
+    "create_balance_chart": create_balance_chart,
+    "create_buckets_chart": create_buckets_chart,
+    "create_box_plot_chart": create_box_plot_chart,
+}
+
+
+async def render_chart(method_name: str, params: dict[str, Any]) -> bytes:
+    result = CHART_FUNCTIONS[method_name](**params)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _render_chart_sync(method_name: str, params: dict[str, Any]) -> bytes:
+    return asyncio.run(render_chart(method_name, params))
+
+
+def get_workers_count() -> int:
+    return settings.charts.workers or os.cpu_count() or 1
+
+
+@cache
+def get_render_executor() -> ThreadPoolExecutor:
+    # pyplot keeps global state and isn't thread-safe, so all single renders
+    # of a worker run in this one thread. The event loop stays free for
+    # heartbeats, replies and shutdown signals meanwhile.
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+
+
+@cache
+def get_batch_executor() -> ProcessPoolExecutor:
+    # Several charts of a page are rendered in parallel in processes.
+    # It's created in the worker process on first use, not at import,
+    # so it isn't inherited on fork.
+    max_workers = settings.charts.batch_workers or max(
+        1, (os.cpu_count() or 1) // get_workers_count()
+    )
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+async def render_charts(charts: list[dict[str, Any]]) -> list[bytes]:
+    """
+    The charts RPC method. Charts of every kind share its queue, so their
+    priorities are compared with each other: a small chart is taken before
+    a heavy split one that waits in the queue.
+
+    Every item is a dict with the `method_name` and `params` keys, charts
+    are returned in the same order, in one reply. A single chart is
+    rendered in the worker's render thread, several in parallel
+    in processes.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_render_executor() if len(charts) == 1 else get_batch_executor()
+    return await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                executor,
+                _render_chart_sync,
+                chart["method_name"],
+                chart["params"],
+            )
+            for chart in charts
+        )
     )
 
-    channel = await connection.channel()
 
-    rpc = await RPC.create(channel)
+class InFlight:
+    """
+    Counts messages being processed, so a stopping worker can wait for them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def __aenter__(self) -> None:
+        self.count += 1
+        self._idle.clear()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.count -= 1
+        if not self.count:
+            self._idle.set()
+
+    async def wait(self) -> None:
+        await self._idle.wait()
+
+
+in_flight = InFlight()
+
 
+class WorkerRPC(ChartsRPC):
+    async def on_call_message(
+        self,
+        method_name: str,
+        message: AbstractIncomingMessage,
+    ) -> None:
+        async with in_flight:
+            await super().on_call_message(method_name, message)  # type: ignore
+
+
+async def handle_chart_job(
+    channel: AbstractChannel,
+    message: AbstractIncomingMessage,
+) -> None:
+    """
+    Renders a chart job and publishes the result to the job's result queue
+    (`reply_to`), where the app picks it up when the client polls.
+    """
+    async with in_flight, message.process(requeue=False):
+        try:
+            params = loads_payload(message.body, message.content_encoding)
+            chart = await asyncio.get_running_loop().run_in_executor(
+                get_render_executor(),
+                _render_chart_sync,
+                str(message.headers["method_name"]),
+                params,
+            )
+            reply = Message(
+                body=chart,
+                headers={"status": "done"},
+                content_type=MEDIA_TYPES[params.get("format", "png")],
+            )
+        except Exception:
+            logger.exception("Chart job %s failed", message.correlation_id)
+            reply = Message(body=b"", headers={"status": "failed"})
+
+        reply.correlation_id = message.correlation_id
+        await channel.default_exchange.publish(
+            reply,
+            routing_key=str(message.reply_to),
+        )
+
+
+async def consume(
+    connection: AbstractRobustConnection,
+) -> list[tuple[AbstractQueue, ConsumerTag]]:
+    """
+    Subscribes to the charts RPC and chart jobs queues. Every queue has its
+    own channel, so its prefetch is set separately: a burst of jobs doesn't
+    take the prefetch of interactive charts. A robust channel restores its
+    qos after a reconnect.
+
+    Queues are durable, so calls queued while no worker is up survive
+    a broker restart, and are priority queues.
+
+    Returns the consumers to cancel on shutdown.
+    """
+    queue_arguments = {
+        "x-max-priority": settings.broker.charts_queues_max_priority,
+    }
+
+    rpc_channel = await connection.channel()
+    await rpc_channel.set_qos(
+        prefetch_count=settings.charts.get_prefetch_count("render_charts"),
+    )
+    rpc = await WorkerRPC.create(rpc_channel)
     # first param is also the queue name
     await rpc.register(
-        "create_simple_chart",
-        create_simple_chart,
-        auto_delete=True,
+        "render_charts",
+        render_charts,
+        durable=True,
+        arguments=dict(queue_arguments),
     )
-    await rpc.register(
-        "create_simple_bar_chart",
-        create_simple_bar_chart,
-        auto_delete=True,
+    consumers = [
+        (rpc.queues[registered], consumer_tag)
+        for registered, consumer_tag in rpc.consumer_tags.items()
+    ]
+
+    jobs_channel = await connection.channel()
+    await jobs_channel.set_qos(
+        prefetch_count=settings.charts.get_prefetch_count("jobs"),
     )
-    await rpc.register(
-        "create_annual_chart_with_categories",
-        create_annual_chart_with_categories,
-        auto_delete=True,
+    jobs_queue = await jobs_channel.declare_queue(
+        settings.broker.charts_service_queue_name,
+        durable=True,
+        arguments=queue_arguments,
     )
-    await rpc.register(
-        "create_monthly_chart_with_categories",
-        create_monthly_chart_with_categories,
-        auto_delete=True,
+    consumer_tag = await jobs_queue.consume(
+        partial(handle_chart_job, jobs_channel)
     )
+    consumers.append((jobs_queue, consumer_tag))
+    return consumers
+
+
+async def worker(ready: Event | None = None) -> None:
+    """
+    Consumes until SIGTERM or SIGINT. Then it stops taking new messages
+    and exits once the messages in flight are processed. Messages it had
+    prefetched but not started are requeued by the broker when the
+    connection closes.
+    """
+    loop = asyncio.get_running_loop()
+    stopping = asyncio.Event()
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signal_number, stopping.set)
 
+    connection = await connect_robust(
+        settings.broker.url,
+    )
     try:
-        await asyncio.Future()
+        consumers = await consume(connection)
+        if ready:
+            ready.set()
+
+        await stopping.wait()
+        if ready:
+            ready.clear()
+        logger.info("Draining, %s messages in flight", in_flight.count)
+        for queue, consumer_tag in consumers:
+            await queue.cancel(consumer_tag)
+        await in_flight.wait()
     finally:
         await connection.close()
+        # Executors are only shut down if the worker has used them.
+        if get_render_executor.cache_info().currsize:
+            get_render_executor().shutdown()
+        if get_batch_executor.cache_info().currsize:
+            get_batch_executor().shutdown(cancel_futures=True)
+
+
+def run_worker(ready: Event | None = None) -> None:
+    asyncio.run(worker(ready))
+
+
+def main() -> None:
+    """
+    Runs `settings.charts.workers` consumer processes under a supervisor.
+    Renders are CPU-bound and pyplot is single-threaded, so throughput
+    scales with processes, not with coroutines or threads.
+    """
+    logging.basicConfig(level=logging.INFO)
+    Supervisor(
+        target=run_worker,
+        workers_count=get_workers_count(),
+        drain_timeout_sec=settings.charts.drain_timeout_sec,
+        health_host=settings.charts.health_host,
+        health_port=settings.charts.health_port,
+    ).run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
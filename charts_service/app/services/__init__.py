@@ -1,13 +1,21 @@
 from .charts_service import (
+    MEDIA_TYPES,
     create_annual_chart_with_categories,
+    create_balance_chart,
+    create_box_plot_chart,
+    create_buckets_chart,
     create_monthly_chart_with_categories,
     create_simple_bar_chart,
     create_simple_chart,
 )
 
 __all__ = [
+    "MEDIA_TYPES",
     "create_simple_chart",
     "create_annual_chart_with_categories",
     "create_monthly_chart_with_categories",
     "create_simple_bar_chart",
+    "create_balance_chart",
+    "create_buckets_chart",
+    "create_box_plot_chart",
 ]
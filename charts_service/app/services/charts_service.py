@@ -2,10 +2,17 @@ import io
 from random import shuffle
 from typing import Literal
 
+import matplotlib
 import matplotlib.pyplot as plt
-import pandas as pd
 import seaborn as sns
 
+ChartFormat = Literal["png", "svg", "webp"]
+MEDIA_TYPES: dict[ChartFormat, str] = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "webp": "image/webp",
+}
+
 COLORS = [
     "#005f73",
     "#0a9396",
@@ -39,6 +46,8 @@ async def create_simple_chart(
     values: list[float],
     labels: list,
     chart_type: Literal["pie", "barplot"],
+    format: ChartFormat = "png",
+    dpi: int | None = None,
 ) -> bytes:
     colors_palette = COLORS.copy()
     shuffle(colors_palette)
@@ -48,12 +57,7 @@ async def create_simple_chart(
     else:
         await _create_barplot_chart(values, labels, colors_palette)
 
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format="png")
-    plt.close()
-    buffer.seek(0)
-
-    return buffer.getvalue()
+    return _save_figure(format, dpi)
 
 
 def create_simple_bar_chart(
@@ -65,6 +69,8 @@ def create_simple_bar_chart(
     ylabel: str = "Summary amount",
     color: str = "purple",
     linewidth: int = 2,
+    format: ChartFormat = "png",
+    dpi: int | None = None,
 ):
     x_labels = [i for i in range(1, len(values) + 1)]
 
@@ -90,135 +96,233 @@ def create_simple_bar_chart(
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
 
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format="png")
-    plt.close()
-    buffer.seek(0)
-
-    return buffer.getvalue()
+    return _save_figure(format, dpi)
 
 
 def create_annual_chart_with_categories(
-    data: list[dict],
-    categories: set,
+    periods: list[int],
+    categories: list[str],
+    values: list[list[int]],
+    totals: list[int],
     width: int,
     height: int,
     title: str,
     xlabel: str = "Month",
     ylabel: str = "Summary amount",
+    format: ChartFormat = "png",
+    dpi: int | None = None,
 ):
-    if not data:
-        df = pd.DataFrame({"month_number": range(1, 13)})
-        for category in categories:
-            df[category] = 0
-        df["total_amount"] = 0
-    else:
-        df = pd.DataFrame(data)
+    sns.set_theme(style="darkgrid")
+    _create_stacked_bar_chart(
+        periods, categories, values, totals, width, height, title, xlabel, ylabel
+    )
+    return _save_figure(format, dpi)
 
-    all_months = pd.DataFrame({"month_number": range(1, 13)})
-    df = pd.merge(all_months, df, on="month_number", how="left").fillna(0)
 
-    for col in df.columns:
-        if col != "month_number":
-            df[col] = df[col].astype(int)
+def create_monthly_chart_with_categories(
+    periods: list[int],
+    categories: list[str],
+    values: list[list[int]],
+    totals: list[int],
+    width: int,
+    height: int,
+    title: str,
+    xlabel: str = "Day",
+    ylabel: str = "Summary amount",
+    format: ChartFormat = "png",
+    dpi: int | None = None,
+):
+    sns.set_theme(style="whitegrid")
+    _create_stacked_bar_chart(
+        periods, categories, values, totals, width, height, title, xlabel, ylabel
+    )
+    return _save_figure(format, dpi)
 
-    sns.set_theme(style="darkgrid")
 
+def create_buckets_chart(
+    labels: list[str],
+    categories: list[str],
+    values: list[list[int]],
+    totals: list[int],
+    width: int,
+    height: int,
+    title: str,
+    xlabel: str,
+    ylabel: str = "Summary amount",
+    format: ChartFormat = "png",
+    dpi: int | None = None,
+):
+    """
+    A bar per time bucket labeled with its start date, categories are
+    stacked if the summary is split by them.
+    """
+    sns.set_theme(style="whitegrid")
+    if not categories:
+        categories, values = ["Total"], [totals]
+    _create_stacked_bar_chart(
+        list(range(len(labels))),
+        categories,
+        values,
+        totals,
+        width,
+        height,
+        title,
+        xlabel,
+        ylabel,
+        labels=labels,
+    )
+    return _save_figure(format, dpi)
+
+
+def create_balance_chart(
+    labels: list[str],
+    income: list[int],
+    spendings: list[int],
+    net: list[int],
+    width: int,
+    height: int,
+    title: str,
+    xlabel: str,
+    ylabel: str = "Amount",
+    format: ChartFormat = "png",
+    dpi: int | None = None,
+):
+    """
+    Income and spendings bars side by side per period,
+    with the net amount drawn over them as a line.
+    """
+    sns.set_theme(style="whitegrid")
     fig, ax = plt.subplots()
     fig.set_figwidth(width)
     fig.set_figheight(height)
 
-    bottom = pd.Series([0] * len(df))
-
-    for category in categories:
-        ax.bar(df["month_number"], df[category], bottom=bottom, label=category)
-        bottom += df[category]
-
-    for i, total in enumerate(df["total_amount"]):
-        ax.text(
-            df["month_number"][i] - 0.1,
-            total,
-            f"{total}",
-            color="black",
-            fontsize=10,
-        )
-
-    ax.set_xticks(df["month_number"])
-    ax.set_xticklabels(df["month_number"])
+    positions = list(range(len(labels)))
+    bar_width = 0.4
+    ax.bar(
+        [position - bar_width / 2 for position in positions],
+        income,
+        width=bar_width,
+        color=COLORS[1],
+        label="Income",
+    )
+    ax.bar(
+        [position + bar_width / 2 for position in positions],
+        spendings,
+        width=bar_width,
+        color=COLORS[7],
+        label="Spendings",
+    )
+    ax.plot(positions, net, color=COLORS[0], marker="o", label="Net")
+    ax.axhline(0, color="black", linewidth=0.8)
 
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels, rotation=45 if len(labels) > 12 else 0)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
     ax.set_title(title)
     ax.legend()
-
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format="png")
-    plt.close()
-    buffer.seek(0)
-
-    return buffer.getvalue()
+    fig.tight_layout()
+    return _save_figure(format, dpi)
 
 
-def create_monthly_chart_with_categories(
-    data: list[dict],
-    days_in_month: int,
-    categories: set,
+def create_box_plot_chart(
+    labels: list[str],
+    boxes: list[list[float]],
     width: int,
     height: int,
     title: str,
-    xlabel: str = "Day",
-    ylabel: str = "Summary amount",
+    ylabel: str = "Amount",
+    format: ChartFormat = "png",
+    dpi: int | None = None,
 ):
-    if not data:
-        df = pd.DataFrame({"day_number": range(1, days_in_month + 1)})
-        for category in categories:
-            df[category] = 0
-        df["total_amount"] = 0
-    else:
-        df = pd.DataFrame(data)
-
-    all_days = pd.DataFrame({"day_number": range(1, days_in_month + 1)})
-    df = pd.merge(all_days, df, on="day_number", how="left").fillna(0)
+    """
+    Box plots from precomputed stats, each box is
+    [min, first quartile, median, third quartile, 90th percentile, max]:
+    the whiskers reach the min and the max, the 90th percentile is a dot.
+    """
+    sns.set_theme(style="whitegrid")
+    fig, ax = plt.subplots()
+    fig.set_figwidth(width)
+    fig.set_figheight(height)
 
-    for col in df.columns:
-        if col != "day_number":
-            df[col] = df[col].astype(int)
+    positions = list(range(1, len(boxes) + 1))
+    # bxp can't lay out an empty plot
+    if boxes:
+        ax.bxp(
+            [
+                dict(whislo=low, q1=q1, med=median, q3=q3, whishi=high, fliers=[])
+                for low, q1, median, q3, _, high in boxes
+            ],
+            showfliers=False,
+            patch_artist=True,
+            boxprops=dict(facecolor=COLORS[2]),
+            medianprops=dict(color=COLORS[0], linewidth=2),
+        )
+        ax.scatter(
+            positions,
+            [box[4] for box in boxes],
+            color=COLORS[6],
+            marker="D",
+            zorder=3,
+            label="90th percentile",
+        )
+        ax.legend()
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels, rotation=45 if len(labels) > 12 else 0)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    fig.tight_layout()
+    return _save_figure(format, dpi)
 
-    sns.set_theme(style="whitegrid")
 
+def _create_stacked_bar_chart(
+    periods: list[int],
+    categories: list[str],
+    values: list[list[int]],
+    totals: list[int],
+    width: int,
+    height: int,
+    title: str,
+    xlabel: str,
+    ylabel: str,
+    labels: list[str] | None = None,
+):
+    """
+    Draws a bar per period with categories stacked on each other.
+    The data is columnar: `values[i][j]` is the amount of `categories[i]`
+    in `periods[j]`, periods without transactions hold zeros.
+    Periods are labeled with `labels` if given.
+    """
     fig, ax = plt.subplots()
     fig.set_figwidth(width)
     fig.set_figheight(height)
 
-    bottom = pd.Series([0] * len(df))
+    bottom = [0] * len(periods)
+    for category, amounts in zip(categories, values):
+        ax.bar(periods, amounts, bottom=bottom, label=category)
+        bottom = [b + amount for b, amount in zip(bottom, amounts)]
 
-    for category in categories:
-        ax.bar(df["day_number"], df[category], bottom=bottom, label=category)
-        bottom += df[category]
-
-    for i, total in enumerate(df["total_amount"]):
+    for period, total in zip(periods, totals):
         ax.text(
-            df["day_number"][i] - 0.1,
+            period - 0.1,
             total,
             f"{total}",
             color="black",
             fontsize=10,
         )
 
-    ax.set_xticks(df["day_number"])
-    ax.set_xticklabels(df["day_number"])
+    ax.set_xticks(periods)
+    if labels is None:
+        ax.set_xticklabels(periods)
+    else:
+        ax.set_xticklabels(labels, rotation=45 if len(labels) > 12 else 0)
 
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
     ax.set_title(title)
     ax.legend()
-
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format="png")
-    plt.close()
-    buffer.seek(0)
-
-    return buffer.getvalue()
+    if labels is not None:
+        fig.tight_layout()
 
 
 async def _create_pie_chart(
@@ -236,3 +340,13 @@ async def _create_barplot_chart(
 ):
     colors = colors[: len(labels)]
     sns.barplot(x=labels, y=values, palette=colors, hue=labels, legend=False)
+
+
+def _save_figure(format: ChartFormat = "png", dpi: int | None = None) -> bytes:
+    # Keeping SVG text as <text> instead of glyph paths roughly halves
+    # the file size.
+    with matplotlib.rc_context({"svg.fonttype": "none"}):
+        buffer = io.BytesIO()
+        plt.savefig(buffer, format=format, dpi=dpi)
+    plt.close()
+    return buffer.getvalue()
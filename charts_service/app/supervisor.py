@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import multiprocessing
+import signal
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+WorkerTarget = Callable[[Event], None]
+
+
+@dataclass(slots=True)
+class WorkerProcess:
+    process: BaseProcess
+    # set by the worker while it's consuming
+    ready: Event
+    started_at: float
+    # exits in a row, the restart delay doubles with each of them
+    failures: int = 0
+    restart_at: float | None = None
+
+
+class Supervisor:
+    """
+    Runs `workers_count` worker processes and restarts the ones that die.
+    Restarts back off from `restart_delay_sec` up to `max_restart_delay_sec`,
+    so workers that can't start (e.g. the broker is down) don't respawn
+    in a tight loop. A worker that ran longer than the maximum delay
+    starts the backoff over.
+
+    On SIGTERM or SIGINT it passes SIGTERM to the workers, which stop
+    consuming and finish the messages in flight, and waits up to
+    `drain_timeout_sec` for them before killing the rest.
+
+    If `health_port` is set, it's served over HTTP:
+    `/health` answers 200 while the supervisor runs,
+    `/ready` while every worker is consuming and nothing is stopping.
+    """
+
+    def __init__(
+        self,
+        target: WorkerTarget,
+        workers_count: int,
+        drain_timeout_sec: float,
+        health_host: str = "0.0.0.0",
+        health_port: int | None = None,
+        check_interval_sec: float = 1,
+        restart_delay_sec: float = 1,
+        max_restart_delay_sec: float = 60,
+    ):
+        self.target = target
+        self.workers_count = workers_count
+        self.drain_timeout_sec = drain_timeout_sec
+        self.health_host = health_host
+        self.health_port = health_port
+        self.check_interval_sec = check_interval_sec
+        self.restart_delay_sec = restart_delay_sec
+        self.max_restart_delay_sec = max_restart_delay_sec
+        # Spawned workers don't inherit the supervisor's event loop.
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: list[WorkerProcess] = []
+        self._stopping = asyncio.Event()
+
+    def run(self) -> None:
+        asyncio.run(self.serve())
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def is_ready(self) -> bool:
+        return (
+            not self._stopping.is_set()
+            and len(self._workers) == self.workers_count
+            and all(
+                worker.process.is_alive() and worker.ready.is_set()
+                for worker in self._workers
+            )
+        )
+
+    async def serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signal_number, self.stop)
+
+        health_server = None
+        if self.health_port is not None:
+            health_server = await asyncio.start_server(
+                self._handle_health_request,
+                self.health_host,
+                self.health_port,
+            )
+
+        self._workers = [
+            self._start_worker(number) for number in range(self.workers_count)
+        ]
+        try:
+            while not self._stopping.is_set():
+                self._restart_dead_workers(loop.time())
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        self.check_interval_sec,
+                    )
+                except TimeoutError:
+                    pass
+            await self._stop_workers()
+        finally:
+            for signal_number in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(signal_number)
+            if health_server:
+                health_server.close()
+                await health_server.wait_closed()
+
+    def _start_worker(self, number: int, failures: int = 0) -> WorkerProcess:
+        ready = self._context.Event()
+        process = self._context.Process(
+            target=self.target,
+            args=(ready,),
+            name=f"charts-worker-{number}",
+        )
+        process.start()
+        return WorkerProcess(
+            process,
+            ready,
+            started_at=asyncio.get_running_loop().time(),
+            failures=failures,
+        )
+
+    def _restart_dead_workers(self, now: float) -> None:
+        for number, worker in enumerate(self._workers):
+            if worker.process.is_alive():
+                continue
+            if worker.restart_at is None:
+                if now - worker.started_at > self.max_restart_delay_sec:
+                    worker.failures = 0
+                delay = min(
+                    self.restart_delay_sec * 2**worker.failures,
+                    self.max_restart_delay_sec,
+                )
+                worker.failures += 1
+                worker.restart_at = now + delay
+                logger.warning(
+                    "%s exited with code %s, restarting in %s s",
+                    worker.process.name,
+                    worker.process.exitcode,
+                    delay,
+                )
+            elif now >= worker.restart_at:
+                self._workers[number] = self._start_worker(number, worker.failures)
+
+    async def _stop_workers(self) -> None:
+        logger.info("Stopping %s workers", len(self._workers))
+        for worker in self._workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.drain_timeout_sec
+        while loop.time() < deadline and any(
+            worker.process.is_alive() for worker in self._workers
+        ):
+            await asyncio.sleep(0.1)
+
+        for worker in self._workers:
+            if worker.process.is_alive():
+                logger.warning(
+                    "%s didn't drain in %s s, killing it",
+                    worker.process.name,
+                    self.drain_timeout_sec,
+                )
+                worker.process.kill()
+            worker.process.join()
+
+    async def _handle_health_request(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            path = request_line[1] if len(request_line) > 1 else ""
+            if path == "/health":
+                status = "200 OK"
+            elif path == "/ready":
+                status = "200 OK" if self.is_ready() else "503 Service Unavailable"
+            else:
+                status = "404 Not Found"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Length: 0\r\n"
+                "Connection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+        finally:
+            writer.close()
@@ -0,0 +1,101 @@
+import time
+import zlib
+from typing import Any
+
+import orjson
+from aio_pika import DeliveryMode, Message
+from aio_pika.abc import AbstractIncomingMessage
+from aio_pika.patterns import RPC
+from aio_pika.patterns.rpc import RPCMessageType
+
+# The wire format of the charts RPC. It's imported by both charts_service
+# and the app, so the two sides always agree on it. Keep it free of heavy
+# charts_service imports (matplotlib, seaborn).
+
+JSON_CONTENT_TYPE = "application/json"
+CHART_CONTENT_TYPE = "application/octet-stream"
+CHARTS_BATCH_CONTENT_TYPE = "application/x-charts-batch"
+
+# Smaller payloads aren't worth the CPU, they fit a frame anyway.
+COMPRESSION_THRESHOLD = 4096
+COMPRESSED_ENCODING = "deflate"
+
+
+def dumps_payload(payload: Any) -> tuple[bytes, str | None]:
+    """
+    Encodes a JSON payload, compressing it when it's large.
+    Returns the body and its content encoding.
+    """
+    body = orjson.dumps(payload)
+    if len(body) > COMPRESSION_THRESHOLD:
+        return zlib.compress(body, 1), COMPRESSED_ENCODING
+    return body, None
+
+
+def loads_payload(body: bytes, content_encoding: str | None = None) -> Any:
+    if content_encoding == COMPRESSED_ENCODING:
+        body = zlib.decompress(body)
+    return orjson.loads(body)
+
+
+class ChartsRPC(RPC):
+    """
+    RPC without pickle: kwargs and errors are sent as JSON, rendered charts
+    as raw bytes. A reply with several charts is the charts concatenated,
+    with their sizes in the `chart_sizes` header.
+    """
+
+    def serialize_exception(self, exception: Exception) -> Any:
+        return {
+            "error": {
+                "type": exception.__class__.__name__,
+                "message": repr(exception),
+            },
+        }
+
+    async def serialize_message(
+        self,
+        payload: Any,
+        message_type: RPCMessageType,
+        correlation_id: str | None,
+        delivery_mode: DeliveryMode,
+        **kwargs: Any,
+    ) -> Message:
+        headers = kwargs.pop("headers", None) or {}
+        content_encoding = None
+        if isinstance(payload, bytes):
+            body, content_type = payload, CHART_CONTENT_TYPE
+        elif isinstance(payload, list) and all(
+            isinstance(item, bytes) for item in payload
+        ):
+            body, content_type = b"".join(payload), CHARTS_BATCH_CONTENT_TYPE
+            headers["chart_sizes"] = [len(item) for item in payload]
+        else:
+            if isinstance(payload, Exception):
+                payload = self.serialize_exception(payload)
+            body, content_encoding = dumps_payload(payload)
+            content_type = JSON_CONTENT_TYPE
+
+        return Message(
+            body,
+            headers=headers,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            correlation_id=correlation_id,
+            delivery_mode=delivery_mode,
+            timestamp=time.time(),
+            type=message_type.value,
+            **kwargs,
+        )
+
+    async def deserialize_message(self, message: AbstractIncomingMessage) -> Any:
+        if message.content_type == CHART_CONTENT_TYPE:
+            return message.body
+        if message.content_type == CHARTS_BATCH_CONTENT_TYPE:
+            sizes: list[int] = message.headers["chart_sizes"]  # type: ignore
+            charts, offset = [], 0
+            for size in sizes:
+                charts.append(message.body[offset : offset + size])
+                offset += size
+            return charts
+        return loads_payload(message.body, message.content_encoding)
@@ -10,6 +10,7 @@ from app.main import main_app
 from app.models import Base, UserModel
 from app.schemas.saving_goals_schemas import SSavingGoalUpdatePartial
 from app.services import user_spend_cat_service
+from app.services.chart_jobs import ChartJobsClient, chart_jobs_client
 from tests.factories import (
     SavingGoalUpdateFactory,
     TransactionCategoryUpdateFactory,
@@ -48,6 +49,16 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest.fixture
+async def chart_jobs() -> AsyncGenerator[ChartJobsClient, None]:
+    """
+    The chart jobs client, its broker connection is closed after the test
+    even if the test fails.
+    """
+    yield chart_jobs_client
+    await chart_jobs_client.close()
+
+
 @pytest.fixture
 async def user(db_session: AsyncSession) -> UserModel:
     user = await add_obj_to_db(UserFactory(), db_session)
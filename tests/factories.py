@@ -5,9 +5,11 @@ from factory import LazyFunction
 from factory.faker import faker
 
 from app.models import (
+    IncomeModel,
     SavingGoalsModel,
     SpendingsModel,
     UserModel,
+    UsersIncomeCategoriesModel,
     UsersSpendingCategoriesModel,
 )
 from app.schemas.saving_goals_schemas import (
@@ -98,6 +100,19 @@ class SpendingsFactory(factory.Factory):
     category_id = None
 
 
+class UsersIncomeCategoriesFactory(factory.Factory):
+    class Meta:
+        model = UsersIncomeCategoriesModel
+
+    category_name = LazyFunction(lambda: fake.text(max_nb_chars=20))
+    user_id = None
+
+
+class IncomeFactory(SpendingsFactory):
+    class Meta:
+        model = IncomeModel
+
+
 class STransactionCreateFactory(factory.Factory):
     class Meta:
         model = STransactionCreate
@@ -5,6 +5,7 @@ import factory
 from factory import LazyFunction
 from factory.faker import faker
 from httpx import AsyncClient
+from sqlalchemy import ClauseElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -159,3 +160,26 @@ async def add_default_spendings_category(
 ) -> STransactionCategoryOut:
     await user_spend_cat_service.add_user_default_category(user_id, db_session)
     return await user_spend_cat_service.get_default_category(user_id, db_session)
+
+
+async def get_scanned_tables(
+    db_session: AsyncSession,
+    query: ClauseElement,
+) -> set[str]:
+    """
+    Tables and partitions left in the query plan after partition pruning.
+    """
+    connection = await db_session.connection()
+    compiled = query.compile(dialect=connection.dialect)
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}",
+        compiled.params,
+    )
+    tables = set()
+    nodes = [result.scalar_one()[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Relation Name" in node:
+            tables.add(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return tables
@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.dependencies import database_manager
 from app.models import UserModel
 from app.repositories import user_repo
 from tests.factories import UserFactory
@@ -69,3 +70,52 @@ async def test_delete_user(
 
     users_after = await user_repo.get_all(db_session, {})
     assert len(users_before) == len(users_after) + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fail_request",
+    [False, True],
+)
+async def test_add_user__unit_of_work(
+    db_session: AsyncSession,
+    fail_request: bool,
+):
+    user = UserFactory()
+    session_gen = database_manager.get_session(unit_of_work=True)
+    uow_session = await anext(session_gen)
+
+    user_from_db = await user_repo.add(
+        uow_session,
+        dict(
+            username=user.username,
+            password=user.password,
+            email=user.email,
+        ),
+    )
+    assert user_from_db.id is not None
+    assert await user_repo.get_by_username(db_session, user.username) is None
+
+    if fail_request:
+        with pytest.raises(RuntimeError):
+            await session_gen.athrow(RuntimeError)
+        assert await user_repo.get_by_username(db_session, user.username) is None
+    else:
+        with pytest.raises(StopAsyncIteration):
+            await anext(session_gen)
+        assert await user_repo.get_by_username(db_session, user.username)
+
+
+@pytest.mark.asyncio
+async def test_update_user(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    updated_user = await user_repo.update(
+        db_session,
+        user.id,
+        {"active": False},
+    )
+    assert updated_user.id == user.id
+    assert updated_user.active is False
+    assert user.active is False
@@ -0,0 +1,147 @@
+from datetime import date, datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from app.core.config import settings
+from app.models import UserModel
+from app.schemas.balance_schemas import SBalance
+from tests.factories import (
+    IncomeFactory,
+    SpendingsFactory,
+    UsersIncomeCategoriesFactory,
+    UsersSpendingCategoriesFactory,
+)
+from tests.helpers import add_obj_to_db, add_obj_to_db_all
+
+
+async def create_test_balance(db_session: AsyncSession, user_id: int) -> None:
+    """
+    2025-01: income 1000 + 500, spendings 300
+    2025-02: spendings 200
+    2026-01: income 100
+    """
+    income_category = await add_obj_to_db(
+        UsersIncomeCategoriesFactory(user_id=user_id), db_session
+    )
+    spending_category = await add_obj_to_db(
+        UsersSpendingCategoriesFactory(user_id=user_id), db_session
+    )
+    income = [
+        (1000, datetime(2025, 1, 5)),
+        (500, datetime(2025, 1, 20)),
+        (100, datetime(2026, 1, 1)),
+    ]
+    spendings = [
+        (300, datetime(2025, 1, 5)),
+        (200, datetime(2025, 2, 28, 23, 59)),
+    ]
+    await add_obj_to_db_all(
+        [
+            IncomeFactory(
+                amount=amount,
+                date=date_,
+                user_id=user_id,
+                category_id=income_category.id,
+            )
+            for amount, date_ in income
+        ]
+        + [
+            SpendingsFactory(
+                amount=amount,
+                date=date_,
+                user_id=user_id,
+                category_id=spending_category.id,
+            )
+            for amount, date_ in spendings
+        ],
+        db_session,
+    )
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        (
+            {"period": "month"},
+            [
+                (date(2025, 1, 1), 1500, 300, 1200),
+                (date(2025, 2, 1), 0, 200, -200),
+                (date(2026, 1, 1), 100, 0, 100),
+            ],
+        ),
+        (
+            {"period": "year"},
+            [
+                (date(2025, 1, 1), 1500, 500, 1000),
+                (date(2026, 1, 1), 100, 0, 100),
+            ],
+        ),
+        (
+            {
+                "period": "day",
+                "datetime_from": "2025-01-01T00:00:00",
+                "datetime_to": "2025-01-31T23:59:59",
+            },
+            [
+                (date(2025, 1, 5), 1000, 300, 700),
+                (date(2025, 1, 20), 500, 0, 500),
+            ],
+        ),
+    ],
+)
+async def test_balance_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+    params: dict,
+    expected: list[tuple],
+):
+    await create_test_balance(db_session, auth_user.id)
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/balance/",
+        params=params,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    balance = [SBalance.model_validate(record) for record in response.json()]
+    assert [
+        (b.period_start, b.income, b.spendings, b.net) for b in balance
+    ] == expected
+
+
+async def test_balance_get__csv(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    await create_test_balance(db_session, auth_user.id)
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/balance/",
+        params={"in_csv": True},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "text/csv" in response.headers["content-type"]
+    assert response.headers["Content-Disposition"]
+    assert response.text.splitlines()[0] == "period_start,income,spendings,net"
+
+
+async def test_balance_chart_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    await create_test_balance(db_session, auth_user.id)
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/balance/chart/",
+        params={"period": "year"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/png"
+    assert len(response.content) > 1000
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.manager import DatabaseSessionManager
+
+# A second Postgres instance standing in for a replica,
+# see `postgres_replica` in docker-compose.yml.
+REPLICA_URL = os.getenv("TEST_DB_REPLICA_URL")
+
+pytestmark = pytest.mark.skipif(
+    not REPLICA_URL,
+    reason="TEST_DB_REPLICA_URL isn't set",
+)
+
+
+async def get_server_port(
+    manager: DatabaseSessionManager,
+    read_only: bool,
+) -> int:
+    async for session in manager.get_session(read_only=read_only):
+        return await session.scalar(text("SELECT inet_server_port()"))
+
+
+async def test_read_sessions_use_replicas():
+    manager = DatabaseSessionManager(
+        str(settings.db.url),
+        replica_urls=[REPLICA_URL],
+    )
+    try:
+        primary_port = await get_server_port(manager, read_only=False)
+        replica_port = await get_server_port(manager, read_only=True)
+        assert primary_port != replica_port
+        assert replica_port == manager.replica_engines[0].url.port
+    finally:
+        await manager.dispose()
+
+
+async def test_least_connections_skips_busy_replica():
+    manager = DatabaseSessionManager(
+        str(settings.db.url),
+        replica_urls=[REPLICA_URL, REPLICA_URL],
+        replica_selection="least_connections",
+    )
+    busy_engine = manager.get_read_engine()
+    try:
+        async with busy_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert manager.get_read_engine() is not busy_engine
+        assert manager.get_read_engine() is busy_engine
+    finally:
+        await manager.dispose()
@@ -11,7 +11,9 @@ from app.models import UserModel
 from app.schemas.saving_goals_schemas import (
     GoalStatus,
     SSavingGoalProgress,
+    SSavingGoalProgressItem,
     SSavingGoalResponse,
+    SSavingGoalWithProgress,
 )
 from tests.factories import SavingGoalFactory
 from tests.helpers import (
@@ -109,6 +111,55 @@ async def test_goals_progress_goal_id__get(
         assert type(response_schema) is SSavingGoalProgress
 
 
+@pytest.mark.asyncio
+async def test_goals_progress__get(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    auth_user: UserModel,
+):
+    goals = [SavingGoalFactory(user_id=auth_user.id) for _ in range(3)]
+    for goal in goals:
+        await add_obj_to_db(goal, db_session)
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/goals/progress/",
+        params={"goal_id": [goals[0].id, goals[2].id]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    goals_progress = [
+        SSavingGoalProgressItem.model_validate(progress)
+        for progress in response.json()
+    ]
+    assert {progress.goal_id for progress in goals_progress} == {
+        goals[0].id,
+        goals[2].id,
+    }
+    assert goals_progress[0].rest_amount == 10000 - 100
+    assert goals_progress[0].percentage_progress == 1.0
+
+
+@pytest.mark.asyncio
+async def test_goals__get_with_progress(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    auth_user: UserModel,
+):
+    await create_batch(
+        db_session, 2, SavingGoalFactory, dict(user_id=auth_user.id)
+    )
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/goals/",
+        params={"with_progress": True},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    goals = [
+        SSavingGoalWithProgress.model_validate(goal) for goal in response.json()
+    ]
+    assert len(goals) == 2
+    assert all(goal.progress.rest_amount == 10000 - 100 for goal in goals)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "status_code, wrong_goal_id, sign_in_another_user",
@@ -274,6 +274,44 @@ async def test_get_goal_progress__success(
     assert goal_progress.expected_daily_payment == IsPositiveInt
 
 
+@pytest.mark.asyncio
+async def test_get_goals_progress__same_as_goal_progress(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    goals = [
+        SavingGoalFactory(
+            user_id=user.id,
+            current_amount=current_amount,
+            target_amount=3000,
+            target_date=date.today() + timedelta(days=days),
+        )
+        # 2995: the rest of 5 over 2 days is a half to round
+        for current_amount, days in [(100, 7), (2995, 2), (3000, 30), (0, 0)]
+    ]
+    for goal in goals:
+        await add_obj_to_db(goal, db_session)
+
+    goals_progress = await saving_goals_service.get_goals_progress(
+        session=db_session,
+        user_id=user.id,
+        goal_ids=[goal.id for goal in goals[:3]],
+    )
+
+    assert {progress.goal_id for progress in goals_progress} == {
+        goal.id for goal in goals[:3]
+    }
+    for progress in goals_progress:
+        goal_progress = await saving_goals_service.get_goal_progress(
+            goal_id=progress.goal_id,
+            user_id=user.id,
+            session=db_session,
+        )
+        assert (
+            progress.model_dump(exclude={"goal_id"}) == goal_progress.model_dump()
+        )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "wrong_user_id, wrong_goal_id",
@@ -13,9 +13,13 @@ from app.models import UserModel
 from app.repositories import user_spend_cat_repo
 from app.schemas.transaction_category_schemas import TransactionsOnDeleteActions
 from app.schemas.transactions_schemas import (
+    BucketTransactionsSummary,
+    DayRollingSummary,
     DayTransactionsSummary,
     MonthTransactionsSummary,
     STransactionResponse,
+    STransactionsStats,
+    YearTransactionsTrend,
 )
 from app.services import spendings_service, user_spend_cat_service
 from tests.factories import (
@@ -679,6 +683,88 @@ async def test_spendings_annual_summary_chart_get(
     assert response.headers["content-type"] == "image/png"
 
 
+@pytest.mark.parametrize(
+    "params, headers, media_type",
+    [
+        ({"format": "svg"}, {}, "image/svg+xml"),
+        ({"dpi": 50}, {"Accept": "image/webp"}, "image/webp"),
+        ({"format": "png"}, {"Accept": "image/webp"}, "image/png"),
+    ],
+)
+async def test_spendings_annual_summary_chart_get__format(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+    params: dict,
+    headers: dict,
+    media_type: str,
+):
+    await create_test_spendings(db_session, auth_user.id)
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/chart/{date.today().year}/",
+        params=params,
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith(media_type)
+    assert response.headers["vary"] == "Accept"
+
+
+@pytest.mark.usefixtures("chart_jobs")
+async def test_spendings_annual_summary_chart_job(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    await create_test_spendings(db_session, auth_user.id)
+
+    response = await client.post(
+        url=f"{settings.api.prefix_v1}/spendings/summary/chart/"
+        f"{date.today().year}/jobs/",
+        params={"split_by_category": True},
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["status"] == "pending"
+
+    job_id = response.json()["job_id"]
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/charts/jobs/{job_id}/",
+        params={"wait": 10},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/png"
+    assert len(response.content) > 1000
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/charts/jobs/{job_id[::-1]}/",
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_spendings_monthly_summary_chart_data_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    await create_test_spendings(
+        db_session,
+        auth_user.id,
+        spendings_date_range="this_month",
+    )
+
+    url = f"spendings/summary/chart_data/{date.today().year}/{date.today().month}"
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/{url}/",
+    )
+    assert response.status_code == status.HTTP_200_OK
+    chart_data = response.json()
+    assert chart_data["periods"][0] == 1
+    assert len(chart_data["totals"]) == len(chart_data["periods"])
+    assert len(chart_data["values"]) == len(chart_data["categories"])
+    assert sum(chart_data["totals"]) == sum(map(sum, chart_data["values"]))
+
+
 async def test_spendings_monthly_summary_get(
     db_session: AsyncSession,
     client: AsyncClient,
@@ -745,3 +831,248 @@ async def test_spendings_monthly_summary_chart_get(
     assert response.status_code == status.HTTP_200_OK
     assert type(response.content) is bytes
     assert response.headers["content-type"] == "image/png"
+
+
+async def test_spendings_buckets_summary_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    [category_id] = await create_n_categories(1, auth_user.id, db_session)
+    await add_obj_to_db_all(
+        [
+            SpendingsFactory(
+                amount=amount,
+                date=datetime(2025, month, 10),
+                user_id=auth_user.id,
+                category_id=category_id,
+            )
+            for amount, month in [(100, 1), (50, 1), (70, 4)]
+        ],
+        db_session,
+    )
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/buckets/",
+        params={
+            "granularity": "month",
+            "date_from": "2025-01-01",
+            "date_to": "2025-05-31",
+            "split_by_category": True,
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    buckets = [
+        BucketTransactionsSummary.model_validate(bucket)
+        for bucket in response.json()
+    ]
+    assert [bucket.bucket_start.month for bucket in buckets] == [1, 2, 3, 4, 5]
+    assert [bucket.total_amount for bucket in buckets] == [150, 0, 0, 70, 0]
+    assert [len(bucket.summary) for bucket in buckets] == [1, 0, 0, 1, 0]
+
+
+@pytest.mark.parametrize(
+    "params, status_code",
+    [
+        ({"granularity": "quarter"}, status.HTTP_200_OK),
+        ({"granularity": "custom", "bucket_days": 10}, status.HTTP_200_OK),
+        ({"granularity": "custom"}, status.HTTP_400_BAD_REQUEST),
+        (
+            {"granularity": "day", "date_from": "1990-01-01"},
+            status.HTTP_400_BAD_REQUEST,
+        ),
+    ],
+)
+async def test_spendings_buckets_summary_get__params(
+    client: AsyncClient,
+    auth_user: UserModel,
+    params: dict,
+    status_code: int,
+):
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/buckets/",
+        params={"date_from": "2025-01-01", "date_to": "2025-12-31", **params},
+    )
+    assert response.status_code == status_code
+
+
+async def test_spendings_buckets_summary_chart_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    await create_test_spendings(db_session, auth_user.id)
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/buckets/chart/",
+        params={
+            "granularity": "week",
+            "date_from": date(date.today().year, 1, 1),
+            "date_to": date.today(),
+            "split_by_category": True,
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/png"
+
+
+async def test_spendings_trend_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    [category_id] = await create_n_categories(1, auth_user.id, db_session)
+    await add_obj_to_db_all(
+        [
+            SpendingsFactory(
+                amount=amount,
+                date=datetime(year, month, 10),
+                user_id=auth_user.id,
+                category_id=category_id,
+            )
+            for amount, year, month in [
+                (100, 2023, 5),
+                (200, 2024, 5),
+                (50, 2024, 6),
+            ]
+        ],
+        db_session,
+    )
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/trend/",
+        params={"year_from": 2024, "year_to": 2025},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    trend = [
+        YearTransactionsTrend.model_validate(year) for year in response.json()
+    ]
+    assert [(t.year, t.total_amount, t.yoy_delta) for t in trend] == [
+        (2024, 250, 150),
+        (2025, 0, None),
+    ]
+    assert [(m.month_number, m.yoy_delta) for m in trend[0].months] == [
+        (5, 100),
+        (6, None),
+    ]
+    assert trend[0].categories[0].yoy_percent == 150.0
+
+
+@pytest.mark.parametrize(
+    "year_from, year_to, status_code",
+    [
+        (2024, 2023, status.HTTP_404_NOT_FOUND),
+        (1990, 2025, status.HTTP_400_BAD_REQUEST),
+    ],
+)
+async def test_spendings_trend_get__params(
+    client: AsyncClient,
+    auth_user: UserModel,
+    year_from: int,
+    year_to: int,
+    status_code: int,
+):
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/trend/",
+        params={"year_from": year_from, "year_to": year_to},
+    )
+    assert response.status_code == status_code
+
+
+async def test_spendings_rolling_summary_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    [category_id] = await create_n_categories(1, auth_user.id, db_session)
+    await add_obj_to_db_all(
+        [
+            SpendingsFactory(
+                amount=amount,
+                date=datetime(2025, month, day, 12),
+                user_id=auth_user.id,
+                category_id=category_id,
+            )
+            for amount, month, day in [(70, 2, 27), (140, 3, 1), (14, 3, 1)]
+        ],
+        db_session,
+    )
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/rolling/",
+        params={
+            "date_from": "2025-02-28",
+            "date_to": "2025-03-02",
+            "windows": [1, 7],
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    summary = [DayRollingSummary.model_validate(day) for day in response.json()]
+    assert [(d.day.day, d.amount, d.month_to_date) for d in summary] == [
+        (28, 0, 70),
+        (1, 154, 154),
+        (2, 0, 154),
+    ]
+    assert [d.averages for d in summary] == [
+        {1: 0, 7: 10},
+        {1: 154, 7: 32},
+        {1: 0, 7: 32},
+    ]
+
+
+async def test_spendings_stats_get(
+    db_session: AsyncSession,
+    client: AsyncClient,
+    auth_user: UserModel,
+):
+    [category_id] = await create_n_categories(1, auth_user.id, db_session)
+    await add_obj_to_db_all(
+        [
+            SpendingsFactory(
+                amount=amount,
+                date=datetime(2025, 3, 10),
+                user_id=auth_user.id,
+                category_id=category_id,
+            )
+            for amount in [10, 20, 30, 40, 100]
+        ],
+        db_session,
+    )
+
+    response = await client.get(
+        url=f"{settings.api.prefix_v1}/spendings/summary/stats/",
+        params={"date_from": "2025-03-01", "date_to": "2025-03-31", "bins": 3},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    stats = STransactionsStats.model_validate(response.json())
+    [month_stats] = stats.stats
+    assert (month_stats.count, month_stats.min, month_stats.max) == (5, 10, 100)
+    assert (month_stats.q1, month_stats.median, month_stats.q3) == (20, 30, 40)
+    assert month_stats.p90 == 76
+    assert stats.histograms[0].counts == [4, 0, 1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, url",
+    [
+        ("POST", "spendings/summary/chart/jobs/"),
+        ("GET", "spendings/summary/chart_data/"),
+    ],
+)
+async def test_spendings_summary__unknown_category(
+    client: AsyncClient,
+    auth_user: UserModel,
+    method: str,
+    url: str,
+):
+    response = await client.request(
+        method,
+        url=f"{settings.api.prefix_v1}/{url}",
+        params={"category_name": "non existent category"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
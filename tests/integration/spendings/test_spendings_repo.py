@@ -2,16 +2,25 @@ from datetime import date, datetime
 from random import choice, randint
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.db.partitions import (
+    get_period_start,
+    get_range_partition_name,
+    maintain_partitions,
+)
 from app.models import UserModel
 from app.repositories import spendings_repo
 from app.schemas.common_schemas import SortParam
 from tests.factories import SpendingsFactory, UsersSpendingCategoriesFactory
 from tests.helpers import (
     add_obj_to_db,
+    add_obj_to_db_all,
     create_n_categories,
     create_test_spendings,
+    get_scanned_tables,
 )
 
 
@@ -34,6 +43,56 @@ async def test_get_transaction_with_category(
     assert spending_from_db.category.category_name == category.category_name
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "change_category, wrong_category, wrong_user, updated",
+    [
+        (False, False, False, True),
+        (True, False, False, True),
+        (True, True, False, False),
+        (False, False, True, False),
+    ],
+)
+async def test_update_transaction_with_category(
+    db_session: AsyncSession,
+    user: UserModel,
+    change_category: bool,
+    wrong_category: bool,
+    wrong_user: bool,
+    updated: bool,
+) -> None:
+    category = UsersSpendingCategoriesFactory(user_id=user.id)
+    new_category = UsersSpendingCategoriesFactory(user_id=user.id)
+    await add_obj_to_db_all([category, new_category], db_session)
+
+    spending = SpendingsFactory(user_id=user.id, category_id=category.id)
+    await add_obj_to_db(spending, db_session)
+
+    category_name = None
+    if change_category:
+        category_name = new_category.category_name.upper()
+        if wrong_category:
+            category_name = "non existent category"
+
+    updated_spending = await spendings_repo.update_transaction_with_category(
+        db_session,
+        spending.id,
+        user.id + wrong_user,
+        {"amount": 1234},
+        category_name,
+    )
+    if not updated:
+        assert updated_spending is None
+        return
+
+    assert updated_spending.id == spending.id
+    assert updated_spending.amount == 1234
+    if change_category:
+        assert updated_spending.category_name == new_category.category_name
+    else:
+        assert updated_spending.category_name == category.category_name
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "prices",
@@ -273,6 +332,44 @@ async def test_get_transactions_from_db__with_all_filters(
     assert spendings_amount == sorted(spendings_amount, reverse=True)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "order_direction",
+    ["asc", "desc"],
+)
+async def test_get_transactions_rows_from_db(
+    db_session: AsyncSession,
+    user: UserModel,
+    order_direction: str,
+) -> None:
+    categories_ids = await create_n_categories(3, user.id, db_session)
+    for category_id in categories_ids:
+        spending = SpendingsFactory(user_id=user.id, category_id=category_id)
+        await add_obj_to_db(spending, db_session)
+
+    rows = await spendings_repo.get_transactions_rows_from_db(
+        user_id=user.id,
+        session=db_session,
+        categories_ids=categories_ids[:2],
+        sort_params=[
+            SortParam(order_by="category_name", order_direction=order_direction)
+        ],
+    )
+    assert len(rows) == 2
+    assert set(rows[0]._fields) == {
+        "id",
+        "amount",
+        "description",
+        "date",
+        "category_name",
+    }
+    categories_names = [row.category_name for row in rows]
+    assert categories_names == sorted(
+        categories_names,
+        reverse=order_direction == "desc",
+    )
+
+
 async def test_get_annual_summary_from_db(
     db_session: AsyncSession,
     user: UserModel,
@@ -316,3 +413,69 @@ async def test_get_monthly_summary_from_db(
     assert 1 <= len(summary) <= num_of_cats * 31
     assert len(summary[0]) == 3
     assert len(summary[-1]) == 3
+
+
+@pytest.mark.skipif(
+    settings.db.partitioning == "user_hash",
+    reason="Date ranges are pruned with range partitioning only",
+)
+async def test_summary_queries_prune_partitions(
+    db_session: AsyncSession,
+    user: UserModel,
+) -> None:
+    today = date.today()
+    partition = get_range_partition_name(
+        "spendings",
+        get_period_start(today, settings.db.partitioning),
+        settings.db.partitioning,
+    )
+
+    monthly_query = spendings_repo.make_monthly_summary_query(
+        user.id, today.year, today.month
+    )
+    monthly_tables = await get_scanned_tables(db_session, monthly_query)
+    assert monthly_tables - {"users_spending_categories"} == {partition}
+
+    annual_query = spendings_repo.make_annual_summary_query(user.id, today.year)
+    annual_tables = await get_scanned_tables(db_session, annual_query)
+    # months of the year without a partition of their own are in the default one
+    annual_partitions = annual_tables - {
+        "users_spending_categories",
+        "spendings_default",
+    }
+    assert partition in annual_partitions
+    assert all(
+        name.startswith(f"spendings_{today.year}") for name in annual_partitions
+    )
+
+
+@pytest.mark.skipif(
+    settings.db.partitioning != "month",
+    reason="Checks monthly partitions",
+)
+async def test_maintain_partitions__moves_default_rows(
+    db_session: AsyncSession,
+    user: UserModel,
+) -> None:
+    category = UsersSpendingCategoriesFactory(user_id=user.id)
+    await add_obj_to_db(category, db_session)
+    spending = SpendingsFactory(
+        user_id=user.id,
+        category_id=category.id,
+        date=datetime(2090, 5, 10),
+    )
+    await add_obj_to_db(spending, db_session)
+
+    connection = await db_session.connection()
+    actions = await maintain_partitions(
+        connection,
+        scheme="month",
+        today=date(2090, 5, 1),
+        ahead=0,
+        retention=None,
+    )
+    assert actions == ["created spendings_2090_05", "created income_2090_05"]
+
+    moved = await connection.execute(text("SELECT id FROM spendings_2090_05"))
+    assert list(moved.scalars()) == [spending.id]
+    await db_session.rollback()
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.exceptions.categories_exceptions import CategoryNotFound
+from app.exceptions.chart_exceptions import ChartJobNotFound
 from app.exceptions.transaction_exceptions import TransactionNotFound
 from app.models import UserModel
 from app.schemas.common_schemas import SAmountRange, SDatetimeRange
@@ -24,6 +25,7 @@ from app.schemas.transactions_schemas import (
     STransactionsSortParams,
 )
 from app.services import spendings_service, user_spend_cat_service
+from app.services.chart_jobs import SPLIT_CHART_PRIORITY, ChartJobsClient
 from tests.factories import (
     SpendingsFactory,
     STransactionCreateFactory,
@@ -74,6 +76,22 @@ async def test_add_transaction_to_db(
         )
 
 
+@pytest.mark.asyncio
+async def test_add_transaction_to_db__stored_category_name(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    category = UsersSpendingCategoriesFactory(user_id=user.id)
+    await add_obj_to_db(category, db_session)
+
+    spending = await spendings_service.add_transaction_to_db(
+        STransactionCreateFactory(category_name=category.category_name.upper()),
+        user.id,
+        db_session,
+    )
+    assert spending.category_name == category.category_name
+
+
 @pytest.mark.asyncio
 async def test_update_transaction__success(
     db_session: AsyncSession,
@@ -281,6 +299,35 @@ async def test_get_transactions__category_id_priority(
     assert category1.category_name in spendings_category_name
 
 
+@pytest.mark.asyncio
+async def test_get_transactions_rows(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    category = UsersSpendingCategoriesFactory(user_id=user.id)
+    await add_obj_to_db(category, db_session)
+
+    dt = datetime(year=2025, month=1, day=1, hour=12, microsecond=123456)
+    spending = SpendingsFactory(date=dt, user_id=user.id, category_id=category.id)
+    await add_obj_to_db(spending, db_session)
+
+    spendings = await spendings_service.get_transactions_rows(
+        user_id=user.id,
+        categories_params=[],
+        session=db_session,
+    )
+    assert spendings == [
+        {
+            "amount": spending.amount,
+            "category_name": category.category_name,
+            "description": spending.description,
+            "date": dt.replace(microsecond=0),
+            "id": spending.id,
+        }
+    ]
+    assert list(spendings[0]) == list(STransactionResponse.model_fields)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "search_term, datetime_from, datetime_to, expected_spendings_qty",
@@ -572,6 +619,55 @@ async def test_annual_summary_chart(db_session: AsyncSession, user: UserModel):
         assert len(chart) > 1000
 
 
+@pytest.mark.asyncio
+async def test_annual_summary_chart_job(
+    db_session: AsyncSession,
+    user: UserModel,
+    chart_jobs: ChartJobsClient,
+):
+    await create_test_spendings(db_session, user.id)
+
+    chart_request = await spendings_service.prepare_annual_summary_chart(
+        session=db_session,
+        user_id=user.id,
+        year=date.today().year,
+        transactions_type="spendings",
+        split_by_category=True,
+    )
+    assert chart_request.method_name == "create_annual_chart_with_categories"
+    assert chart_request.priority == SPLIT_CHART_PRIORITY
+
+    job_id = await spendings_service.submit_chart_job(
+        db_session, user.id, chart_request
+    )
+    result = await chart_jobs.get_result(user.id, job_id, wait_sec=10)
+    assert result.status == "done"
+    assert len(result.chart) > 1000
+
+    with pytest.raises(ChartJobNotFound):
+        await chart_jobs.get_result(user.id + 1, job_id)
+
+
+@pytest.mark.asyncio
+async def test_render_charts(db_session: AsyncSession, user: UserModel):
+    await create_test_spendings(db_session, user.id)
+    year = date.today().year
+    summary = await spendings_service.get_annual_summary(db_session, user.id, year)
+
+    charts = await spendings_service.render_charts(
+        db_session,
+        [
+            spendings_service.make_annual_summary_chart(
+                summary, year, "spendings", split_by_category
+            )
+            for split_by_category in (False, True)
+        ],
+    )
+    assert len(charts) == 2
+    assert all(type(chart) is bytes and len(chart) > 1000 for chart in charts)
+    assert charts[0] != charts[1]
+
+
 @pytest.mark.asyncio
 async def test_get_monthly_summary(db_session: AsyncSession, user: UserModel):
     await create_test_spendings(
@@ -632,26 +728,27 @@ async def test__get_categories_from_summary(
 
 
 @pytest.mark.asyncio
-async def test__prepare_data_for_chart_with_categories_split(
+async def test_get_annual_summary_chart_data(
     db_session: AsyncSession,
     user: UserModel,
 ):
     await create_test_spendings(db_session, user.id)
+    year = date.today().year
+    summary = await spendings_service.get_annual_summary(db_session, user.id, year)
 
-    summary = await spendings_service.get_annual_summary(
-        db_session,
-        user.id,
-        date.today().year,
-    )
-    categories = spendings_service._get_categories_from_summary(summary)
-
-    prepared_data = (
-        spendings_service._prepare_data_for_chart_with_categories_split(
-            summary,
-            categories,
-        )
+    chart_data = await spendings_service.get_annual_summary_chart_data(
+        db_session, user.id, year
     )
-    assert [len(d) == len(prepared_data[0]) for d in prepared_data]
+    assert chart_data.periods == list(range(1, 13))
+    assert len(chart_data.values) == len(chart_data.categories)
+    assert all(len(row) == 12 for row in chart_data.values)
+
+    for record in summary:
+        column = chart_data.periods.index(record.month_number)
+        assert chart_data.totals[column] == record.total_amount
+        for item in record.summary:
+            row = chart_data.categories.index(item.category_name)
+            assert chart_data.values[row][column] == item.amount
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,218 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.dependencies import database_manager
+from app.models import UserModel
+from app.repositories import user_spend_cat_repo
+from app.schemas.transaction_category_schemas import (
+    STransactionCategoryUpdate,
+    TransactionsOnDeleteActions,
+)
+from app.services import user_spend_cat_service
+from app.services.categories_cache import spending_categories_cache
+from tests.factories import UsersSpendingCategoriesFactory
+from tests.helpers import add_obj_to_db, create_n_categories
+
+
+@pytest.mark.asyncio
+async def test_get_user_categories(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    categories_ids = await create_n_categories(3, user.id, db_session)
+
+    categories_map = await spending_categories_cache.get_user_categories(
+        user.id,
+        db_session,
+    )
+    assert sorted(categories_map.names_by_id) == sorted(categories_ids)
+    assert sorted(categories_map.ids_by_name.values()) == sorted(categories_ids)
+
+    cached_map = await spending_categories_cache.get_user_categories(
+        user.id,
+        db_session,
+    )
+    assert cached_map is categories_map
+
+
+@pytest.mark.asyncio
+async def test_get_category_id__case_insensitive_and_miss(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    await spending_categories_cache.get_user_categories(user.id, db_session)
+
+    # added behind the cache's back, found with the fallback query
+    category = UsersSpendingCategoriesFactory(user_id=user.id)
+    await add_obj_to_db(category, db_session)
+
+    category_id = await spending_categories_cache.get_category_id(
+        user.id,
+        category.category_name.upper(),
+        db_session,
+    )
+    assert category_id == category.id
+
+    category_name = await spending_categories_cache.get_category_name(
+        user.id,
+        category.id,
+        db_session,
+    )
+    assert category_name == category.category_name
+
+    assert (
+        await spending_categories_cache.get_category_id(
+            user.id,
+            "non existent category",
+            db_session,
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidation_on_category_changes(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    category = await user_spend_cat_service.add_category_to_db(
+        user.id,
+        "Food",
+        db_session,
+    )
+    assert (
+        await spending_categories_cache.get_category_id(
+            user.id,
+            "food",
+            db_session,
+        )
+        == category.id
+    )
+
+    await user_spend_cat_service.update_category(
+        "Food",
+        user.id,
+        STransactionCategoryUpdate(category_name="Groceries"),
+        db_session,
+    )
+    categories_map = await spending_categories_cache.get_user_categories(
+        user.id,
+        db_session,
+    )
+    assert "food" not in categories_map.ids_by_name
+    assert categories_map.names_by_id[category.id] == "Groceries"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_waits_for_commit(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    category = await user_spend_cat_service.add_category_to_db(
+        user.id,
+        "Taxi",
+        db_session,
+    )
+    categories_map = await spending_categories_cache.get_user_categories(
+        user.id,
+        db_session,
+    )
+
+    async for uow_session in database_manager.get_session(unit_of_work=True):
+        await user_spend_cat_service.delete_category(
+            "Taxi",
+            user.id,
+            TransactionsOnDeleteActions.DELETE,
+            None,
+            uow_session,
+        )
+        # the deletion isn't committed, other sessions still see the category
+        assert (
+            await spending_categories_cache.get_user_categories(
+                user.id,
+                db_session,
+            )
+            is categories_map
+        )
+        # the session itself doesn't
+        own_map = await spending_categories_cache.get_user_categories(
+            user.id,
+            uow_session,
+        )
+        assert category.id not in own_map.names_by_id
+
+    categories_map = await spending_categories_cache.get_user_categories(
+        user.id,
+        db_session,
+    )
+    assert category.id not in categories_map.names_by_id
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_category_isnt_cached(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    async for uow_session in database_manager.get_session(unit_of_work=True):
+        await user_spend_cat_service.add_category_to_db(
+            user.id,
+            "Rolled back",
+            uow_session,
+        )
+        assert await spending_categories_cache.get_category_id(
+            user.id,
+            "Rolled back",
+            uow_session,
+        )
+        await uow_session.rollback()
+
+    assert (
+        await spending_categories_cache.get_category_id(
+            user.id,
+            "Rolled back",
+            db_session,
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_verify_stale_category_id(
+    db_session: AsyncSession,
+    user: UserModel,
+):
+    category = UsersSpendingCategoriesFactory(
+        user_id=user.id, category_name="Cafe"
+    )
+    await add_obj_to_db(category, db_session)
+    await spending_categories_cache.get_user_categories(user.id, db_session)
+
+    # renamed by another worker, its invalidation isn't seen here
+    await user_spend_cat_repo.update(
+        session=db_session,
+        object_id=category.id,
+        params=dict(category_name="Restaurants"),
+    )
+    assert (
+        await spending_categories_cache.get_category_id(
+            user.id,
+            "cafe",
+            db_session,
+        )
+        == category.id
+    )
+
+    assert (
+        await spending_categories_cache.get_category_id(
+            user.id,
+            "cafe",
+            db_session,
+            verify=True,
+        )
+        is None
+    )
+    categories_map = await spending_categories_cache.get_user_categories(
+        user.id,
+        db_session,
+    )
+    assert categories_map.names_by_id[category.id] == "Restaurants"
@@ -1,12 +1,22 @@
+import asyncio
+
 import pytest
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt import InvalidTokenError
 
+from app.core.config import settings
+from app.exceptions.auth_exceptions import PasswordHashingOverloaded
+from app.services import auth_service
 from app.services.auth_service import (
     create_access_token,
     decode_access_token,
     hash_password,
+    hash_password_async,
     validate_username,
     verify_password,
+    verify_password_async,
 )
+from app.services.jwt_key_ring import JWTKey, JWTKeyRing
 
 
 @pytest.mark.parametrize(
@@ -27,6 +37,49 @@ def test_create_access_token(
     assert decoded_payload["sub"] == payload["sub"]
 
 
+def make_rsa_key(kid: str) -> JWTKey:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return JWTKey(
+        kid=kid,
+        algorithm="RS256",
+        private_key=private_key,
+        public_key=private_key.public_key(),
+    )
+
+
+def test_decode_access_token__rotated_key():
+    old_key = make_rsa_key("old")
+    new_key = make_rsa_key("new")
+    old_ring = JWTKeyRing(old_key)
+    new_ring = JWTKeyRing(
+        new_key,
+        [JWTKey(kid="old", algorithm="RS256", public_key=old_key.public_key)],
+    )
+
+    token = create_access_token({"sub": "etoo"}, key_ring=old_ring)
+    assert decode_access_token(token, key_ring=new_ring)["sub"] == "etoo"
+
+    with pytest.raises(InvalidTokenError):
+        decode_access_token(
+            create_access_token({"sub": "etoo"}, key_ring=new_ring),
+            key_ring=old_ring,
+        )
+
+
+def test_create_access_token__eddsa():
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    key_ring = JWTKeyRing(
+        JWTKey(
+            kid="ed",
+            algorithm="EdDSA",
+            private_key=private_key,
+            public_key=private_key.public_key(),
+        )
+    )
+    token = create_access_token({"sub": "etoo"}, key_ring=key_ring)
+    assert decode_access_token(token, key_ring=key_ring)["sub"] == "etoo"
+
+
 @pytest.mark.parametrize(
     "password",
     [
@@ -41,6 +94,27 @@ def test_hash_password(
     assert verify_password(password, hashed_password)
 
 
+@pytest.mark.asyncio
+async def test_hash_password_async():
+    hashed_password = await hash_password_async("qwerty")
+    work_factor_prefix = f"$2b${settings.auth.bcrypt_rounds:02}$".encode()
+    assert hashed_password.startswith(work_factor_prefix)
+    assert await verify_password_async("qwerty", hashed_password)
+    assert not await verify_password_async("wrong", hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_hash_password_async__overloaded(monkeypatch):
+    monkeypatch.setattr(
+        auth_service,
+        "_password_hashing_limiter",
+        asyncio.Semaphore(0),
+    )
+    monkeypatch.setattr(settings.auth, "password_hashing_wait_sec", 0.01)
+    with pytest.raises(PasswordHashingOverloaded):
+        await hash_password_async("qwerty")
+
+
 @pytest.mark.parametrize(
     "username, result",
     [
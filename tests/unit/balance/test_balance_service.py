@@ -0,0 +1,28 @@
+from datetime import date
+
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+from app.repositories import balance_repo
+from app.schemas.balance_schemas import SBalance
+from app.services.balance_service import balance_service
+
+
+def test_balance_query_reads_both_tables_once():
+    query = balance_repo.make_balance_query(1, "month")
+    sql = str(query.compile(dialect=PGDialect_psycopg()))
+    assert sql.count("FROM income") == sql.count("FROM spendings") == 1
+    assert "UNION ALL" in sql
+    assert "FILTER (WHERE transactions.is_income)" in sql
+
+
+def test_make_balance_chart():
+    balance = [
+        SBalance(period_start=date(2025, 1, 1), income=10, spendings=4, net=6),
+        SBalance(period_start=date(2025, 2, 1), income=0, spendings=5, net=-5),
+    ]
+    chart = balance_service.make_balance_chart(balance, "month")
+    assert chart.method_name == "create_balance_chart"
+    assert chart.params["labels"] == ["2025-01", "2025-02"]
+    assert chart.params["income"] == [10, 0]
+    assert chart.params["spendings"] == [4, 5]
+    assert chart.params["net"] == [6, -5]
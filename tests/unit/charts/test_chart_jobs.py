@@ -0,0 +1,15 @@
+from app.schemas.charts_schemas import SChartRenderParams
+from app.services.chart_jobs import SPLIT_CHART_PRIORITY, ChartRequest
+
+
+def test_chart_request_with_render_params():
+    chart = ChartRequest(
+        "create_annual_chart_with_categories",
+        {"title": "Spendings 2025"},
+        SPLIT_CHART_PRIORITY,
+    )
+
+    rendered = chart.with_render_params(SChartRenderParams(format="svg"))
+    assert rendered.params == {"title": "Spendings 2025", "format": "svg"}
+    assert rendered.priority == SPLIT_CHART_PRIORITY
+    assert chart.with_render_params(None) is chart
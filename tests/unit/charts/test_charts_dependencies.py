@@ -0,0 +1,22 @@
+import pytest
+
+from app.api.dependencies.charts_dependencies import negotiate_chart_format
+
+
+@pytest.mark.parametrize(
+    "accept, chart_format",
+    [
+        (None, "png"),
+        ("", "png"),
+        ("*/*", "png"),
+        ("application/json", "png"),
+        ("image/svg+xml", "svg"),
+        ("image/webp,*/*;q=0.8", "webp"),
+        ("image/png;q=0.5, image/svg+xml;q=0.9", "svg"),
+        ("image/webp;q=0.2, image/png", "png"),
+        ("image/avif,image/webp,image/apng,image/svg+xml,*/*;q=0.8", "webp"),
+        ("image/svg+xml;q=bad, image/webp;q=0.1", "webp"),
+    ],
+)
+def test_negotiate_chart_format(accept: str | None, chart_format: str):
+    assert negotiate_chart_format(accept) == chart_format
@@ -0,0 +1,77 @@
+import pytest
+
+from app.services.base_transactions_service import TransactionsService
+from app.services.chart_jobs import ChartRequest
+from app.services.charts_fallback import (
+    CircuitBreaker,
+    RenderedChartsCache,
+    charts_breaker,
+    get_placeholder_chart,
+    rendered_charts_cache,
+)
+
+
+def test_circuit_breaker(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_sec=30)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    now += 31
+    # a single trial call in half-open state
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now += 31
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow()
+
+
+def test_rendered_charts_cache():
+    cache = RenderedChartsCache(max_size=2)
+    first = ChartRequest("create_simple_chart", {"values": [1], "format": "png"})
+    second = ChartRequest("create_simple_chart", {"values": [2], "format": "png"})
+    third = ChartRequest("create_simple_chart", {"values": [3], "format": "png"})
+
+    cache.put(first, b"first")
+    cache.put(second, b"second")
+    reordered = ChartRequest(
+        "create_simple_chart", {"format": "png", "values": [1]}
+    )
+    assert cache.get(reordered) == b"first"
+
+    cache.put(third, b"third")
+    assert cache.get(second) is None
+    assert cache.get(first) == b"first"
+    assert cache.get(third) == b"third"
+
+
+@pytest.mark.asyncio
+async def test_rpc_call_many__falls_back(monkeypatch: pytest.MonkeyPatch):
+    cached_chart = ChartRequest("create_simple_chart", {"values": [10]})
+    new_chart = ChartRequest(
+        "create_simple_chart", {"values": [20], "format": "svg"}
+    )
+    rendered_charts_cache.put(cached_chart, b"cached")
+
+    async def rpc_call(*args, **kwargs):
+        raise TimeoutError
+
+    monkeypatch.setattr(TransactionsService, "rpc_call", rpc_call)
+    monkeypatch.setattr(charts_breaker, "failure_threshold", 1)
+    monkeypatch.setattr(charts_breaker, "failures", 0)
+    monkeypatch.setattr(charts_breaker, "opened_at", None)
+
+    charts = await TransactionsService.rpc_call_many([cached_chart, new_chart])
+    assert charts == [b"cached", get_placeholder_chart("svg")]
+    assert charts_breaker.is_open
+    assert get_placeholder_chart("svg").startswith(b"<svg")
@@ -0,0 +1,68 @@
+import pytest
+from aio_pika import DeliveryMode
+from aio_pika.patterns.rpc import RPCMessageType
+
+from charts_service.rpc import (
+    CHART_CONTENT_TYPE,
+    COMPRESSED_ENCODING,
+    ChartsRPC,
+)
+
+
+async def round_trip(payload):
+    rpc = ChartsRPC(channel=None)  # type: ignore[arg-type]
+    message = await rpc.serialize_message(
+        payload=payload,
+        message_type=RPCMessageType.RESULT,
+        correlation_id="1",
+        delivery_mode=DeliveryMode.NOT_PERSISTENT,
+    )
+    return message, await rpc.deserialize_message(message)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_charts_rpc__chart_is_sent_raw():
+    chart = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+    message, result = await round_trip(chart)
+    assert message.body == chart
+    assert message.content_type == CHART_CONTENT_TYPE
+    assert result == chart
+
+
+@pytest.mark.asyncio
+async def test_charts_rpc__batch():
+    charts = [b"first", b"", b"third chart"]
+    message, result = await round_trip(charts)
+    assert message.body == b"".join(charts)
+    assert result == charts
+
+
+@pytest.mark.asyncio
+async def test_charts_rpc__kwargs():
+    kwargs = {
+        "periods": list(range(1, 32)),
+        "categories": ["Food", "Clothes"],
+        "values": [[0] * 31, [1500] * 31],
+        "totals": [1500] * 31,
+        "title": "Spendings March 2025",
+    }
+    message, result = await round_trip(kwargs)
+    assert message.content_encoding is None
+    assert result == kwargs
+
+
+@pytest.mark.asyncio
+async def test_charts_rpc__large_kwargs_are_compressed():
+    kwargs = {
+        "categories": [f"Category {i}" for i in range(50)],
+        "values": [[i * 100] * 31 for i in range(50)],
+    }
+    message, result = await round_trip(kwargs)
+    assert message.content_encoding == COMPRESSED_ENCODING
+    assert result == kwargs
+
+
+@pytest.mark.asyncio
+async def test_charts_rpc__exception():
+    _, result = await round_trip(ValueError("bad params"))
+    assert result["error"]["type"] == "ValueError"
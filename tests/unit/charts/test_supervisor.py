@@ -0,0 +1,109 @@
+import asyncio
+import os
+import signal
+import socket
+import time
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from charts_service.app.supervisor import Supervisor
+
+
+def draining_worker(done_dir: str, ready) -> None:
+    stopping = False
+
+    def stop(*args):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    ready.set()
+    while not stopping:
+        time.sleep(0.01)
+    ready.clear()
+    # a render in flight
+    time.sleep(0.5)
+    Path(done_dir, str(os.getpid())).touch()
+
+
+def crashing_worker(starts_path: str, ready) -> None:
+    with open(starts_path, "a") as file:
+        file.write("start\n")
+    raise SystemExit(1)
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def get_status(port: int, path: str) -> int:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\n\r\n".encode())
+    status_line = await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+    return int(status_line.split()[1])
+
+
+async def wait_until_ready(port: int, timeout_sec: float = 20) -> None:
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
+        try:
+            if await get_status(port, "/ready") == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.05)
+    pytest.fail("Workers didn't get ready")
+
+
+@pytest.mark.asyncio
+async def test_supervisor_drains_workers(tmp_path: Path):
+    port = get_free_port()
+    supervisor = Supervisor(
+        partial(draining_worker, str(tmp_path)),
+        workers_count=2,
+        drain_timeout_sec=10,
+        health_host="127.0.0.1",
+        health_port=port,
+        check_interval_sec=0.05,
+    )
+    serving = asyncio.create_task(supervisor.serve())
+
+    await wait_until_ready(port)
+    assert await get_status(port, "/health") == 200
+    assert await get_status(port, "/unknown") == 404
+
+    supervisor.stop()
+    await asyncio.sleep(0.1)
+    assert await get_status(port, "/ready") == 503
+    assert await get_status(port, "/health") == 200
+
+    await serving
+    # both workers finished their renders before exiting
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.asyncio
+async def test_supervisor_backs_off_restarts(tmp_path: Path):
+    starts_path = tmp_path / "starts"
+    supervisor = Supervisor(
+        partial(crashing_worker, str(starts_path)),
+        workers_count=1,
+        drain_timeout_sec=1,
+        check_interval_sec=0.05,
+        restart_delay_sec=0.4,
+        max_restart_delay_sec=10,
+    )
+    serving = asyncio.create_task(supervisor.serve())
+    await asyncio.sleep(2)
+    supervisor.stop()
+    await serving
+
+    # restarted after 0.4 s and then 0.8 s, without a backoff
+    # it'd be restarted every check, about 40 times
+    assert 2 <= len(starts_path.read_text().splitlines()) <= 4
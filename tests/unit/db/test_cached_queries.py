@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+from sqlalchemy.engine.interfaces import CacheStats
+
+from app.repositories import income_repo, spendings_repo
+
+DIALECT = PGDialect_psycopg()
+
+
+def test_summary_queries_are_cached_per_model():
+    compiled_cache: dict = {}
+    cache_stats = []
+    for repo, user_id, year in (
+        (spendings_repo, 1, 2024),
+        (income_repo, 1, 2024),
+        (spendings_repo, 2, 2025),
+    ):
+        query = repo.make_annual_summary_query(user_id, year)
+        compiled, _, _, stats = query._compile_w_cache(
+            DIALECT,
+            compiled_cache=compiled_cache,
+            column_keys=[],
+        )
+        cache_stats.append(stats)
+        assert f"FROM {repo.model.__tablename__} JOIN" in str(compiled)
+        assert query.compile(dialect=DIALECT).params == {
+            "user_id_1": user_id,
+            "date_from_1": datetime(year, 1, 1),
+            "date_to_1": datetime(year + 1, 1, 1),
+        }
+
+    assert cache_stats == [
+        CacheStats.CACHE_MISS,
+        CacheStats.CACHE_MISS,
+        CacheStats.CACHE_HIT,
+    ]
+
+
+def test_monthly_summary_query_bounds():
+    query = spendings_repo.make_monthly_summary_query(1, 2024, 12)
+    compiled = query.compile(dialect=DIALECT)
+    assert "EXTRACT(day FROM spendings.date) AS day" in str(compiled)
+    assert compiled.params["date_from_1"] == datetime(2024, 12, 1)
+    assert compiled.params["date_to_1"] == datetime(2025, 1, 1)
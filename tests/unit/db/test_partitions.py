@@ -0,0 +1,66 @@
+from datetime import date
+
+import pytest
+
+from app.db.partitions import (
+    get_initial_partitions_ddl,
+    get_range_partition_name,
+    parse_range_partition_name,
+    shift_period,
+)
+
+
+@pytest.mark.parametrize(
+    "start, scheme, periods, expected",
+    [
+        (date(2025, 11, 1), "month", 2, date(2026, 1, 1)),
+        (date(2025, 1, 1), "month", -1, date(2024, 12, 1)),
+        (date(2025, 12, 1), "month", -12, date(2024, 12, 1)),
+        (date(2025, 1, 1), "year", 3, date(2028, 1, 1)),
+    ],
+)
+def test_shift_period(start, scheme, periods, expected):
+    assert shift_period(start, scheme, periods) == expected
+
+
+@pytest.mark.parametrize("scheme", ["month", "year"])
+def test_range_partition_name(scheme):
+    start = date(2025, 1, 1)
+    name = get_range_partition_name("spendings", start, scheme)
+    assert parse_range_partition_name("spendings", name, scheme) == start
+    assert parse_range_partition_name("income", name, scheme) is None
+    assert (
+        parse_range_partition_name("spendings", "spendings_default", scheme)
+        is None
+    )
+
+
+def test_initial_partitions_ddl(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("app.core.config.settings.db.partitions_ahead", 1)
+    ddl = get_initial_partitions_ddl(
+        "spendings",
+        "month",
+        today=date(2026, 1, 15),
+        first_day=date(2025, 11, 30),
+    )
+    assert ddl == [
+        "CREATE TABLE spendings_default PARTITION OF spendings DEFAULT",
+        "CREATE TABLE spendings_2025_11 PARTITION OF spendings "
+        "FOR VALUES FROM ('2025-11-01') TO ('2025-12-01')",
+        "CREATE TABLE spendings_2025_12 PARTITION OF spendings "
+        "FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')",
+        "CREATE TABLE spendings_2026_01 PARTITION OF spendings "
+        "FOR VALUES FROM ('2026-01-01') TO ('2026-02-01')",
+        "CREATE TABLE spendings_2026_02 PARTITION OF spendings "
+        "FOR VALUES FROM ('2026-02-01') TO ('2026-03-01')",
+    ]
+
+
+def test_initial_hash_partitions_ddl(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("app.core.config.settings.db.hash_partitions", 2)
+    assert get_initial_partitions_ddl("income", "user_hash", date.today()) == [
+        "CREATE TABLE income_p0 PARTITION OF income "
+        "FOR VALUES WITH (MODULUS 2, REMAINDER 0)",
+        "CREATE TABLE income_p1 PARTITION OF income "
+        "FOR VALUES WITH (MODULUS 2, REMAINDER 1)",
+    ]
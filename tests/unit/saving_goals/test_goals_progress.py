@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+from app.repositories.saving_goals_repository import saving_goals_repo
+from app.schemas.saving_goals_schemas import GoalStatus
+from app.services import saving_goals_service
+
+DIALECT = PGDialect_psycopg()
+
+
+def test_goals_progress_query():
+    query = saving_goals_repo.make_goals_query(
+        1,
+        goal_ids=[3, 4],
+        status=GoalStatus.IN_PROGRESS,
+    ).add_columns(*saving_goals_repo.make_progress_columns(date(2026, 10, 19)))
+    compiled = query.compile(dialect=DIALECT)
+
+    assert [column.name for column in query.selected_columns][-4:] == [
+        "rest_amount",
+        "percentage_progress",
+        "days_left",
+        "expected_daily_payment",
+    ]
+    assert "saving_goals.id IN (__[POSTCOMPILE_id_1])" in str(compiled)
+    assert compiled.params["id_1"] == [3, 4]
+    assert compiled.params["target_date_1"] == date(2026, 10, 19)
+
+
+@pytest.mark.parametrize(
+    "rest_amount, days_left, expected",
+    [
+        (5, 2, 3),
+        (7, 2, 4),
+        (-5, 2, -3),
+        (10, 3, 3),
+        (5, 0, 5),
+    ],
+)
+def test_expected_daily_payment__rounds_half_away_from_zero(
+    rest_amount: int,
+    days_left: int,
+    expected: int,
+):
+    # the same as round(numeric) in make_progress_columns
+    assert (
+        saving_goals_service.get_expected_daily_payment(rest_amount, days_left)
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "current_amount, target_amount, expected",
+    [
+        (1, 32, 3.13),
+        (1, 3, 33.33),
+        (3, 0, 0),
+    ],
+)
+def test_percentage__rounds_half_away_from_zero(
+    current_amount: int,
+    target_amount: int,
+    expected: float,
+):
+    assert (
+        saving_goals_service.get_percentage(current_amount, target_amount)
+        == expected
+    )
@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+from app.repositories import spendings_repo
+from app.schemas.transactions_schemas import SBucketsParams
+
+DIALECT = PGDialect_psycopg()
+
+
+@pytest.mark.parametrize(
+    "granularity, bucket_days, first_bucket_start, buckets_count",
+    [
+        ("day", None, date(2025, 2, 12), 18),
+        ("week", None, date(2025, 2, 10), 3),
+        ("month", None, date(2025, 2, 1), 2),
+        ("quarter", None, date(2025, 1, 1), 1),
+        ("year", None, date(2025, 1, 1), 1),
+        ("custom", 10, date(2025, 2, 12), 2),
+    ],
+)
+def test_buckets_params(
+    granularity: str,
+    bucket_days: int | None,
+    first_bucket_start: date,
+    buckets_count: int,
+):
+    params = SBucketsParams(
+        granularity=granularity,
+        date_from=date(2025, 2, 12),
+        date_to=date(2025, 3, 1),
+        bucket_days=bucket_days,
+    )
+    assert params.first_bucket_start == first_bucket_start
+    assert params.estimate_buckets_count() == buckets_count
+
+
+@pytest.mark.parametrize("split_by_category", [True, False])
+def test_buckets_summary_query(split_by_category: bool):
+    params = SBucketsParams(
+        granularity="week",
+        date_from=date(2025, 2, 12),
+        date_to=date(2025, 3, 1),
+        split_by_category=split_by_category,
+    )
+    compiled = spendings_repo.make_buckets_summary_query(1, params).compile(
+        dialect=DIALECT
+    )
+    sql = str(compiled)
+    assert "AS series(bucket_start) LEFT OUTER JOIN totals" in sql
+    assert ("JOIN users_spending_categories" in sql) is split_by_category
+    # the dates are plain values, so the partitions are pruned when planning
+    assert compiled.params["date_1"].isoformat() == "2025-02-10T00:00:00"
+    assert compiled.params["date_2"].isoformat() == "2025-03-02T00:00:00"
+
+
+def test_custom_buckets_summary_query():
+    params = SBucketsParams(
+        granularity="custom",
+        bucket_days=10,
+        date_from=date(2025, 2, 12),
+        date_to=date(2025, 3, 1),
+    )
+    compiled = spendings_repo.make_buckets_summary_query(1, params).compile(
+        dialect=DIALECT
+    )
+    assert "date_bin(" in str(compiled)
+    assert "10 days" in compiled.params.values()
@@ -0,0 +1,82 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+from app.repositories import income_repo
+from app.schemas.transactions_schemas import SRollingParams
+from app.services.income_service import income_service
+
+DIALECT = PGDialect_psycopg()
+
+
+@pytest.mark.parametrize(
+    "date_from, windows, read_from",
+    [
+        (date(2025, 3, 20), [7, 30], date(2025, 2, 19)),
+        # the month-to-date totals start on the first day of the month
+        (date(2025, 3, 20), [7], date(2025, 3, 1)),
+    ],
+)
+def test_rolling_params_read_from(
+    date_from: date,
+    windows: list[int],
+    read_from: date,
+):
+    params = SRollingParams(
+        date_from=date_from,
+        date_to=date(2025, 3, 31),
+        windows=windows,
+    )
+    assert params.read_from == read_from
+
+
+@pytest.mark.parametrize("split_by_category", [True, False])
+def test_rolling_summary_query(split_by_category: bool):
+    params = SRollingParams(
+        date_from=date(2025, 3, 20),
+        date_to=date(2025, 3, 31),
+        split_by_category=split_by_category,
+    )
+    compiled = income_repo.make_rolling_summary_query(1, params).compile(
+        dialect=DIALECT
+    )
+    sql = str(compiled)
+    assert sql.count("FROM income") == 1
+    assert sql.count("RANGE BETWEEN") == 3
+    assert ("PARTITION BY categories.category_name" in sql) is split_by_category
+    assert compiled.params["date_1"] == datetime(2024, 12, 21)
+    assert compiled.params["date_2"] == datetime(2025, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_rolling_summary(monkeypatch: pytest.MonkeyPatch):
+    async def get_rolling_summary_from_db(**kwargs):
+        return [
+            (date(2025, 3, 1), "Job", 70, 70, Decimal("10.00"), Decimal("2.33")),
+            (date(2025, 3, 2), "Job", 0, 70, Decimal("10.00"), Decimal("2.33")),
+        ]
+
+    monkeypatch.setattr(
+        income_service.tx_repo,
+        "get_rolling_summary_from_db",
+        get_rolling_summary_from_db,
+    )
+    params = SRollingParams(
+        date_from=date(2025, 3, 1),
+        date_to=date(2025, 3, 2),
+        windows=[7, 30],
+        split_by_category=True,
+    )
+    summary = await income_service.get_rolling_summary(None, 1, params)
+
+    assert summary[0].averages == {7: 10.0, 30: 2.33}
+    assert income_service.prepare_rolling_summary_for_csv(summary)[1] == {
+        "day": date(2025, 3, 2),
+        "category_name": "Job",
+        "amount": 0,
+        "month_to_date": 70,
+        "avg_7_days": 10.0,
+        "avg_30_days": 2.33,
+    }
@@ -0,0 +1,66 @@
+from collections import namedtuple
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+from app.repositories import spendings_repo
+from app.schemas.transactions_schemas import SStatsParams
+from app.services import spendings_service
+
+DIALECT = PGDialect_psycopg()
+
+StatsRow = namedtuple(
+    "StatsRow",
+    "month category_name count min q1 median q3 p90 max",
+)
+
+
+@pytest.mark.parametrize("sample_percent", [None, 2.5])
+def test_stats_queries(sample_percent: float | None):
+    params = SStatsParams(
+        date_from=date(2025, 1, 1),
+        date_to=date(2025, 3, 31),
+        sample_percent=sample_percent,
+    )
+    stats_sql = str(
+        spendings_repo.make_stats_query(1, params).compile(dialect=DIALECT)
+    )
+    histograms_sql = str(
+        spendings_repo.make_histograms_query(1, params).compile(dialect=DIALECT)
+    )
+    assert stats_sql.count("WITHIN GROUP (ORDER BY") == 4
+    assert (
+        "width_bucket(amounts.amount, amounts.low, amounts.high" in histograms_sql
+    )
+    for sql in (stats_sql, histograms_sql):
+        assert ("TABLESAMPLE system" in sql) is (sample_percent is not None)
+
+
+@pytest.mark.asyncio
+async def test_get_stats(monkeypatch: pytest.MonkeyPatch):
+    async def get_stats_from_db(**kwargs):
+        return [StatsRow(date(2025, 3, 1), "Beer", 4, 90, 150, 200, 320, 410, 700)]
+
+    async def get_histograms_from_db(**kwargs):
+        return [("Beer", 90, 701, 1, 3), ("Beer", 90, 701, 4, 1)]
+
+    monkeypatch.setattr(
+        spendings_service.tx_repo, "get_stats_from_db", get_stats_from_db
+    )
+    monkeypatch.setattr(
+        spendings_service.tx_repo, "get_histograms_from_db", get_histograms_from_db
+    )
+    params = SStatsParams(
+        date_from=date(2025, 3, 1), date_to=date(2025, 3, 31), bins=4
+    )
+    stats = await spendings_service.get_stats(None, 1, params)
+
+    [histogram] = stats.histograms
+    assert histogram.counts == [3, 0, 0, 1]
+    assert histogram.bin_edges == [90, 242.75, 395.5, 548.25, 701]
+
+    chart = spendings_service.make_stats_chart(stats, params, "spendings")
+    assert chart.method_name == "create_box_plot_chart"
+    assert chart.params["labels"] == ["Beer\n2025-03"]
+    assert chart.params["boxes"] == [[90, 150, 200, 320, 410, 700]]
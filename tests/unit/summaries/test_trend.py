@@ -0,0 +1,71 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+from app.repositories import spendings_repo
+from app.schemas.transactions_schemas import STrendParams
+from app.services import spendings_service
+
+DIALECT = PGDialect_psycopg()
+
+
+def test_trend_query():
+    compiled = spendings_repo.make_trend_query(1, 2023, 2025).compile(
+        dialect=DIALECT
+    )
+    sql = str(compiled)
+    assert sql.count("FROM spendings JOIN") == 1
+    assert "GROUP BY GROUPING SETS(" in sql
+    assert "lag(totals.amount) OVER (PARTITION BY totals.level" in sql
+    # the year before the range is read for the deltas of its first year,
+    # and the plain date bounds let the partitions be pruned
+    assert compiled.params["date_1"] == datetime(2022, 1, 1)
+    assert compiled.params["date_2"] == datetime(2026, 1, 1)
+    assert compiled.params["year_2"] == 2023
+
+
+@pytest.mark.asyncio
+async def test_get_trend(monkeypatch: pytest.MonkeyPatch):
+    async def get_trend_from_db(**kwargs):
+        return [
+            (2024, None, None, 300, None, None),
+            (2024, 2, None, 300, None, None),
+            (2024, None, "Food", 300, None, None),
+            (2026, None, None, 500, None, None),
+            (2026, 1, None, 200, None, None),
+            (2026, 2, None, 300, 0, Decimal("0.0")),
+            (2026, None, "Food", 400, 100, Decimal("33.3")),
+            (2026, None, "Beer", 100, None, None),
+        ]
+
+    monkeypatch.setattr(
+        spendings_service.tx_repo, "get_trend_from_db", get_trend_from_db
+    )
+    trend = await spendings_service.get_trend(
+        session=None,
+        user_id=1,
+        params=STrendParams(year_from=2024, year_to=2026),
+    )
+
+    assert [(t.year, t.total_amount) for t in trend] == [
+        (2024, 300),
+        (2025, 0),
+        (2026, 500),
+    ]
+    assert trend[1].months == trend[1].categories == []
+    assert [m.month_number for m in trend[2].months] == [1, 2]
+    food = trend[2].categories[0]
+    assert (food.yoy_delta, food.yoy_percent) == (100, 33.3)
+
+    rows = spendings_service.prepare_trend_for_csv(trend)
+    assert len(rows) == 3 + 1 + 5
+    assert rows[0] == {
+        "year": 2024,
+        "month_number": None,
+        "category_name": None,
+        "total_amount": 300,
+        "yoy_delta": None,
+        "yoy_percent": None,
+    }